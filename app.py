@@ -1,12 +1,9 @@
+import time
+_script_started = time.perf_counter()
 import streamlit as st
-from datetime import datetime
-import json
-from src.components.sidebar import render_sidebar
-from src.components.main_content import render_main_content
 from src.components.role_selector import render_role_selector
-from src.components.deployer_view import render_deployer_view
-from src.utils.parameters import export_parameters, import_parameters, get_current_params
 from src.config.constants import DEFAULT_VALUES
+from src.utils.table_suffix import allocate_table_suffix
 
 # Set page config
 st.set_page_config(
@@ -29,7 +26,7 @@ if 'sql_generated' not in st.session_state:
     st.session_state.sql_generated = False
 
 if 'table_suffix' not in st.session_state:
-    st.session_state.table_suffix = datetime.now().strftime("%Y%m%d_%H%M%S")
+    st.session_state.table_suffix = allocate_table_suffix()
 
 if 'all_sql' not in st.session_state:
     st.session_state.all_sql = ""
@@ -41,16 +38,26 @@ if 'timestamp' not in st.session_state:
 if 'user_role' not in st.session_state:
     st.session_state.user_role = None
 
-# Initialize default values
-for key, value in DEFAULT_VALUES.items():
-    if key not in st.session_state:
-        st.session_state[key] = value
+# Initialize default values once per session
+if 'defaults_initialized' not in st.session_state:
+    for key, value in DEFAULT_VALUES.items():
+        if key not in st.session_state:
+            st.session_state[key] = value
+    st.session_state.defaults_initialized = True
 
 # If we don't have a user role selected, show the role selection screen
 if st.session_state.user_role is None:
     render_role_selector()
+    # Time from the start of the script run to the rendered landing screen, the first run includes the imports
+    if 'landing_render_seconds' not in st.session_state:
+        st.session_state.landing_render_seconds = time.perf_counter() - _script_started
+    st.caption(f"Landing screen rendered in {st.session_state.landing_render_seconds * 1000:.0f} ms")
 # If the user has selected the developer role, show the original UI
+# The views and their generators are only imported once a role is chosen, so the role selection shows up quickly
 elif st.session_state.user_role == "developer":
+    from src.components.sidebar import render_sidebar
+    from src.components.main_content import render_main_content
+    
     # Create a container for the sidebar
     with st.sidebar:
         st.title("Data Warehouse Deployment App")
@@ -62,4 +69,5 @@ elif st.session_state.user_role == "developer":
         render_main_content()
 # If the user has selected the deployer role, show the simplified deployer UI
 elif st.session_state.user_role == "deployer":
+    from src.components.deployer_view import render_deployer_view
     render_deployer_view() 
\ No newline at end of file
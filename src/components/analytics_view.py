@@ -0,0 +1,58 @@
+import streamlit as st
+from src.utils.log_analytics import read_log_export, compute_table_metrics, get_degrading_tables
+
+@st.fragment
+def render_analytics_view():
+    """Render the load analytics view for exported job table logs"""
+    st.subheader("Load Analytics")
+    st.markdown("""
+    Upload a CSV or Parquet export of `DWH.JOB_TABLES_LOG` to see throughput, duration percentiles and duration trends per table.
+
+    **Columns:** `table_name` (or `tgt_table_name`), `start_time`, `end_time`, optionally `rows` (or `rows_copied`) and `status`.
+    """)
+
+    log_file = st.file_uploader("Upload Log Export", type=['csv', 'parquet'], key="load_analytics_log")
+    if log_file is None:
+        return
+
+    try:
+        log_df = read_log_export(log_file.name, log_file.getvalue())
+    except Exception as e:
+        st.error(str(e))
+        return
+
+    if log_df.empty:
+        st.warning("The log export does not contain any successful runs.")
+        return
+
+    metrics = compute_table_metrics(log_df)
+
+    col1, col2 = st.columns(2)
+    with col1:
+        threshold_pct = st.number_input(
+            "Degradation Threshold (% per 30 days)", 0, 1000, 10,
+            help="Tables whose duration grows faster than this are flagged"
+        )
+    with col2:
+        min_runs = st.number_input(
+            "Minimum Runs", 2, 1000, 5,
+            help="Tables with fewer runs are not flagged"
+        )
+
+    degrading_tables = get_degrading_tables(metrics, threshold_pct, min_runs)
+    if degrading_tables.empty:
+        st.success("No tables are degrading faster than the threshold.")
+    else:
+        st.warning(f"{len(degrading_tables)} table(s) are getting slower faster than {threshold_pct}% per 30 days.")
+        st.dataframe(degrading_tables, use_container_width=True, hide_index=True)
+
+    st.markdown("#### All Tables")
+    st.dataframe(metrics, use_container_width=True, hide_index=True)
+
+    # Duration history for a single table
+    selected_table = st.selectbox("Duration History", metrics["table_name"].tolist())
+    if selected_table:
+        history = log_df[log_df["table_name"] == selected_table].set_index("start_time").sort_index()
+        st.line_chart(history[["duration_seconds"]])
+        if history["rows_per_second"].notna().any():
+            st.line_chart(history[["rows_per_second"]])
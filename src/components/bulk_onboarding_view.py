@@ -0,0 +1,202 @@
+import io
+import zipfile
+import streamlit as st
+from src.utils.bulk_onboarding import read_table_definitions, derive_table_parameters, get_parameter_sets, get_invalid_definitions
+from src.utils.control_table_import import (
+    read_control_table_export,
+    reconstruct_table_parameters,
+    REQUIRED_ST_COLUMNS,
+    REQUIRED_HS_COLUMNS,
+    REQUIRED_JOB_COLUMNS
+)
+from src.utils.control_table_diff import diff_control_tables, generate_control_table_diff_sql
+from src.utils.manifest import write_manifest, validate_manifest, read_manifest, export_manifest_pipelines
+from src.components.code_viewer import render_code
+from src.utils.parameters import export_parameters
+
+@st.fragment
+def render_bulk_onboarding_view():
+    """Render the bulk onboarding view for spreadsheets of table definitions"""
+    st.subheader("Bulk Onboarding")
+    st.markdown("""
+    Upload a CSV or Excel sheet with one row per table to derive all table configurations at once.
+
+    **Columns:** `src_schema_name` (or `schema`), `src_table_name` (or `table`), `business_key`, optionally `scd_type`,
+    `source_system_initial`, `create_main_table`, `create_helper_table` and any other parameter. Empty cells use the defaults,
+    and tables without `scd2_columns` track all columns.
+    """)
+
+    definitions_file = st.file_uploader("Upload Table Definitions", type=['csv', 'xlsx'], key="bulk_onboarding_definitions")
+    if definitions_file is None:
+        return
+
+    try:
+        definitions_df = read_table_definitions(definitions_file.name, definitions_file.getvalue())
+    except Exception as e:
+        st.error(str(e))
+        return
+
+    params_df = derive_table_parameters(definitions_df)
+    invalid_df = get_invalid_definitions(params_df)
+    if not invalid_df.empty:
+        st.warning(f"{invalid_df.index.nunique()} table(s) cannot be generated and are left out of the manifest.")
+        st.dataframe(invalid_df, use_container_width=True, hide_index=True)
+        params_df = params_df.drop(invalid_df.index)
+
+    st.success(f"Derived the configurations of {len(params_df)} table(s).")
+    st.dataframe(
+        params_df[["src_schema_name", "src_table_name", "business_key", "scd_type", "source_system_initial",
+                   "tgt_table_name_st", "tgt_table_name_hs", "src_table_name_ct", "main_table_name", "helper_table_name"]],
+        use_container_width=True, hide_index=True
+    )
+
+    # The manifest can be validated, filtered and exported like any other manifest
+    manifest = io.StringIO()
+    write_manifest(get_parameter_sets(params_df), manifest)
+    st.download_button(
+        label="Download Manifest",
+        data=manifest.getvalue(),
+        file_name="table_configurations.jsonl",
+        mime="application/x-ndjson",
+        key="bulk_onboarding_manifest"
+    )
+
+    # The pipelines of all tables, written like the "Export to ADF Repository" section of the ADF tab
+    repo_folder = st.text_input(
+        "ADF Repository Folder",
+        st.session_state.get("adf_repo_folder", ""),
+        key="bulk_onboarding_repo_folder",
+        help="Root folder of the local clone of the ADF git repository. Objects are written to its pipeline and trigger folders"
+    )
+    if st.button("Write Pipelines to Repository", disabled=not repo_folder, key="bulk_onboarding_write_repository"):
+        try:
+            counts = export_manifest_pipelines(get_parameter_sets(params_df), repo_folder)
+            st.success(f"Created {counts['CREATED']}, updated {counts['UPDATED']} and left {counts['UNCHANGED']} objects unchanged.")
+        except Exception as e:
+            st.error(str(e))
+
+@st.fragment
+def render_control_table_import_section():
+    """Render the import of table configurations from exports of the live control tables"""
+    st.subheader("Import Existing Control Tables")
+    st.markdown("""
+    Upload CSV exports of `DWH.CONTROL_TABLE_STAGE` and `DWH.CONTROL_TABLE_HS` (`SELECT *`) to rebuild the configurations of
+    tables that were not created with this app. An export of `DWH.JOB_CONTROL` is optional and checks the job names.
+    """)
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st_file = st.file_uploader("CONTROL_TABLE_STAGE Export", type=['csv'], key="control_import_st")
+    with col2:
+        hs_file = st.file_uploader("CONTROL_TABLE_HS Export", type=['csv'], key="control_import_hs")
+    with col3:
+        job_file = st.file_uploader("JOB_CONTROL Export (optional)", type=['csv'], key="control_import_job")
+    if st_file is None or hs_file is None:
+        return
+
+    try:
+        st_df = read_control_table_export(st_file.name, st_file.getvalue(), REQUIRED_ST_COLUMNS)
+        hs_df = read_control_table_export(hs_file.name, hs_file.getvalue(), REQUIRED_HS_COLUMNS)
+        job_df = read_control_table_export(job_file.name, job_file.getvalue(), REQUIRED_JOB_COLUMNS) if job_file else None
+        params_df, issues_df = reconstruct_table_parameters(st_df, hs_df, job_df)
+    except Exception as e:
+        st.error(str(e))
+        return
+
+    st.success(f"Rebuilt the configurations of {len(params_df)} table(s).")
+    if not issues_df.empty:
+        st.warning(f"{len(issues_df)} issue(s) found; the affected configurations are incomplete.")
+        st.dataframe(issues_df, use_container_width=True, hide_index=True)
+    st.dataframe(
+        params_df[["src_schema_name", "src_table_name", "source_system_initial", "source_system_daily",
+                   "tgt_table_name_st", "tgt_table_name_hs", "scd_type", "load_priority"]],
+        use_container_width=True, hide_index=True
+    )
+
+    param_sets = get_parameter_sets(params_df)
+    manifest = io.StringIO()
+    write_manifest(param_sets, manifest)
+
+    # One exported parameter file per table, as written by "Export Current Parameters"
+    archive = io.BytesIO()
+    with zipfile.ZipFile(archive, "w", zipfile.ZIP_DEFLATED) as zip_file:
+        for params in param_sets:
+            zip_file.writestr(f"dwh_params_{params['src_table_name']}.json", export_parameters(params))
+
+    col1, col2 = st.columns(2)
+    with col1:
+        st.download_button(
+            label="Download Manifest",
+            data=manifest.getvalue(),
+            file_name="control_table_configurations.jsonl",
+            mime="application/x-ndjson",
+            key="control_import_manifest"
+        )
+    with col2:
+        st.download_button(
+            label="Download Parameter Files",
+            data=archive.getvalue(),
+            file_name="control_table_configurations.zip",
+            mime="application/zip",
+            key="control_import_parameter_files"
+        )
+
+@st.fragment
+def render_control_table_diff_section():
+    """Render the comparison of a manifest with exports of the live control tables"""
+    st.subheader("Compare with Control Tables")
+    st.markdown("""
+    Upload a manifest and CSV exports of `DWH.CONTROL_TABLE_STAGE` and `DWH.CONTROL_TABLE_HS` to see which tables are new,
+    changed or unchanged, and to generate SQL that inserts and updates only the differences.
+    """)
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        manifest_file = st.file_uploader("Manifest", type=['jsonl'], key="control_diff_manifest")
+    with col2:
+        st_file = st.file_uploader("CONTROL_TABLE_STAGE Export", type=['csv'], key="control_diff_st")
+    with col3:
+        hs_file = st.file_uploader("CONTROL_TABLE_HS Export", type=['csv'], key="control_diff_hs")
+    if manifest_file is None or st_file is None or hs_file is None:
+        return
+
+    manifest_lines = manifest_file.getvalue().splitlines()
+    _, errors = validate_manifest(manifest_lines)
+    if errors:
+        st.error(f"The manifest has invalid lines, first at line {errors[0]['line']}: {errors[0]['error']}")
+        return
+
+    try:
+        st_df = read_control_table_export(st_file.name, st_file.getvalue(), REQUIRED_ST_COLUMNS)
+        hs_df = read_control_table_export(hs_file.name, hs_file.getvalue(), REQUIRED_HS_COLUMNS)
+    except Exception as e:
+        st.error(str(e))
+        return
+
+    summary_df, changes_df = diff_control_tables(list(read_manifest(manifest_lines)), st_df, hs_df)
+    status_counts = summary_df["status"].value_counts()
+    col1, col2, col3 = st.columns(3)
+    col1.metric("New", int(status_counts.get("NEW", 0)))
+    col2.metric("Changed", int(status_counts.get("CHANGED", 0)))
+    col3.metric("Unchanged", int(status_counts.get("UNCHANGED", 0)))
+    if (summary_df["status"] == "CONFLICT").any():
+        st.warning("Some tables write the same control table rows as another table in the manifest and are left out.")
+    st.dataframe(summary_df[summary_df["status"] != "UNCHANGED"], use_container_width=True, hide_index=True)
+
+    changed_values = changes_df[changes_df["action"] == "UPDATE"]
+    if not changed_values.empty:
+        st.markdown("#### Changed Values")
+        st.dataframe(
+            changed_values[["table_name", "control_table", "column", "old_value", "new_value"]],
+            use_container_width=True, hide_index=True
+        )
+
+    diff_sql = generate_control_table_diff_sql(changes_df)
+    render_code(diff_sql, "control_diff_sql")
+    st.download_button(
+        label="Download SQL",
+        data=diff_sql,
+        file_name="control_table_changes.sql",
+        mime="text/plain",
+        key="control_diff_sql_download"
+    )
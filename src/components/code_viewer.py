@@ -0,0 +1,30 @@
+import streamlit as st
+from src.config.constants import CODE_VIEWER_PAGE_LINES, CODE_VIEWER_MAX_CHARS, CODE_VIEWER_HIGHLIGHT_MAX_CHARS
+
+def render_code(code, key, language="sql"):
+    """Render a generated script, showing large scripts one page at a time
+
+    Only the selected page is sent to the browser, and scripts above the highlight threshold are shown
+    as plain text. The full script is only sent by the download buttons. key names the section, so the
+    same script can be shown in two sections of a page.
+    """
+    if len(code) <= CODE_VIEWER_MAX_CHARS:
+        st.code(code, language=language)
+        return
+
+    lines = code.splitlines()
+    page_count = (len(lines) + CODE_VIEWER_PAGE_LINES - 1) // CODE_VIEWER_PAGE_LINES
+
+    col1, col2 = st.columns([1, 3])
+    with col1:
+        page = st.number_input("Page", 1, page_count, 1, key=f"code_viewer_{key}")
+    first_line = (page - 1) * CODE_VIEWER_PAGE_LINES
+    last_line = min(first_line + CODE_VIEWER_PAGE_LINES, len(lines))
+    with col2:
+        st.caption(
+            f"Lines {first_line + 1}-{last_line} of {len(lines)} ({len(code) / 1024:.0f} KB). "
+            "Download the script to get all of it."
+        )
+
+    page_language = language if len(code) <= CODE_VIEWER_HIGHLIGHT_MAX_CHARS else None
+    st.code("\n".join(lines[first_line:last_line]), language=page_language)
@@ -1,17 +1,31 @@
 import streamlit as st
-from datetime import datetime
+from datetime import timedelta
 import json
-from src.utils.parameters import import_parameters
-from src.utils.sql_generator import (
+from src.utils.parameters import get_current_params, load_deployer_config, normalize_deployer_config
+from src.utils.generator_cache import (
     generate_control_table_backup_sql,
+    generate_st_control_table_backup_sql,
+    generate_hs_control_table_backup_sql,
+    generate_job_control_table_backup_sql,
     generate_st_control_table_sql,
     generate_hs_control_table_sql,
     generate_job_control_sql,
     generate_hs_table_sql,
     generate_helper_table_sql,
-    generate_main_table_sql
+    generate_main_table_sql,
+    generate_trunc_load_switch_sql,
+    generate_hard_delete_batch_sql,
+    generate_ct_index_sql,
+    generate_ct_retention_sql,
+    get_ct_retention_procedure_name,
+    get_change_table_name
 )
+from src.config.constants import CDC_SOURCE_SYSTEMS
+from src.utils.deployment_dag import build_deployment_steps
+from src.utils.table_suffix import allocate_table_suffix
+from src.components.code_viewer import render_code
 
+@st.fragment
 def render_deployer_sidebar():
     """Render the simplified sidebar for deployers"""
     st.title("Deployment App")
@@ -32,36 +46,145 @@ def render_deployer_sidebar():
     
     uploaded_file = st.file_uploader("Upload Configuration File", type=['json'])
     if uploaded_file is not None:
-        params_str = uploaded_file.getvalue().decode()
         try:
-            imported_params = import_parameters(params_str)
-            if imported_params:
+            # Parsed and normalised once per file content, later reruns reuse the cached configuration
+            config_hash, config = load_deployer_config(uploaded_file.getvalue())
+            if config:
                 st.success("Configuration loaded successfully! Click 'Apply Configuration' to proceed.")
                 if st.button("Apply Configuration", use_container_width=True):
-                    # Store all imported parameters directly in session state
-                    for key, value in imported_params.items():
-                        if key not in ["export_timestamp", "app_version"]:  # Skip metadata
-                            st.session_state[key] = value
-                    
-                    # Calculate the CT table name if needed
-                    if "src_table_name" in st.session_state and "source_system_daily" in st.session_state:
-                        if st.session_state.src_table_name and st.session_state.source_system_daily == "Replicate_CDC":
-                            st.session_state.src_table_name_ct = f"{st.session_state.src_table_name}__ct"
-                        else:
-                            st.session_state.src_table_name_ct = st.session_state.src_table_name
+                    # Store the normalised configuration in session state
+                    st.session_state.update(config)
+                    st.session_state.deployer_config_hash = config_hash
                     
                     # Set the SQL generation flag to true to display deployment steps
                     st.session_state.sql_generated = True
                     
                     # Set a table suffix if not present
                     if 'table_suffix' not in st.session_state:
-                        st.session_state.table_suffix = datetime.now().strftime("%Y%m%d_%H%M%S")
+                        st.session_state.table_suffix = allocate_table_suffix()
                     
                     st.success("Configuration applied successfully!")
                     st.rerun()
         except Exception as e:
             st.error(f"Error importing configuration: {str(e)}")
 
+@st.fragment
+def render_initial_load_estimate():
+    """Render the initial load duration estimate and recommended time window"""
+    with st.expander("⏱️ Estimate Initial Load Duration"):
+        st.markdown("""
+        Upload an export of `DWH.JOB_TABLES_LOG` and enter the size of the source table to estimate how long the
+        initial load will take. Runs with the same source system and partitions are used when the export has
+        `source_system` and `partitions` columns.
+        """)
+        
+        log_file = st.file_uploader("Upload Log Export", type=['csv', 'parquet'], key="estimate_log_export")
+        col1, col2 = st.columns(2)
+        with col1:
+            row_count = st.number_input("Source Row Count", 0, None, 0, step=100000)
+        with col2:
+            size_mb = st.number_input("Source Size (MB)", 0.0, None, 0.0, step=100.0)
+        
+        if log_file is None or not (row_count or size_mb):
+            return
+        
+        from src.utils.log_analytics import read_log_export
+        from src.utils.load_estimator import estimate_initial_load, recommend_load_window
+        from src.config.constants import PEAK_START_HOUR, PEAK_END_HOUR
+        
+        try:
+            log_df = read_log_export(log_file.name, log_file.getvalue())
+        except Exception as e:
+            st.error(str(e))
+            return
+        
+        estimate = estimate_initial_load(
+            log_df,
+            row_count,
+            size_mb,
+            st.session_state.source_system_initial,
+            st.session_state.get("partitions", 1)
+        )
+        if estimate is None:
+            st.warning("The log export has no throughput for the given input. Provide `rows` for a row count or `size_mb` for a size.")
+            return
+        
+        expected = timedelta(seconds=int(estimate["expected_seconds"]))
+        pessimistic = timedelta(seconds=int(estimate["pessimistic_seconds"]))
+        st.info(f"**Expected duration:** {expected} (up to {pessimistic} for slow runs), based on {estimate['sample_runs']} runs at median {estimate['basis']}.")
+        
+        window = recommend_load_window(estimate["pessimistic_seconds"], PEAK_START_HOUR, PEAK_END_HOUR)
+        if window:
+            st.success(f"**Recommended window:** start {window[0]:%a %Y-%m-%d %H:%M}, finished by {window[1]:%a %Y-%m-%d %H:%M} (outside weekday {PEAK_START_HOUR:02d}:00-{PEAK_END_HOUR:02d}:00).")
+        else:
+            st.warning("The load is too long to fit outside peak hours within the next two weeks. Plan it with the DWH team.")
+
+@st.fragment
+def render_direct_execution(steps):
+    """Render the deployment step graph and the optional direct execution of its SQL steps"""
+    from src.utils.deployment_dag import get_execution_waves, get_critical_path, run_dag
+    
+    with st.expander("▶️ Run SQL Steps Directly (optional)"):
+        st.markdown("""
+        Instead of copying each script into SSMS, the SQL steps can be run directly against the database.
+        Each step runs in its own transaction (the hard delete reconciliation commits per batch) as soon as the steps it depends on are done, and independent steps
+        run in parallel on pooled connections. The run stops at the ADF pipeline steps: start those in Azure Data Factory,
+        mark them as completed below and run again. The verification queries and daily load setup (step 9) and
+        the cleanup (step 10) are not part of the run. Requires the `pyodbc` package.
+        """)
+        
+        st.markdown("#### Parallel Execution Plan")
+        for index, wave in enumerate(get_execution_waves(steps), start=1):
+            st.markdown(f"**Wave {index}:** " + " | ".join(f"`{name}`" for name in wave))
+        
+        critical_path, critical_seconds = get_critical_path(steps)
+        st.markdown(f"**Critical path** (about {critical_seconds / 60:.0f} minutes): " + " → ".join(f"`{name}`" for name in critical_path))
+        
+        connection_string = st.text_input(
+            "ODBC Connection String",
+            type="password",
+            key="direct_execution_connection_string",
+            help="For example: Driver={ODBC Driver 18 for SQL Server};Server=...;Database=...;Authentication=ActiveDirectoryInteractive"
+        )
+        
+        step_names = [step["name"] for step in steps]
+        completed = st.multiselect(
+            "Completed Steps",
+            step_names,
+            default=[name for name in st.session_state.get("completed_deployment_steps", []) if name in step_names],
+            help="Steps that are already done, including the ADF pipeline runs. These are not run again."
+        )
+        
+        if st.button("Run Ready Steps", key="direct_execution_run", disabled=not connection_string):
+            from src.utils.script_executor import ConnectionPool, connect_odbc, execute_step
+            
+            def run_step(step):
+                if step["script"] is None:
+                    return {"step": step["name"], "status": "MANUAL"}
+                return execute_step(pool, step["name"], step["script"], step.get("autocommit", False))
+            
+            try:
+                pool = ConnectionPool(connect_odbc(connection_string), size=4)
+                try:
+                    with st.spinner("Running deployment steps..."):
+                        results = run_dag(steps, run_step, completed, max_workers=4)
+                finally:
+                    pool.close()
+            except Exception as e:
+                st.error(f"Error running deployment steps: {str(e)}")
+                return
+            
+            st.session_state.completed_deployment_steps = [
+                result["step"] for result in results if result["status"] in ("SUCCESS", "COMPLETED")
+            ]
+            st.dataframe(results, use_container_width=True)
+            if any(result["status"] == "FAILED" for result in results):
+                st.error("Some steps failed and were rolled back. Steps depending on them were not run.")
+            elif any(result["status"] == "MANUAL" for result in results):
+                st.info("The run stopped at an ADF pipeline step. Run the pipeline, mark it as completed and run again.")
+            else:
+                st.success("All steps are completed. Verify the deployment and clean up with steps 9 and 10.")
+
 def render_deployment_instructions():
     """Render the deployment instructions for deployers"""
     st.header("Deployment Instructions")
@@ -70,53 +193,12 @@ def render_deployment_instructions():
         st.info("Please upload and apply a configuration file to view deployment instructions.")
         return
     
-    # Ensure src_table_name_ct is initialized (fallback protection)
-    if "src_table_name_ct" not in st.session_state and "src_table_name" in st.session_state:
-        if "source_system_daily" in st.session_state and st.session_state.source_system_daily == "Replicate_CDC":
-            st.session_state.src_table_name_ct = f"{st.session_state.src_table_name}__ct"
-        else:
-            st.session_state.src_table_name_ct = st.session_state.src_table_name
-    
-    # Ensure other required state variables have defaults
-    required_state_vars = [
-        "source_system_initial", "source_system_daily", 
-        "src_schema_name", "src_table_name", "src_table_name_ct",
-        "tgt_schema_name_st", "tgt_table_name_st", 
-        "tgt_schema_name_hs", "tgt_table_name_hs",
-        "business_key", "primary_key", "incremental_filter_st", 
-        "incremental_filter_hs", "incremental_filter_timezone",
-        "scd_type", "scd2_columns", "delete_type",
-        "src_delete_column", "src_delete_value"
-    ]
+    # Configurations generated in the developer view have not been normalised for deployment yet
+    if st.session_state.get("deployer_config_hash") is None:
+        st.session_state.update(normalize_deployer_config(get_current_params()))
+        st.session_state.deployer_config_hash = "developer"
     
-    # Check if any required variables are missing and set defaults from src.config.constants
     from src.config.constants import DEFAULT_VALUES
-    for var in required_state_vars:
-        if var not in st.session_state:
-            if var in DEFAULT_VALUES:
-                st.session_state[var] = DEFAULT_VALUES[var]
-            elif var == "src_table_name_ct" and "src_table_name" in st.session_state:
-                st.session_state[var] = st.session_state.src_table_name
-            elif var in ["prescript", "postscript", "scd2_columns"]:
-                st.session_state[var] = ""
-            elif var == "delete_type":
-                st.session_state[var] = None
-            elif var == "src_delete_column":
-                st.session_state[var] = "DELETED_FLAG"
-            elif var == "src_delete_value":
-                st.session_state[var] = "Y"
-    
-    # Special handling for Profisee sources: Override the tgt_table_name_st with the exact case format
-    if "source_system_initial" in st.session_state and "src_table_name" in st.session_state:
-        if st.session_state.source_system_initial and "Profisee" in st.session_state.source_system_initial:
-            # Ensure we're using Profisee_dev throughout
-            st.session_state.source_system_initial = "Profisee_dev"
-            if st.session_state.source_system_daily and "Profisee" in st.session_state.source_system_daily:
-                st.session_state.source_system_daily = "Profisee_dev"
-            
-            # Always override to ensure consistency
-            st.session_state.tgt_table_name_st = f"ST_PRO_{st.session_state.src_table_name}"
-            st.session_state.tgt_table_name_hs = f"HS_PRO_{st.session_state.src_table_name}"
     
     # Get the table suffix
     table_suffix = st.session_state.table_suffix
@@ -147,17 +229,6 @@ def render_deployment_instructions():
         st.subheader("Step-by-Step Deployment")
         
         try:
-            # Final check to ensure Profisee table names are consistent
-            if st.session_state.source_system_initial and "Profisee" in st.session_state.source_system_initial:
-                # Ensure we're using Profisee_dev throughout
-                st.session_state.source_system_initial = "Profisee_dev"
-                if st.session_state.source_system_daily and "Profisee" in st.session_state.source_system_daily:
-                    st.session_state.source_system_daily = "Profisee_dev"
-                
-                # Always override to ensure consistency
-                st.session_state.tgt_table_name_st = f"ST_PRO_{st.session_state.src_table_name}"
-                st.session_state.tgt_table_name_hs = f"HS_PRO_{st.session_state.src_table_name}"
-            
             # Generate all SQL scripts
             backup_sql = generate_control_table_backup_sql(
                 table_suffix,
@@ -178,7 +249,8 @@ def render_deployment_instructions():
                 st.session_state.incremental_filter_timezone,
                 st.session_state.get("delete_type", None),
                 st.session_state.get("src_delete_column", "DELETED_FLAG"),
-                st.session_state.get("src_delete_value", "Y")
+                st.session_state.get("src_delete_value", "Y"),
+                st.session_state.get("load_priority", 0)
             )
             hs_control_sql = generate_hs_control_table_sql(
                 table_suffix,
@@ -200,7 +272,9 @@ def render_deployment_instructions():
                 st.session_state.get("partitions", 1),
                 st.session_state.get("use_source_column_for_valid_dates", False),
                 st.session_state.get("source_column_for_valid_from_date", None),
-                st.session_state.get("source_column_for_sorting", None)
+                st.session_state.get("source_column_for_sorting", None),
+                st.session_state.get("use_partition_switch", False),
+                st.session_state.get("load_priority", 0)
             )
             job_control_sql = generate_job_control_sql(
                 table_suffix,
@@ -216,8 +290,18 @@ def render_deployment_instructions():
                 st.session_state.src_table_name
             )
             
+            # Shadow table and switch procedure for Trunc Load with partition switch
+            if st.session_state.scd_type == "Trunc Load" and st.session_state.get("use_partition_switch", False):
+                hs_table_sql += "\n" + generate_trunc_load_switch_sql(
+                    st.session_state.tgt_schema_name_hs,
+                    st.session_state.tgt_table_name_hs,
+                    st.session_state.primary_key,
+                    st.session_state.source_system_initial,
+                    st.session_state.src_table_name
+                )
+            
             # Add quick HS table creation script
-            from src.utils.sql_generator import generate_hs_table_quick_creation_sql
+            from src.utils.generator_cache import generate_hs_table_quick_creation_sql
             hs_quick_creation_sql = generate_hs_table_quick_creation_sql(
                 st.session_state.tgt_schema_name_hs,
                 st.session_state.tgt_table_name_hs,
@@ -246,7 +330,7 @@ def render_deployment_instructions():
             )
             
             # Generate ADF pipeline JSON
-            from src.utils.adf_generator import generate_adf_pipeline_json
+            from src.utils.generator_cache import generate_adf_pipeline_json
             adf_json_invalid_hs = generate_adf_pipeline_json(
                 st.session_state.src_table_name, 
                 table_suffix, 
@@ -256,7 +340,6 @@ def render_deployment_instructions():
                 st.session_state.source_system_initial,
                 st.session_state.source_system_daily
             )
-            adf_json_str_invalid_hs = json.dumps(adf_json_invalid_hs, indent=4)
             
             # Generate the ADF pipeline JSON for all pipeline types
             adf_json_initial = generate_adf_pipeline_json(
@@ -275,7 +358,9 @@ def render_deployment_instructions():
                 False, 
                 False,
                 st.session_state.source_system_initial,
-                st.session_state.source_system_daily
+                st.session_state.source_system_daily,
+                st.session_state.get("daily_pipeline_mode") == "Shared",
+                st.session_state.get("delete_type")
             )
             adf_json_placeholder = generate_adf_pipeline_json(
                 st.session_state.src_table_name, 
@@ -287,11 +372,6 @@ def render_deployment_instructions():
                 st.session_state.source_system_daily
             )
             
-            # Convert the Python dictionaries to formatted JSON strings
-            adf_json_str_initial = json.dumps(adf_json_initial, indent=4)
-            adf_json_str_daily = json.dumps(adf_json_daily, indent=4)
-            adf_json_str_placeholder = json.dumps(adf_json_placeholder, indent=4)
-            
             # ------------------- MERGED STEP-BY-STEP INSTRUCTIONS AND SQL -------------------
             
             # STEP 1-4: Initial Control Table Setup
@@ -316,7 +396,10 @@ def render_deployment_instructions():
 -- STEP 4: UPDATE JOB CONTROL TABLE
 {job_control_sql}
 """
-            st.code(initial_setup_sql, language="sql")
+            render_code(initial_setup_sql, "deployer_initial_setup_sql")
+            
+            # Optional duration estimate before the initial load is triggered
+            render_initial_load_estimate()
             
             # STEP 5: Run the Invalid HS Pipeline
             st.markdown("### STEP 5: Run Invalid HS Pipeline")
@@ -338,7 +421,7 @@ def render_deployment_instructions():
             Now that the Stage table has been populated, run the following SQL to create the HS table with all required technical columns:
             """)
             
-            st.code(hs_table_sql, language="sql")
+            render_code(hs_table_sql, "deployer_hs_table_sql")
             
             # Add new Step - Update Job Control again
             st.markdown("### STEP 6.5: Re-update Job Control Table")
@@ -346,7 +429,22 @@ def render_deployment_instructions():
             After creating the HS table, we need to re-run the job control SQL to ensure all jobs are properly set up:
             """)
             
-            st.code(job_control_sql, language="sql")
+            render_code(job_control_sql, "deployer_job_control_sql")
+            
+            # Supporting indexes on the change table for SCD2 from CT
+            ct_index_sql = None
+            if st.session_state.scd_type == "SCD2 from CT":
+                ct_index_sql = generate_ct_index_sql(
+                    st.session_state.src_schema_name,
+                    st.session_state.src_table_name_ct,
+                    st.session_state.business_key,
+                    st.session_state.get("source_column_for_sorting") or DEFAULT_VALUES["source_column_for_sorting"]
+                )
+                st.markdown("### STEP 6.6: Create Change Table Indexes")
+                st.markdown("""
+                This table is loaded with SCD2 from CT. Run the following SQL to create the supporting indexes on the change table:
+                """)
+                render_code(ct_index_sql, "deployer_ct_index_sql")
             
             # STEP 7: Complete the Initial Load
             st.markdown("### STEP 7: Complete the Initial Load")
@@ -369,7 +467,7 @@ UPDATE sandbox.temp_control_table_job_{table_suffix}
 SET job_name = 'ST_Placeholder'
 WHERE job_name = '{st_initial_job}';
 """
-            st.code(st_placeholder_sql, language="sql")
+            render_code(st_placeholder_sql, "deployer_st_placeholder_sql")
             
             st.markdown("""
             **Option B**: Run the original Initial Load pipeline again
@@ -413,6 +511,64 @@ WHERE job_name = '{st_initial_job}';
             4. This pipeline will handle all future daily loads for this table
             """)
             
+            if st.session_state.get("daily_pipeline_mode") == "Shared":
+                st.info(f"""
+                `{adf_json_daily['name']}` is shared by all tables loaded by the same jobs. If it already has a
+                trigger, no further setup is needed: the next scheduled run picks up this table from the control tables.
+                """)
+                if st.session_state.get("delete_type"):
+                    st.warning(f"""
+                    This table has delete type {st.session_state.delete_type}. Check that `Stage_Deletes` and `Update_Delete_flags`
+                    are active in the deployed `{adf_json_daily['name']}`, otherwise the deletes of this table are not processed.
+                    """)
+            
+            # Batched hard delete reconciliation for HARD delete tables
+            hard_delete_sql = None
+            if st.session_state.get("delete_type") == "HARD":
+                hard_delete_sql = generate_hard_delete_batch_sql(
+                    st.session_state.src_schema_name,
+                    st.session_state.src_table_name,
+                    st.session_state.tgt_schema_name_hs,
+                    st.session_state.tgt_table_name_hs,
+                    st.session_state.business_key,
+                    st.session_state.get("hard_delete_batch_size", DEFAULT_VALUES["hard_delete_batch_size"]),
+                    st.session_state.get("hard_delete_action", DEFAULT_VALUES["hard_delete_action"]),
+                    st.session_state.source_system_initial
+                )
+                st.markdown("""
+                #### 9.3 Batched Hard Delete Reconciliation
+                This table uses HARD deletes. Run the following script after the initial load to create the
+                business key index and reconcile deleted keys in bounded batches:
+                """)
+                render_code(hard_delete_sql, "deployer_hard_delete_sql")
+            
+            # Change table retention for tables reading a Replicate __ct table
+            ct_retention_sql = None
+            if st.session_state.source_system_daily in CDC_SOURCE_SYSTEMS:
+                change_table_name = get_change_table_name(st.session_state.src_table_name_ct)
+                ct_retention_sql = generate_ct_retention_sql(
+                    st.session_state.src_schema_name,
+                    change_table_name,
+                    st.session_state.tgt_table_name_st,
+                    st.session_state.tgt_table_name_hs,
+                    st.session_state.source_system_initial,
+                    st.session_state.source_system_daily,
+                    retention_margin_days=st.session_state.get("ct_retention_margin_days", DEFAULT_VALUES["ct_retention_margin_days"]),
+                    archive=st.session_state.get("ct_retention_archive", DEFAULT_VALUES["ct_retention_archive"])
+                )
+                from src.utils.generator_cache import generate_ct_retention_pipeline
+                adf_json_ct_retention = generate_ct_retention_pipeline(
+                    change_table_name,
+                    get_ct_retention_procedure_name(change_table_name),
+                    linked_service_name=st.session_state.get("dwh_linked_service", DEFAULT_VALUES["dwh_linked_service"])
+                )
+                st.markdown(f"""
+                #### 9.4 Change Table Retention
+                Run the following SQL to create the retention procedure for the change table, then schedule the pipeline
+                `{adf_json_ct_retention['name']}` outside the daily load window:
+                """)
+                render_code(ct_retention_sql, "deployer_ct_retention_sql")
+            
             # Add cleanup step
             st.markdown("### STEP 10: Cleanup")
             
@@ -465,7 +621,7 @@ select * into DWH.CONTROL_TABLE_HS from cte;
 --drop table sandbox.CONTROL_TABLE_STAGE_backup_{table_suffix};
 """
             
-            st.code(cleanup_sql)
+            render_code(cleanup_sql, "deployer_cleanup_sql")
             
             st.markdown("""
             **NOTE:** Uncomment the statements in order when you are ready to move the configuration to production:
@@ -494,7 +650,36 @@ select * into DWH.CONTROL_TABLE_HS from cte;
                     additional_tables_sql += f"""-- MAIN TABLE
 {main_table_sql}
 """
-                st.code(additional_tables_sql, language="sql")
+                render_code(additional_tables_sql, "deployer_additional_tables_sql")
+            
+            # Optional direct execution of the SQL steps against the database
+            render_direct_execution(build_deployment_steps(
+                table_suffix,
+                {
+                    "backup_st": generate_st_control_table_backup_sql(
+                        table_suffix, st.session_state.source_system_initial, st.session_state.source_system_daily
+                    ),
+                    "backup_hs": generate_hs_control_table_backup_sql(table_suffix),
+                    "backup_job": generate_job_control_table_backup_sql(
+                        table_suffix, st.session_state.source_system_initial, st.session_state.source_system_daily
+                    ),
+                    "st_control": st_control_sql,
+                    "hs_control": hs_control_sql,
+                    "job_control": job_control_sql,
+                    "hs_table": hs_table_sql,
+                    "ct_index": ct_index_sql,
+                    "hard_delete": hard_delete_sql,
+                    "ct_retention": ct_retention_sql,
+                    "helper_table": helper_table_sql,
+                    "main_table": main_table_sql
+                },
+                {
+                    "invalid_hs": adf_json_invalid_hs['name'],
+                    "initial": adf_json_initial['name'],
+                    "placeholder": adf_json_placeholder['name']
+                },
+                f"{st.session_state.tgt_schema_name_hs}.{st.session_state.tgt_table_name_hs}"
+            ))
             
             # Warnings and troubleshooting
             st.markdown("### Common Issues & Troubleshooting")
@@ -595,6 +780,12 @@ select * into DWH.CONTROL_TABLE_HS from cte;
                     all_sql += "\n\n" + st_placeholder_sql
                 if 'additional_tables_sql' in locals() and additional_tables_sql:
                     all_sql += "\n\n" + additional_tables_sql
+                if 'ct_index_sql' in locals() and ct_index_sql:
+                    all_sql += "\n\n" + ct_index_sql
+                if 'hard_delete_sql' in locals() and hard_delete_sql:
+                    all_sql += "\n\n" + hard_delete_sql
+                if 'ct_retention_sql' in locals() and ct_retention_sql:
+                    all_sql += "\n\n" + ct_retention_sql
                 
                 st.download_button(
                     label=f"Complete SQL Script (All Steps)",
@@ -605,103 +796,156 @@ select * into DWH.CONTROL_TABLE_HS from cte;
                     help="Download all SQL scripts combined"
                 )
         
-        # ADF pipeline section
-        st.markdown("### ADF Pipeline Files")
-        st.markdown("""
-        **Note:** These pipeline files are provided for reference only. 
-        The pipelines should already exist in your environment after branch deployment.
-        """)
+        render_adf_pipeline_downloads(table_suffix)
+
+@st.fragment
+def render_adf_pipeline_downloads(table_suffix):
+    """Render the ADF pipeline downloads of the deployment"""
+    st.markdown("### ADF Pipeline Files")
+    st.markdown("""
+    **Note:** These pipeline files are provided for reference only. 
+    The pipelines should already exist in your environment after branch deployment.
+    """)
+    
+    try:
+        from src.utils.generator_cache import generate_adf_pipeline_json
         
-        try:
-            from src.utils.adf_generator import generate_adf_pipeline_json
+        # Generate the ADF pipeline JSON for all pipeline types
+        adf_json_invalid_hs = generate_adf_pipeline_json(
+            st.session_state.src_table_name, 
+            table_suffix, 
+            True, 
+            True, 
+            False,
+            st.session_state.source_system_initial,
+            st.session_state.source_system_daily
+        )
+        adf_json_initial = generate_adf_pipeline_json(
+            st.session_state.src_table_name, 
+            table_suffix, 
+            True, 
+            False, 
+            False,
+            st.session_state.source_system_initial,
+            st.session_state.source_system_daily
+        )
+        adf_json_daily = generate_adf_pipeline_json(
+            st.session_state.src_table_name, 
+            table_suffix, 
+            False, 
+            False, 
+            False,
+            st.session_state.source_system_initial,
+            st.session_state.source_system_daily,
+            st.session_state.get("daily_pipeline_mode") == "Shared",
+            st.session_state.get("delete_type")
+        )
+        adf_json_placeholder = generate_adf_pipeline_json(
+            st.session_state.src_table_name, 
+            table_suffix, 
+            True, 
+            False, 
+            True,
+            st.session_state.source_system_initial,
+            st.session_state.source_system_daily
+        )
+        
+        # Convert the Python dictionaries to formatted JSON strings
+        adf_json_str_invalid_hs = json.dumps(adf_json_invalid_hs, indent=4)
+        adf_json_str_initial = json.dumps(adf_json_initial, indent=4)
+        adf_json_str_daily = json.dumps(adf_json_daily, indent=4)
+        adf_json_str_placeholder = json.dumps(adf_json_placeholder, indent=4)
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.download_button(
+                label="1. Invalid HS Pipeline (Reference)",
+                data=adf_json_str_invalid_hs,
+                file_name=f"{adf_json_invalid_hs['name']}.json",
+                mime="application/json",
+                key="download_adf_invalid_hs",
+                help="Pipeline configuration for reference - should already exist in ADF"
+            )
             
-            # Generate the ADF pipeline JSON for all pipeline types
-            adf_json_invalid_hs = generate_adf_pipeline_json(
-                st.session_state.src_table_name, 
-                table_suffix, 
-                True, 
-                True, 
-                False,
-                st.session_state.source_system_initial,
-                st.session_state.source_system_daily
+            st.download_button(
+                label="2. HS-only Pipeline (Reference)",
+                data=adf_json_str_placeholder,
+                file_name=f"{adf_json_placeholder['name']}.json",
+                mime="application/json",
+                key="download_adf_placeholder",
+                help="Pipeline configuration for reference - should already exist in ADF"
             )
-            adf_json_initial = generate_adf_pipeline_json(
-                st.session_state.src_table_name, 
-                table_suffix, 
-                True, 
-                False, 
-                False,
-                st.session_state.source_system_initial,
-                st.session_state.source_system_daily
+        
+        with col2:
+            st.download_button(
+                label="3. Initial Load Pipeline (Reference)",
+                data=adf_json_str_initial,
+                file_name=f"{adf_json_initial['name']}.json",
+                mime="application/json",
+                key="download_adf_initial",
+                help="Pipeline configuration for reference - should already exist in ADF"
             )
-            adf_json_daily = generate_adf_pipeline_json(
-                st.session_state.src_table_name, 
-                table_suffix, 
-                False, 
-                False, 
-                False,
-                st.session_state.source_system_initial,
-                st.session_state.source_system_daily
+            
+            st.download_button(
+                label="4. Daily Load Pipeline (Reference)",
+                data=adf_json_str_daily,
+                file_name=f"{adf_json_daily['name']}.json",
+                mime="application/json",
+                key="download_adf_daily",
+                help="Pipeline configuration for reference - should already exist in ADF"
             )
-            adf_json_placeholder = generate_adf_pipeline_json(
-                st.session_state.src_table_name, 
-                table_suffix, 
-                True, 
-                False, 
-                True,
-                st.session_state.source_system_initial,
-                st.session_state.source_system_daily
+        
+        if st.session_state.source_system_daily in CDC_SOURCE_SYSTEMS:
+            from src.utils.generator_cache import generate_ct_retention_pipeline
+            from src.config.constants import DEFAULT_VALUES
+            change_table_name = get_change_table_name(st.session_state.src_table_name_ct)
+            adf_json_ct_retention = generate_ct_retention_pipeline(
+                change_table_name,
+                get_ct_retention_procedure_name(change_table_name),
+                linked_service_name=st.session_state.get("dwh_linked_service", DEFAULT_VALUES["dwh_linked_service"])
             )
+            st.download_button(
+                label="5. CT Retention Pipeline",
+                data=json.dumps(adf_json_ct_retention, indent=4),
+                file_name=f"{adf_json_ct_retention['name']}.json",
+                mime="application/json",
+                key="download_adf_ct_retention",
+                help="Pipeline that runs the change table retention procedure on its own schedule"
+            )
+        
+        render_adf_deploy_section([adf_json_invalid_hs, adf_json_placeholder, adf_json_initial, adf_json_daily])
             
-            # Convert the Python dictionaries to formatted JSON strings
-            adf_json_str_invalid_hs = json.dumps(adf_json_invalid_hs, indent=4)
-            adf_json_str_initial = json.dumps(adf_json_initial, indent=4)
-            adf_json_str_daily = json.dumps(adf_json_daily, indent=4)
-            adf_json_str_placeholder = json.dumps(adf_json_placeholder, indent=4)
-            
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                st.download_button(
-                    label="1. Invalid HS Pipeline (Reference)",
-                    data=adf_json_str_invalid_hs,
-                    file_name=f"{adf_json_invalid_hs['name']}.json",
-                    mime="application/json",
-                    key="download_adf_invalid_hs",
-                    help="Pipeline configuration for reference - should already exist in ADF"
-                )
-                
-                st.download_button(
-                    label="2. HS-only Pipeline (Reference)",
-                    data=adf_json_str_placeholder,
-                    file_name=f"{adf_json_placeholder['name']}.json",
-                    mime="application/json",
-                    key="download_adf_placeholder",
-                    help="Pipeline configuration for reference - should already exist in ADF"
-                )
-            
-            with col2:
-                st.download_button(
-                    label="3. Initial Load Pipeline (Reference)",
-                    data=adf_json_str_initial,
-                    file_name=f"{adf_json_initial['name']}.json",
-                    mime="application/json",
-                    key="download_adf_initial",
-                    help="Pipeline configuration for reference - should already exist in ADF"
-                )
-                
-                st.download_button(
-                    label="4. Daily Load Pipeline (Reference)",
-                    data=adf_json_str_daily,
-                    file_name=f"{adf_json_daily['name']}.json",
-                    mime="application/json",
-                    key="download_adf_daily",
-                    help="Pipeline configuration for reference - should already exist in ADF"
-                )
-                
-        except Exception as e:
-            st.error(f"Error generating ADF pipeline JSONs: {str(e)}")
-            st.error("Please check that the uploaded configuration contains all required parameters.")
+    except Exception as e:
+        st.error(f"Error generating ADF pipeline JSONs: {str(e)}")
+        st.error("Please check that the uploaded configuration contains all required parameters.")
+
+def render_adf_deploy_section(pipelines):
+    """Render the optional upsert of the pipelines through the ADF management REST API"""
+    with st.expander("☁️ Deploy Pipelines to Azure Data Factory (optional)"):
+        st.markdown("""
+        Creates or updates the pipelines above in the factory through the ADF management REST API, in parallel.
+        The bearer token needs Data Factory Contributor rights, for example from `az account get-access-token`.
+        """)
+        col1, col2 = st.columns(2)
+        with col1:
+            subscription_id = st.text_input("Subscription ID", key="adf_subscription_id")
+            resource_group = st.text_input("Resource Group", key="adf_resource_group")
+        with col2:
+            factory_name = st.text_input("Data Factory Name", key="adf_factory_name")
+            token = st.text_input("Bearer Token", type="password", key="adf_token")
+        
+        if st.button("Deploy Pipelines", key="adf_deploy", disabled=not (subscription_id and resource_group and factory_name and token)):
+            from src.utils.adf_client import AdfClient, deploy_pipelines
+            
+            client = AdfClient(subscription_id, resource_group, factory_name, token)
+            with st.spinner("Deploying pipelines..."):
+                results = deploy_pipelines(client, pipelines)
+            st.dataframe(results, use_container_width=True)
+            if any(result["status"] == "FAILED" for result in results):
+                st.error("Some pipelines could not be deployed.")
+            else:
+                st.success(f"Deployed {len(results)} pipelines.")
 
 def render_deployer_view():
     """Main function to render the deployer view"""
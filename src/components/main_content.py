@@ -1,24 +1,39 @@
 import streamlit as st
 from datetime import datetime
 import json
-from src.utils.sql_generator import (
+from src.utils.generator_cache import (
     generate_control_table_backup_sql,
     generate_st_control_table_sql,
     generate_hs_control_table_sql,
     generate_job_control_sql,
     generate_hs_table_sql,
     generate_helper_table_sql,
-    generate_main_table_sql
+    generate_main_table_sql,
+    generate_trunc_load_switch_sql,
+    generate_hard_delete_batch_sql,
+    generate_ct_index_sql,
+    generate_ct_retention_sql,
+    get_ct_retention_procedure_name,
+    get_change_table_name,
+    generate_adf_pipeline_json,
+    generate_ct_retention_pipeline,
+    generate_daily_load_trigger,
+    generate_daily_load_parameter_file
 )
-from src.utils.adf_generator import generate_adf_pipeline_json
+from src.config.constants import CDC_SOURCE_SYSTEMS
+from src.utils.parameters import get_current_params
+from src.utils.artifact_store import get_artifact_store, get_params_hash, get_or_generate
+from src.components.code_viewer import render_code
 import io
 
+@st.fragment
 def render_control_table_backup_tab(table_suffix):
     """Render the control table backup tab"""
     st.subheader("Step 1: Create Temporary Control Tables")
     tab1_sql = generate_control_table_backup_sql(table_suffix)
-    st.code(tab1_sql)
+    render_code(tab1_sql, "backup_sql")
 
+@st.fragment
 def render_st_control_table_tab(table_suffix):
     """Render the ST control table tab"""
     st.subheader("Step 2: Update ST Control Table")
@@ -36,17 +51,52 @@ def render_st_control_table_tab(table_suffix):
         st.session_state.incremental_filter_timezone,
         st.session_state.delete_type,
         st.session_state.src_delete_column,
-        st.session_state.src_delete_value
+        st.session_state.src_delete_value,
+        st.session_state.load_priority
     )
-    st.code(tab2_sql)
-
+    render_code(tab2_sql, "st_control_sql")
+    
+    if st.session_state.delete_type == "HARD":
+        st.markdown("#### Batched Hard Delete Script")
+        st.markdown("""
+        Reconciles missing business keys in bounded batches instead of one large statement.
+        Run it after the HS table has been created, or schedule it next to the daily load.
+        """)
+        render_code(generate_hard_delete_batch_sql(
+            st.session_state.src_schema_name,
+            st.session_state.src_table_name,
+            st.session_state.tgt_schema_name_hs,
+            st.session_state.tgt_table_name_hs,
+            st.session_state.business_key,
+            st.session_state.hard_delete_batch_size,
+            st.session_state.hard_delete_action,
+            st.session_state.source_system_initial
+        ), "hard_delete_sql")
+    
+    if st.session_state.scd_type == "SCD2 from CT":
+        st.markdown("#### Change Table Indexes")
+        st.markdown(f"""
+        Supporting indexes on `{st.session_state.src_schema_name}.{st.session_state.src_table_name_ct}` so the daily
+        SCD2 from CT load can seek on `header__timestamp` and read changes in business key and change sequence order.
+        """)
+        render_code(generate_ct_index_sql(
+            st.session_state.src_schema_name,
+            st.session_state.src_table_name_ct,
+            st.session_state.business_key,
+            st.session_state.source_column_for_sorting
+        ), "ct_index_sql")
+
+@st.fragment
 def render_hs_control_table_tab(table_suffix):
     """Render the HS control table tab"""
     st.subheader("Step 3: Update HS Control Table")
     tab3_sql = generate_hs_control_table_sql(
         table_suffix,
+        st.session_state.source_system_initial,
+        st.session_state.source_system_daily,
+        st.session_state.src_schema_name,
+        st.session_state.src_table_name,
         st.session_state.tgt_schema_name_st,
-        st.session_state.tgt_table_name_st,
         st.session_state.tgt_schema_name_hs,
         st.session_state.tgt_table_name_hs,
         st.session_state.business_key,
@@ -61,20 +111,23 @@ def render_hs_control_table_tab(table_suffix):
         st.session_state.use_source_column_for_valid_dates,
         st.session_state.source_column_for_valid_from_date,
         st.session_state.source_column_for_sorting,
-        st.session_state.source_system_initial
+        st.session_state.use_partition_switch,
+        st.session_state.load_priority
     )
-    st.code(tab3_sql)
+    render_code(tab3_sql, "hs_control_sql")
 
+@st.fragment
 def render_job_control_tab(table_suffix):
     """Render the job control table tab"""
     st.subheader("Step 4: Update Job Control Table")
     tab4_sql = generate_job_control_sql(table_suffix)
-    st.code(tab4_sql)
+    render_code(tab4_sql, "job_control_sql")
     
     st.markdown("""
     In the next step, we will create the ADF pipeline JSON that will use these control table configurations to orchestrate the data loading process.
     """)
 
+@st.fragment
 def render_hs_table_tab():
     """Render the HS table creation tab"""
     st.subheader("Step 5: Create HS Table")
@@ -84,13 +137,60 @@ def render_hs_table_tab():
         st.session_state.tgt_schema_name_st,
         st.session_state.tgt_table_name_st
     )
-    st.code(tab5_sql)
+    render_code(tab5_sql, "hs_table_sql")
     
     st.markdown("""
     **Note:** If you want a quicker way to get to the HS tables, you can run the initial load with an invalid HS job name. 
     This will only run the stage part of the job and then fail. Then create the HS table with this script.
     """)
+    
+    if st.session_state.scd_type == "Trunc Load" and st.session_state.use_partition_switch:
+        st.markdown("#### Shadow Table and Partition Switch")
+        st.markdown("""
+        The HS control table loads the shadow table and calls the switch procedure in its postscript.
+        Run this script after the HS table above has been created.
+        """)
+        render_code(generate_trunc_load_switch_sql(
+            st.session_state.tgt_schema_name_hs,
+            st.session_state.tgt_table_name_hs,
+            st.session_state.primary_key,
+            st.session_state.source_system_initial,
+            st.session_state.src_table_name
+        ), "trunc_load_switch_sql")
+
+def render_adf_export_section():
+    """Render the export of all generated ADF objects to a git repository folder or an ARM template"""
+    st.markdown("### Export to ADF Repository")
+    from src.utils.adf_exporter import collect_table_adf_objects, write_git_layout, generate_arm_template
+    adf_objects = collect_table_adf_objects(get_current_params(), st.session_state.table_suffix)
+    
+    repo_folder = st.text_input(
+        "ADF Repository Folder",
+        st.session_state.get("adf_repo_folder", ""),
+        help="Root folder of the local clone of the ADF git repository. Objects are written to its pipeline and trigger folders"
+    )
+    st.session_state.adf_repo_folder = repo_folder
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        if st.button("Write to Repository", disabled=not repo_folder, key="write_adf_repository"):
+            try:
+                results = write_git_layout(adf_objects, repo_folder)
+                changed = sum(result["status"] != "UNCHANGED" for result in results)
+                st.success(f"Wrote {changed} of {len(results)} objects, the others are unchanged.")
+                st.dataframe(results, use_container_width=True, hide_index=True)
+            except Exception as e:
+                st.error(str(e))
+    with col2:
+        st.download_button(
+            label="Download ARM Template",
+            data=json.dumps(generate_arm_template(adf_objects), indent=4),
+            file_name=f"arm_template_{st.session_state.table_suffix}.json",
+            mime="application/json",
+            key="download_adf_arm_template",
+        )
 
+@st.fragment
 def render_adf_pipeline_tab():
     """Render the ADF pipeline JSON tab"""
     st.subheader("Step 6: ADF Pipeline JSON")
@@ -105,6 +205,7 @@ def render_adf_pipeline_tab():
         st.session_state.source_system_initial, 
         st.session_state.source_system_daily
     )
+    shared_daily = st.session_state.get("daily_pipeline_mode") == "Shared"
     adf_json_daily = generate_adf_pipeline_json(
         st.session_state.src_table_name, 
         st.session_state.table_suffix, 
@@ -112,7 +213,9 @@ def render_adf_pipeline_tab():
         False, 
         False, 
         st.session_state.source_system_initial, 
-        st.session_state.source_system_daily
+        st.session_state.source_system_daily,
+        shared_daily,
+        st.session_state.delete_type
     )
     adf_json_invalid_hs = generate_adf_pipeline_json(
         st.session_state.src_table_name, 
@@ -130,15 +233,16 @@ def render_adf_pipeline_tab():
     adf_json_str_invalid_hs = json.dumps(adf_json_invalid_hs, indent=4)
     
     # Create tabs for initial, daily, and invalid HS load JSONs
-    initial_tab, invalid_hs_tab, daily_tab = st.tabs([
+    initial_tab, invalid_hs_tab, daily_tab, ct_retention_tab = st.tabs([
         "Initial Load Pipeline", 
         "Invalid HS Pipeline (Stage-only)", 
-        "Daily Load Pipeline"
+        "Daily Load Pipeline",
+        "CT Retention Pipeline"
     ])
     
     with initial_tab:
         st.markdown("### Initial Load Pipeline")
-        st.code(adf_json_str_initial, language="json")
+        render_code(adf_json_str_initial, "adf_initial_json", "json")
         st.download_button(
             label="Download Initial Load Pipeline JSON",
             data=adf_json_str_initial,
@@ -162,7 +266,7 @@ def render_adf_pipeline_tab():
         
         This approach helps prevent the "Invalid object name" error by creating the HS table before the actual HS job runs.
         """)
-        st.code(adf_json_str_invalid_hs, language="json")
+        render_code(adf_json_str_invalid_hs, "adf_invalid_hs_json", "json")
         st.download_button(
             label="Download Invalid HS Pipeline JSON",
             data=adf_json_str_invalid_hs,
@@ -173,7 +277,13 @@ def render_adf_pipeline_tab():
     
     with daily_tab:
         st.markdown("### Daily Load Pipeline")
-        st.code(adf_json_str_daily, language="json")
+        if shared_daily:
+            st.markdown(f"""
+            This pipeline is shared by all tables loaded by the same jobs. Deploy it and its trigger once; a new
+            table only needs its control table rows. The parameter file records which shared pipeline loads
+            `{st.session_state.src_table_name}`.
+            """)
+        render_code(adf_json_str_daily, "adf_daily_json", "json")
         st.download_button(
             label="Download Daily Load Pipeline JSON",
             data=adf_json_str_daily,
@@ -181,6 +291,79 @@ def render_adf_pipeline_tab():
             mime="application/json",
             key="download_adf_json_daily",
         )
+        
+        if shared_daily:
+            adf_json_trigger = generate_daily_load_trigger(
+                st.session_state.source_system_initial,
+                st.session_state.source_system_daily
+            )
+            adf_json_str_trigger = json.dumps(adf_json_trigger, indent=4)
+            parameter_file = generate_daily_load_parameter_file(
+                st.session_state.src_table_name,
+                st.session_state.source_system_initial,
+                st.session_state.source_system_daily
+            )
+            parameter_file_str = json.dumps(parameter_file, indent=4)
+            
+            st.markdown("#### Daily Load Trigger")
+            render_code(adf_json_str_trigger, "adf_trigger_json", "json")
+            st.download_button(
+                label="Download Daily Load Trigger JSON",
+                data=adf_json_str_trigger,
+                file_name=f"{adf_json_trigger['name']}.json",
+                mime="application/json",
+                key="download_adf_json_daily_trigger",
+            )
+            
+            st.markdown("#### Table Parameter File")
+            render_code(parameter_file_str, "adf_parameter_file_json", "json")
+            st.download_button(
+                label="Download Table Parameter File",
+                data=parameter_file_str,
+                file_name=f"daily_load_{st.session_state.src_table_name}.json",
+                mime="application/json",
+                key="download_daily_parameter_file",
+            )
+    
+    with ct_retention_tab:
+        st.markdown("### CT Retention Pipeline")
+        if st.session_state.source_system_daily in CDC_SOURCE_SYSTEMS:
+            change_table_name = get_change_table_name(st.session_state.src_table_name_ct)
+            st.markdown(f"""
+            Keeps `{st.session_state.src_schema_name}.{change_table_name}` small by removing change rows
+            that the daily ST and HS loads of this table have already processed. Create the procedure once, then schedule the pipeline
+            outside the daily load window.
+            """)
+            ct_retention_sql = generate_ct_retention_sql(
+                st.session_state.src_schema_name,
+                change_table_name,
+                st.session_state.tgt_table_name_st,
+                st.session_state.tgt_table_name_hs,
+                st.session_state.source_system_initial,
+                st.session_state.source_system_daily,
+                retention_margin_days=st.session_state.ct_retention_margin_days,
+                archive=st.session_state.ct_retention_archive
+            )
+            render_code(ct_retention_sql, "ct_retention_sql")
+            
+            adf_json_ct_retention = generate_ct_retention_pipeline(
+                change_table_name,
+                get_ct_retention_procedure_name(change_table_name),
+                linked_service_name=st.session_state.dwh_linked_service
+            )
+            adf_json_str_ct_retention = json.dumps(adf_json_ct_retention, indent=4)
+            render_code(adf_json_str_ct_retention, "adf_ct_retention_json", "json")
+            st.download_button(
+                label="Download CT Retention Pipeline JSON",
+                data=adf_json_str_ct_retention,
+                file_name=f"{adf_json_ct_retention['name']}.json",
+                mime="application/json",
+                key="download_adf_json_ct_retention",
+            )
+        else:
+            st.info("Change table retention only applies to tables with a Replicate_CDC daily source system.")
+    
+    render_adf_export_section()
     
     # Add instructions for pasting into ADF
     st.markdown("""
@@ -213,6 +396,7 @@ def render_adf_pipeline_tab():
     In the next step, we will create the dimension and helper tables that will store the final data.
     """)
 
+@st.fragment
 def render_dimension_helper_tab():
     """Render the dimension and helper tables tab"""
     st.subheader("Step 10: Create Dimension and Helper Tables")
@@ -227,7 +411,7 @@ def render_dimension_helper_tab():
     )
     
     if helper_table_sql:
-        st.code(helper_table_sql)
+        render_code(helper_table_sql, "helper_table_sql")
     else:
         st.info("Helper table creation was not selected. Check the 'Create helper table' option in the Dimension and Helper Tables section to generate the helper table SQL.")
     
@@ -242,10 +426,11 @@ def render_dimension_helper_tab():
     )
     
     if main_table_sql:
-        st.code(main_table_sql)
+        render_code(main_table_sql, "main_table_sql")
     else:
         st.info("Main table creation was not selected. Check the 'Create main DIM table' option to generate the main table SQL.")
 
+@st.fragment
 def render_cleanup_tab(table_suffix):
     """Render the cleanup tab"""
     st.subheader("Step 9: Cleanup")
@@ -301,7 +486,7 @@ select * into DWH.CONTROL_TABLE_HS from cte;
 -- If using an existing job name, the job should now be executed as part of that job's schedule.
 """
     
-    st.code(cleanup_sql)
+    render_code(cleanup_sql, "cleanup_sql")
     
     st.markdown("""
     **NOTE:** Uncomment the statements in order when you are ready to move the configuration to production:
@@ -311,6 +496,69 @@ select * into DWH.CONTROL_TABLE_HS from cte;
     4. Drop temporary tables when everything is verified
     """)
 
+@st.fragment
+def render_load_planning_tab():
+    """Render the load planning tab"""
+    from src.utils.load_planner import read_table_stats, plan_load_priorities, get_job_makespans, generate_priority_update_sql
+    st.subheader("Load Planning")
+    st.markdown("""
+    Upload a CSV with one row per table to derive control table priorities longest-processing-time first.
+    
+    **Columns:** `table_name` (HS target table), optionally `schema_name` (default HS), `st_table_name`, `st_schema_name` (default ST),
+    `size_mb` and `duration_seconds` (historical load duration). Tables without a duration are estimated from their size.
+    """)
+    
+    stats_file = st.file_uploader("Upload Table Statistics", type=['csv'], key="load_planning_stats")
+    job_names_input = st.text_input(
+        "HS Job Names (comma-separated, optional)",
+        help="Spread the tables across these HS job names so each job gets a similar amount of work"
+    )
+    
+    if stats_file is None:
+        return
+    
+    try:
+        table_stats = read_table_stats(stats_file.getvalue().decode())
+    except Exception as e:
+        st.error(str(e))
+        return
+    
+    job_names = [job_name.strip() for job_name in job_names_input.split(",") if job_name.strip()]
+    plan = plan_load_priorities(table_stats, job_names)
+    
+    st.dataframe(plan, use_container_width=True)
+    
+    if job_names:
+        st.markdown("#### Estimated Duration per Job")
+        st.dataframe(
+            [{"job_name": job_name, "estimated_seconds": round(seconds, 1)} for job_name, seconds in get_job_makespans(plan).items()],
+            use_container_width=True
+        )
+        st.warning(
+            f"The SQL adds missing DWH.JOB_CONTROL rows for {', '.join(job_names)}. "
+            "Make sure an ADF pipeline runs each of these jobs, otherwise its tables stop loading."
+        )
+    
+    # Offer the planned priority for the table currently being configured
+    current_hs_table = st.session_state.get("tgt_table_name_hs")
+    current_plan = next((row for row in plan if row["table_name"] == current_hs_table), None)
+    if current_plan:
+        st.info(f"Planned priority for `{current_hs_table}`: **{current_plan['priority']}**")
+        if st.button("Use Planned Priority"):
+            st.session_state.load_priority = current_plan["priority"]
+            st.rerun()
+    
+    priority_sql = generate_priority_update_sql(plan)
+    st.markdown("#### Apply Plan to Existing Control Tables")
+    render_code(priority_sql, "load_plan_sql")
+    st.download_button(
+        label="Download Load Plan SQL",
+        data=priority_sql,
+        file_name=f"load_plan_{datetime.now().strftime('%Y%m%d_%H%M%S')}.sql",
+        mime="text/plain",
+        key="download_load_plan_sql",
+    )
+
 def render_main_content():
     """Render the main content area with all tabs"""
     st.header("Generated SQL Deployment Script")
@@ -325,7 +573,7 @@ def render_main_content():
         else:
             st.info(f"📋 **Table Suffix:** `{table_suffix}` - Imported from configuration. This ensures consistency with the original SQL generation.")
     
-    tab1, tab2, tab3, tab4, tab5, tab6, tab7, tab8, tab9 = st.tabs([
+    tab1, tab2, tab3, tab4, tab5, tab6, tab7, tab8, tab9, tab10, tab11, tab12 = st.tabs([
         "1. Control Tables Backup", 
         "2. ST Control Table", 
         "3. HS Control Table", 
@@ -334,7 +582,10 @@ def render_main_content():
         "6. ADF Pipeline JSON",
         "7. Verify Deployment",
         "8. Cleanup",
-        "9. Dimension and Helper Tables"
+        "9. Dimension and Helper Tables",
+        "10. Load Planning",
+        "11. Load Analytics",
+        "12. Bulk Onboarding"
     ])
     
     if st.session_state.sql_generated:
@@ -383,10 +634,10 @@ def render_main_content():
         with tab9:
             render_dimension_helper_tab()
         
-        # Prepare complete SQL script for download
-        complete_sql = f"""-- Generated SQL Deployment Script for {st.session_state.src_table_name}
--- Generated on: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
--- This script contains all steps needed for deploying {st.session_state.src_table_name} to the data warehouse.
+        # Prepare complete SQL script for download, reusing the script of an identical configuration if stored
+        def generate_complete_sql():
+            """Generate the complete script without its timestamp, which would make every stored copy differ"""
+            return {"all_sql": f"""-- This script contains all steps needed for deploying {st.session_state.src_table_name} to the data warehouse.
 -- Created by: {st.session_state.user_initials.upper()}
 
 ---------------------------------------------------------
@@ -411,7 +662,8 @@ def render_main_content():
     st.session_state.incremental_filter_timezone,
     st.session_state.delete_type,
     st.session_state.src_delete_column,
-    st.session_state.src_delete_value
+    st.session_state.src_delete_value,
+    st.session_state.load_priority
 )}
 
 ---------------------------------------------------------
@@ -419,8 +671,11 @@ def render_main_content():
 ---------------------------------------------------------
 {generate_hs_control_table_sql(
     table_suffix,
+    st.session_state.source_system_initial,
+    st.session_state.source_system_daily,
+    st.session_state.src_schema_name,
+    st.session_state.src_table_name,
     st.session_state.tgt_schema_name_st,
-    st.session_state.tgt_table_name_st,
     st.session_state.tgt_schema_name_hs,
     st.session_state.tgt_table_name_hs,
     st.session_state.business_key,
@@ -435,7 +690,8 @@ def render_main_content():
     st.session_state.use_source_column_for_valid_dates,
     st.session_state.source_column_for_valid_from_date,
     st.session_state.source_column_for_sorting,
-    st.session_state.source_system_initial
+    st.session_state.use_partition_switch,
+    st.session_state.load_priority
 )}
 
 ---------------------------------------------------------
@@ -452,6 +708,29 @@ def render_main_content():
     st.session_state.tgt_schema_name_st,
     st.session_state.tgt_table_name_st
 )}
+{generate_trunc_load_switch_sql(
+    st.session_state.tgt_schema_name_hs,
+    st.session_state.tgt_table_name_hs,
+    st.session_state.primary_key,
+    st.session_state.source_system_initial,
+    st.session_state.src_table_name
+) if st.session_state.scd_type == "Trunc Load" and st.session_state.use_partition_switch else ""}
+{generate_hard_delete_batch_sql(
+    st.session_state.src_schema_name,
+    st.session_state.src_table_name,
+    st.session_state.tgt_schema_name_hs,
+    st.session_state.tgt_table_name_hs,
+    st.session_state.business_key,
+    st.session_state.hard_delete_batch_size,
+    st.session_state.hard_delete_action,
+    st.session_state.source_system_initial
+) if st.session_state.delete_type == "HARD" else ""}
+{generate_ct_index_sql(
+    st.session_state.src_schema_name,
+    st.session_state.src_table_name_ct,
+    st.session_state.business_key,
+    st.session_state.source_column_for_sorting
+) if st.session_state.scd_type == "SCD2 from CT" else ""}
 
 ---------------------------------------------------------
 -- STEP 8: VERIFY DEPLOYMENT
@@ -538,7 +817,18 @@ select * into DWH.CONTROL_TABLE_HS from cte;
     st.session_state.business_key_column
 ) or ""}
 -- End of script
-"""
+"""}
+        
+        try:
+            artifacts = get_or_generate(
+                get_artifact_store(), get_params_hash(get_current_params(), table_suffix, "developer"), generate_complete_sql
+            )
+        except Exception as e:
+            st.warning(str(e))
+            artifacts = generate_complete_sql()
+        complete_sql = f"""-- Generated SQL Deployment Script for {st.session_state.src_table_name}
+-- Generated on: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
+{artifacts["all_sql"]}"""
         
         # Store the complete SQL in session state
         st.session_state.all_sql = complete_sql
@@ -573,36 +863,9 @@ select * into DWH.CONTROL_TABLE_HS from cte;
             else:
                 file_name = f"dwh_params_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
             
-            # Prepare the parameters to export
+            # Export every configuration parameter from session state
             from src.utils.parameters import export_parameters
-            params_to_export = {}
-            
-            # Get all relevant parameters from session state
-            for key in [
-                "user_initials", "table_suffix",
-                "source_system_initial", "source_system_daily",
-                "src_schema_name", "src_table_name", "src_table_name_ct",
-                "tgt_schema_name_st", "tgt_table_name_st", 
-                "tgt_schema_name_hs", "tgt_table_name_hs",
-                "business_key", "primary_key",
-                "incremental_filter_st", "incremental_filter_hs", "incremental_filter_timezone",
-                "scd_type", "scd2_columns_option", "scd2_columns",
-                "create_helper_table", "helper_schema", "business_key_column",
-                "delete_type", "src_delete_column", "src_delete_value",
-                "prescript", "postscript", "partitions", 
-                "use_source_column_for_valid_dates", "source_column_for_valid_from_date", 
-                "source_column_for_sorting",
-                "create_main_table", "main_table_schema", 
-                "main_table_columns", "skip_st_table", "skip_hs_table", "skip_main_table"
-            ]:
-                # Include parameter if it exists in session state
-                if key in st.session_state:
-                    params_to_export[key] = st.session_state[key]
-                else:
-                    params_to_export[key] = None
-            
-            # Export parameters to JSON
-            params_json = export_parameters(params_to_export)
+            params_json = export_parameters(get_current_params())
             
             # Direct download button
             download_button = st.download_button(
@@ -613,4 +876,28 @@ select * into DWH.CONTROL_TABLE_HS from cte;
                 key="export_params"
             )
     else:
-        st.info("Fill in the required fields in the sidebar and click 'Generate SQL Script' to see the deployment steps.") 
\ No newline at end of file
+        st.info("Fill in the required fields in the sidebar and click 'Generate SQL Script' to see the deployment steps.")
+    
+    # Load planning and analytics work on exported statistics and do not need generated SQL
+    with tab10:
+        render_load_planning_tab()
+    
+    # st.tabs renders every tab on each rerun, so the pandas-based views are only imported once they are opened
+    with tab11:
+        if st.toggle("Open Load Analytics", key="open_load_analytics"):
+            from src.components.analytics_view import render_analytics_view
+            render_analytics_view()
+    
+    with tab12:
+        if st.toggle("Open Bulk Onboarding", key="open_bulk_onboarding"):
+            from src.components.bulk_onboarding_view import (
+                render_bulk_onboarding_view,
+                render_control_table_import_section,
+                render_control_table_diff_section
+            )
+            render_bulk_onboarding_view()
+            st.divider()
+            render_control_table_import_section()
+            st.divider()
+            render_control_table_diff_section()
+ 
\ No newline at end of file
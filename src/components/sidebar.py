@@ -2,12 +2,14 @@ import streamlit as st
 from datetime import datetime
 import json
 from src.utils.parameters import export_parameters, import_parameters, get_current_params
+from src.utils.table_suffix import allocate_table_suffix
 from src.config.constants import (
     SOURCE_SYSTEM_OPTIONS, DEFAULT_VALUES, SCD_TYPE_OPTIONS,
     SCD2_COLUMNS_OPTIONS, DELETE_TYPE_OPTIONS, TIMEZONE_OPTIONS,
-    INCREMENTAL_FILTER_OPTIONS
+    INCREMENTAL_FILTER_OPTIONS, HARD_DELETE_ACTION_OPTIONS, DAILY_PIPELINE_MODE_OPTIONS, CDC_SOURCE_SYSTEMS
 )
 
+@st.fragment
 def render_import_export_section():
     """Render the import parameters section in the sidebar"""
     st.subheader("Import/Export Parameters")
@@ -47,7 +49,8 @@ def render_import_export_section():
                     for key, value in imported_params.items():
                         if key not in ["export_timestamp", "app_version"]:  # Skip metadata
                             st.session_state[key] = value
-                    st.success("Parameters applied successfully!")
+                    # Rerun the whole app so the sidebar form and the tabs pick up the parameters
+                    st.rerun()
         except Exception as e:
             st.error(f"Error importing parameters: {str(e)}")
             
@@ -98,7 +101,8 @@ def render_target_table_section(src_table_name):
     default_st_name = f"ST_{src_table_name}" if src_table_name else ""
     tgt_table_name_st = st.text_input(
         "ST Table Name", 
-        st.session_state.get("tgt_table_name_st", default_st_name)
+        st.session_state.get("tgt_table_name_st", default_st_name),
+        help="Derived as ST_<source table> when left empty"
     )
     
     tgt_schema_name_hs = st.text_input(
@@ -110,7 +114,8 @@ def render_target_table_section(src_table_name):
     default_hs_name = f"HS_{src_table_name}" if src_table_name else ""
     tgt_table_name_hs = st.text_input(
         "HS Table Name", 
-        st.session_state.get("tgt_table_name_hs", default_hs_name)
+        st.session_state.get("tgt_table_name_hs", default_hs_name),
+        help="Derived as HS_<source table> when left empty"
     )
     
     return tgt_schema_name_st, tgt_table_name_st, tgt_schema_name_hs, tgt_table_name_hs
@@ -210,7 +215,16 @@ def render_scd_section():
     else:
         scd2_columns = "__allColumns"
     
-    return scd_type, scd2_columns_option, scd2_columns
+    # Only offer the partition switch for Trunc Load
+    use_partition_switch = False
+    if scd_type == "Trunc Load":
+        use_partition_switch = st.checkbox(
+            "Load via shadow table and partition switch",
+            value=st.session_state.get("use_partition_switch", DEFAULT_VALUES["use_partition_switch"]),
+            help="Loads a shadow table and swaps it into the HS table with ALTER TABLE ... SWITCH, so readers never see an empty or partial table"
+        )
+    
+    return scd_type, scd2_columns_option, scd2_columns, use_partition_switch
 
 def render_dimension_helper_section():
     """Render the dimension and helper tables section"""
@@ -308,7 +322,24 @@ def render_delete_section():
             help="Value to mark records as deleted"
         )
     
-    return delete_type, src_delete_column, src_delete_value
+    hard_delete_batch_size = DEFAULT_VALUES["hard_delete_batch_size"]
+    hard_delete_action = DEFAULT_VALUES["hard_delete_action"]
+    if delete_type == "HARD":
+        default_hard_delete_action = st.session_state.get("hard_delete_action", DEFAULT_VALUES["hard_delete_action"])
+        hard_delete_action = st.radio(
+            "Hard Delete Action",
+            HARD_DELETE_ACTION_OPTIONS,
+            index=HARD_DELETE_ACTION_OPTIONS.index(default_hard_delete_action) if default_hard_delete_action in HARD_DELETE_ACTION_OPTIONS else 0,
+            help="Flag: Set TC_DELETED_FLAG on the current HS rows\nDelete: Remove the HS rows for missing business keys"
+        )
+        hard_delete_batch_size = st.number_input(
+            "Hard Delete Batch Size", 1000, 1000000,
+            st.session_state.get("hard_delete_batch_size", DEFAULT_VALUES["hard_delete_batch_size"]),
+            step=1000,
+            help="Number of rows flagged or deleted per batch in the batched hard delete script"
+        )
+    
+    return delete_type, src_delete_column, src_delete_value, hard_delete_batch_size, hard_delete_action
 
 def render_advanced_options():
     """Render the advanced options section"""
@@ -332,6 +363,20 @@ def render_advanced_options():
             help="Number of partitions for SCD2 checks"
         )
         
+        # Load priority written to the ST and HS control table rows
+        load_priority = st.number_input(
+            "Load Priority", 0, 100000,
+            st.session_state.get("load_priority", DEFAULT_VALUES["load_priority"]),
+            help="Priority of the ST and HS control table rows. Use the Load Planning tab to derive it from historical durations"
+        )
+        
+        # Daily pipeline per table or one shared parameterised pipeline per job combination
+        daily_pipeline_mode = st.radio(
+            "Daily Pipeline Mode", DAILY_PIPELINE_MODE_OPTIONS,
+            index=DAILY_PIPELINE_MODE_OPTIONS.index(st.session_state.get("daily_pipeline_mode", DEFAULT_VALUES["daily_pipeline_mode"])),
+            help="Shared generates one parameterised daily pipeline and trigger for all tables of the same jobs instead of one pipeline per table"
+        )
+        
         # Only show source column options when SCD2 from CT is selected
         use_source_column_for_valid_dates = False
         source_column_for_valid_from_date = ""
@@ -363,8 +408,30 @@ def render_advanced_options():
             st.session_state["source_column_for_valid_from_date"] = ""
             st.session_state["source_column_for_sorting"] = ""
         
-        return (prescript, postscript, partitions, use_source_column_for_valid_dates,
-                source_column_for_valid_from_date, source_column_for_sorting)
+        # Only show change table retention options when the daily load reads a __ct table
+        ct_retention_margin_days = DEFAULT_VALUES["ct_retention_margin_days"]
+        ct_retention_archive = DEFAULT_VALUES["ct_retention_archive"]
+        dwh_linked_service = st.session_state.get("dwh_linked_service", DEFAULT_VALUES["dwh_linked_service"])
+        
+        if st.session_state.get("source_system_daily") in CDC_SOURCE_SYSTEMS:
+            ct_retention_margin_days = st.number_input(
+                "CT Retention Margin (days)", 0, 365,
+                st.session_state.get("ct_retention_margin_days", DEFAULT_VALUES["ct_retention_margin_days"]),
+                help="Change rows are kept this many days beyond the last successful daily ST and HS load"
+            )
+            ct_retention_archive = st.checkbox(
+                "Archive removed CT rows",
+                st.session_state.get("ct_retention_archive", DEFAULT_VALUES["ct_retention_archive"]),
+                help="Moves removed change rows to a __ct_archive table instead of only deleting them"
+            )
+            dwh_linked_service = st.text_input(
+                "DWH Linked Service", dwh_linked_service,
+                help="ADF linked service of the DWH database that the CT retention pipeline runs the procedure on"
+            )
+        
+        return (prescript, postscript, partitions, load_priority, daily_pipeline_mode, use_source_column_for_valid_dates,
+                source_column_for_valid_from_date, source_column_for_sorting,
+                ct_retention_margin_days, ct_retention_archive, dwh_linked_service)
 
 def render_sidebar():
     """Render the complete sidebar"""
@@ -374,23 +441,43 @@ def render_sidebar():
     # Table Information header
     st.header("Table Information")
     
-    # User Initials below the header
-    user_initials = st.text_input("Your Initials (e.g., skg)", 
-                                 value=st.session_state.get("user_initials", "")).lower()
-    st.session_state.user_initials = user_initials
-    
-    # Render all other sections
-    source_system_initial, source_system_daily, src_schema_name, src_table_name, src_table_name_ct = render_source_table_section()
-    tgt_schema_name_st, tgt_table_name_st, tgt_schema_name_hs, tgt_table_name_hs = render_target_table_section(src_table_name)
-    business_key, primary_key = render_key_columns_section()
-    incremental_filter_st, incremental_filter_hs, incremental_filter_timezone = render_incremental_load_section()
-    scd_type, scd2_columns_option, scd2_columns = render_scd_section()
-    delete_type, src_delete_column, src_delete_value = render_delete_section()
-    prescript, postscript, partitions, use_source_column_for_valid_dates, source_column_for_valid_from_date, source_column_for_sorting = render_advanced_options()
-    create_main_table, main_table_schema, main_table_name, main_table_columns, create_helper_table, helper_schema, business_key_column = render_dimension_helper_section()
+    # The inputs are batched in a form, so typing does not rerun the app. Options that depend on other
+    # inputs, such as the custom filter columns or the delete columns, appear after Apply Changes.
+    with st.form("table_configuration_form", border=False):
+        # User Initials below the header
+        user_initials = st.text_input("Your Initials (e.g., skg)", 
+                                     value=st.session_state.get("user_initials", "")).lower()
+        
+        # Render all other sections
+        source_system_initial, source_system_daily, src_schema_name, src_table_name, src_table_name_ct = render_source_table_section()
+        tgt_schema_name_st, tgt_table_name_st, tgt_schema_name_hs, tgt_table_name_hs = render_target_table_section(src_table_name)
+        business_key, primary_key = render_key_columns_section()
+        incremental_filter_st, incremental_filter_hs, incremental_filter_timezone = render_incremental_load_section()
+        scd_type, scd2_columns_option, scd2_columns, use_partition_switch = render_scd_section()
+        delete_type, src_delete_column, src_delete_value, hard_delete_batch_size, hard_delete_action = render_delete_section()
+        (prescript, postscript, partitions, load_priority, daily_pipeline_mode, use_source_column_for_valid_dates, source_column_for_valid_from_date,
+         source_column_for_sorting, ct_retention_margin_days, ct_retention_archive, dwh_linked_service) = render_advanced_options()
+        create_main_table, main_table_schema, main_table_name, main_table_columns, create_helper_table, helper_schema, business_key_column = render_dimension_helper_section()
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            apply_changes = st.form_submit_button("Apply Changes")
+        with col2:
+            generate_sql = st.form_submit_button("Generate SQL Script", type="primary")
+    
+    # Nothing changed since the last submit
+    if not apply_changes and not generate_sql:
+        return
+    
+    # Derive the target table names from the source table when they are left empty
+    if src_table_name and not tgt_table_name_st:
+        tgt_table_name_st = f"ST_{src_table_name}"
+    if src_table_name and not tgt_table_name_hs:
+        tgt_table_name_hs = f"HS_{src_table_name}"
     
     # Store all values in session state
     st.session_state.update({
+        "user_initials": user_initials,
         "source_system_initial": source_system_initial,
         "source_system_daily": source_system_daily,
         "src_schema_name": src_schema_name,
@@ -408,6 +495,7 @@ def render_sidebar():
         "scd_type": scd_type,
         "scd2_columns_option": scd2_columns_option,
         "scd2_columns": scd2_columns,
+        "use_partition_switch": use_partition_switch,
         "create_main_table": create_main_table,
         "main_table_schema": main_table_schema,
         "main_table_name": main_table_name,
@@ -418,27 +506,35 @@ def render_sidebar():
         "delete_type": delete_type,
         "src_delete_column": src_delete_column,
         "src_delete_value": src_delete_value,
+        "hard_delete_batch_size": hard_delete_batch_size,
+        "hard_delete_action": hard_delete_action,
         "prescript": prescript,
         "postscript": postscript,
         "partitions": partitions,
+        "load_priority": load_priority,
+        "daily_pipeline_mode": daily_pipeline_mode,
         "use_source_column_for_valid_dates": use_source_column_for_valid_dates,
         "source_column_for_valid_from_date": source_column_for_valid_from_date,
         "source_column_for_sorting": source_column_for_sorting,
+        "ct_retention_margin_days": ct_retention_margin_days,
+        "ct_retention_archive": ct_retention_archive,
+        "dwh_linked_service": dwh_linked_service,
         "skip_st_table": False,
         "skip_hs_table": False,
-        "skip_main_table": False
+        "skip_main_table": False,
+        # The deployer view normalises the changed configuration again
+        "deployer_config_hash": None
     })
     
-    # Generate SQL button in sidebar
-    if st.button("Generate SQL Script", type="primary"):
+    if generate_sql:
         if not src_table_name or not business_key or (scd2_columns_option == "Specify Columns" and not scd2_columns):
             st.error("Please fill in all required fields: Source Table Name, Business Key, and SCD2 Columns")
         elif not user_initials:
             st.error("Please enter your initials")
         else:
-            # Generate unique timestamp for table names - include both date and time for uniqueness
+            # Unique suffix for the sandbox table names, also between tabs and batch workers generating in the same second
             current_datetime = datetime.now().strftime("%Y%m%d_%H%M%S")
             st.session_state.timestamp = current_datetime
-            st.session_state.table_suffix = f"{user_initials}_{current_datetime}"
+            st.session_state.table_suffix = allocate_table_suffix(user_initials, current_datetime)
             st.session_state.sql_generated = True
             st.success("SQL Generated Successfully! Check the tabs below.") 
\ No newline at end of file
@@ -10,6 +10,9 @@ SOURCE_SYSTEM_OPTIONS = [
     "Replicate_CDC_AllTransactions_fromArchive"
 ]
 
+# Daily source systems reading a Replicate __ct change table
+CDC_SOURCE_SYSTEMS = ["Replicate_CDC", "Replicate_CDC_AllTransactions", "Replicate_CDC_AllTransactions_fromArchive"]
+
 # Default Values
 DEFAULT_VALUES = {
     "source_system_initial": "Replicate_Full",
@@ -23,10 +26,18 @@ DEFAULT_VALUES = {
     "incremental_filter_timezone": "UTC",
     "scd_type": "SCD2",
     "scd2_columns_option": "Specify Columns",
+    "use_partition_switch": False,
     "helper_schema": "DF",
     "src_delete_column": "DELETED_FLAG",
     "src_delete_value": "Y",
+    "hard_delete_batch_size": 50000,
+    "hard_delete_action": "Flag",
+    "ct_retention_margin_days": 7,
+    "ct_retention_archive": False,
+    "dwh_linked_service": "ls_DWH",
     "partitions": 1,
+    "load_priority": 0,
+    "daily_pipeline_mode": "Per Table",
     "use_source_column_for_valid_dates": True,
     "source_column_for_valid_from_date": "header__timestamp",
     "source_column_for_sorting": "header__change_seq",
@@ -34,6 +45,27 @@ DEFAULT_VALUES = {
     "main_table_name": ""
 }
 
+# Parameters that are exported, imported and stored per table configuration
+PARAMETER_KEYS = [
+    "user_initials", "table_suffix",
+    "source_system_initial", "source_system_daily", 
+    "src_schema_name", "src_table_name", 
+    "tgt_schema_name_st", "tgt_table_name_st", 
+    "tgt_schema_name_hs", "tgt_table_name_hs", 
+    "business_key", "primary_key", 
+    "incremental_filter_st", "incremental_filter_hs", "incremental_filter_timezone", 
+    "scd_type", "scd2_columns_option", "scd2_columns", "use_partition_switch", 
+    "delete_type", "src_delete_column", "src_delete_value", "hard_delete_batch_size", "hard_delete_action", 
+    "prescript", "postscript", "partitions", "load_priority", "daily_pipeline_mode", 
+    "use_source_column_for_valid_dates", "source_column_for_valid_from_date", 
+    "source_column_for_sorting", "ct_retention_margin_days", "ct_retention_archive", "dwh_linked_service", 
+    "create_main_table", "main_table_schema", "main_table_name", "main_table_columns", 
+    "create_helper_table", "helper_schema", "business_key_column"
+]
+
+# Version written to exported configurations and manifests
+APP_VERSION = "1.0.0"
+
 # SCD Type Options
 SCD_TYPE_OPTIONS = ["SCD2", "SCD1", "Transaction only", "Trunc Load", "SCD2 from CT"]
 
@@ -43,8 +75,31 @@ SCD2_COLUMNS_OPTIONS = ["Specify Columns", "__allColumns"]
 # Delete Type Options
 DELETE_TYPE_OPTIONS = [None, "SOFT", "HARD"]
 
+# Hard Delete Action Options
+HARD_DELETE_ACTION_OPTIONS = ["Flag", "Delete"]
+
+# Daily Pipeline Mode Options
+DAILY_PIPELINE_MODE_OPTIONS = ["Per Table", "Shared"]
+
 # Timezone Options
 TIMEZONE_OPTIONS = ["UTC", "W. Europe Standard Time"]
 
 # Incremental Filter Options
-INCREMENTAL_FILTER_OPTIONS = ["__fullLoad", "header__timestamp", "Custom"] 
\ No newline at end of file
+INCREMENTAL_FILTER_OPTIONS = ["__fullLoad", "header__timestamp", "Custom"] 
+
+# Local folder and size limit of the generated artifact store
+ARTIFACT_STORE_DIR = ".artifact_store"
+ARTIFACT_STORE_MAX_MB = 200
+
+# Process-wide cache of generator outputs shared by all sessions
+GENERATOR_CACHE_TTL_SECONDS = 3600
+GENERATOR_CACHE_MAX_ENTRIES = 2000
+
+# Scripts longer than CODE_VIEWER_MAX_CHARS are shown in pages, and without highlighting above CODE_VIEWER_HIGHLIGHT_MAX_CHARS
+CODE_VIEWER_PAGE_LINES = 300
+CODE_VIEWER_MAX_CHARS = 30000
+CODE_VIEWER_HIGHLIGHT_MAX_CHARS = 200000
+
+# Weekday peak hours that long initial loads should be scheduled around
+PEAK_START_HOUR = 6
+PEAK_END_HOUR = 18
\ No newline at end of file
@@ -0,0 +1,134 @@
+import asyncio
+import json
+import random
+import urllib.error
+import urllib.request
+
+ADF_API_VERSION = "2018-06-01"
+MANAGEMENT_URL = "https://management.azure.com"
+
+# Pipeline run statuses after which a run no longer changes
+FINISHED_RUN_STATUSES = ["Succeeded", "Failed", "Cancelled"]
+
+# HTTP statuses that are worth retrying
+RETRY_STATUSES = [408, 429, 500, 502, 503, 504]
+
+# Statuses of requests the service rejected before acting on them, the only safe retries of a non-idempotent request
+THROTTLE_STATUSES = [429]
+
+async def urllib_transport(method, url, headers, body):
+    """Send an HTTP request with urllib in a worker thread and return (status, headers, body)"""
+    def send():
+        request = urllib.request.Request(url, data=body, headers=headers, method=method)
+        try:
+            with urllib.request.urlopen(request, timeout=60) as response:
+                return response.status, dict(response.headers), response.read()
+        except urllib.error.HTTPError as e:
+            return e.code, dict(e.headers), e.read()
+
+    return await asyncio.to_thread(send)
+
+class AdfClient:
+    """Asynchronous client for the Azure Data Factory management REST API
+
+    token is a bearer token or a function returning one, for example from azure-identity.
+    transport is an async function (method, url, headers, body) -> (status, headers, body); it defaults
+    to urllib and can be replaced by a stand-in in tests.
+    """
+
+    def __init__(self, subscription_id, resource_group, factory_name, token,
+                 transport=None, max_concurrency=8, max_retries=5, backoff_seconds=1.0):
+        self.factory_url = (
+            f"{MANAGEMENT_URL}/subscriptions/{subscription_id}/resourceGroups/{resource_group}"
+            f"/providers/Microsoft.DataFactory/factories/{factory_name}"
+        )
+        self.token = token
+        self.transport = transport or urllib_transport
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.backoff_seconds = backoff_seconds
+        self._semaphore = None
+        self._semaphore_loop = None
+
+    async def request(self, method, path, payload=None, retry_statuses=RETRY_STATUSES):
+        """Send a request to the factory, retrying throttled and transient failures with backoff
+
+        Non-idempotent requests pass THROTTLE_STATUSES, since a timed out or failed request may still have been carried out.
+        """
+        # Created per event loop, since every asyncio.run call starts a new one
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphore_loop = loop
+
+        url = f"{self.factory_url}/{path}?api-version={ADF_API_VERSION}"
+        token = self.token() if callable(self.token) else self.token
+        headers = {"Authorization": f"Bearer {token}", "Content-Type": "application/json"}
+        body = json.dumps(payload).encode() if payload is not None else None
+
+        for attempt in range(self.max_retries + 1):
+            async with self._semaphore:
+                status, response_headers, response_body = await self.transport(method, url, headers, body)
+
+            if status < 400:
+                return json.loads(response_body) if response_body else {}
+
+            if status not in retry_statuses or attempt == self.max_retries:
+                raise Exception(f"ADF request {method} {path} failed with HTTP {status}: {response_body[:500].decode(errors='replace')}")
+
+            # Honour Retry-After when the service sends it, otherwise back off exponentially with jitter
+            retry_after = {key.lower(): value for key, value in response_headers.items()}.get("retry-after")
+            delay = float(retry_after) if retry_after and retry_after.isdigit() else self.backoff_seconds * 2 ** attempt
+            await asyncio.sleep(delay + random.uniform(0, self.backoff_seconds))
+
+    async def upsert_pipeline(self, pipeline):
+        """Create or update a pipeline from generated pipeline JSON"""
+        await self.request("PUT", f"pipelines/{pipeline['name']}", {"properties": pipeline["properties"]})
+        return pipeline["name"]
+
+    async def upsert_pipelines(self, pipelines):
+        """Create or update many pipelines concurrently and return one result per pipeline"""
+        outcomes = await asyncio.gather(*(self.upsert_pipeline(pipeline) for pipeline in pipelines), return_exceptions=True)
+        return [
+            {"pipeline": pipeline["name"], "status": "FAILED" if isinstance(outcome, Exception) else "SUCCESS",
+             "error": str(outcome) if isinstance(outcome, Exception) else None}
+            for pipeline, outcome in zip(pipelines, outcomes)
+        ]
+
+    async def create_run(self, pipeline_name, parameters=None):
+        """Trigger a pipeline run and return its run ID
+
+        Only throttled requests are retried, so a request that timed out does not start a second run.
+        """
+        response = await self.request("POST", f"pipelines/{pipeline_name}/createRun", parameters or {}, THROTTLE_STATUSES)
+        return response["runId"]
+
+    async def wait_for_run(self, run_id, poll_seconds=10, max_poll_seconds=120, timeout_seconds=24 * 3600):
+        """Poll a pipeline run with growing intervals until it has finished and return its final status"""
+        waited = 0
+        while True:
+            run = await self.request("GET", f"pipelineruns/{run_id}")
+            if run.get("status") in FINISHED_RUN_STATUSES:
+                return run
+            if waited >= timeout_seconds:
+                raise Exception(f"Pipeline run {run_id} did not finish within {timeout_seconds} seconds")
+            await asyncio.sleep(poll_seconds)
+            waited += poll_seconds
+            poll_seconds = min(poll_seconds * 2, max_poll_seconds)
+
+    async def run_pipelines(self, pipeline_names, parameters=None, **poll_options):
+        """Trigger several pipelines concurrently and wait for all of them to finish"""
+        async def run(pipeline_name):
+            run_id = await self.create_run(pipeline_name, parameters)
+            run = await self.wait_for_run(run_id, **poll_options)
+            return {"pipeline": pipeline_name, "run_id": run_id, "status": run["status"], "error": run.get("message") or None}
+
+        outcomes = await asyncio.gather(*(run(name) for name in pipeline_names), return_exceptions=True)
+        return [
+            {"pipeline": name, "run_id": None, "status": "FAILED", "error": str(outcome)} if isinstance(outcome, Exception) else outcome
+            for name, outcome in zip(pipeline_names, outcomes)
+        ]
+
+def deploy_pipelines(client, pipelines):
+    """Upsert generated pipelines from synchronous code, such as the Streamlit app or a batch script"""
+    return asyncio.run(client.upsert_pipelines(pipelines))
@@ -0,0 +1,139 @@
+import hashlib
+import json
+import os
+from src.utils.adf_client import ADF_API_VERSION
+from src.utils.adf_generator import (
+    generate_adf_pipeline_json,
+    generate_ct_retention_pipeline,
+    generate_daily_load_trigger
+)
+from src.config.constants import CDC_SOURCE_SYSTEMS, DEFAULT_VALUES
+from src.utils.sql_generator import get_ct_retention_procedure_name, get_change_table_name
+
+# ARM resource type and git repository folder per ADF object type
+ADF_OBJECT_TYPES = {
+    "pipeline": ("Microsoft.DataFactory/factories/pipelines", "pipeline"),
+    "trigger": ("Microsoft.DataFactory/factories/triggers", "trigger")
+}
+
+def get_adf_object_type(adf_object):
+    """Return whether a generated ADF object is a pipeline or a trigger"""
+    return "trigger" if adf_object["properties"].get("type", "").endswith("Trigger") else "pipeline"
+
+def collect_table_adf_objects(params, table_suffix):
+    """Generate all ADF pipelines and triggers for one table configuration"""
+    src_table_name = params["src_table_name"]
+    source_system_initial = params.get("source_system_initial")
+    source_system_daily = params.get("source_system_daily")
+    shared_daily = params.get("daily_pipeline_mode") == "Shared"
+
+    adf_objects = [
+        generate_adf_pipeline_json(src_table_name, table_suffix, True, True, False, source_system_initial, source_system_daily),
+        generate_adf_pipeline_json(src_table_name, table_suffix, True, False, False, source_system_initial, source_system_daily),
+        generate_adf_pipeline_json(src_table_name, table_suffix, True, False, True, source_system_initial, source_system_daily),
+        generate_adf_pipeline_json(src_table_name, table_suffix, False, False, False, source_system_initial, source_system_daily,
+                                   shared_daily, params.get("delete_type"))
+    ]
+    if shared_daily:
+        adf_objects.append(generate_daily_load_trigger(source_system_initial, source_system_daily))
+    if source_system_daily in CDC_SOURCE_SYSTEMS:
+        change_table_name = get_change_table_name(params.get("src_table_name_ct") or src_table_name)
+        adf_objects.append(generate_ct_retention_pipeline(
+            change_table_name, get_ct_retention_procedure_name(change_table_name),
+            linked_service_name=params.get("dwh_linked_service") or DEFAULT_VALUES["dwh_linked_service"]
+        ))
+    return adf_objects
+
+def deduplicate_adf_objects(adf_objects):
+    """Drop repeated objects with the same name, such as a shared daily pipeline generated for many tables"""
+    unique_objects = {}
+    for adf_object in adf_objects:
+        unique_objects.setdefault(adf_object["name"], adf_object)
+    return list(unique_objects.values())
+
+def serialize_adf_object(adf_object):
+    """Serialize an ADF object the way ADF Studio writes it to the git repository"""
+    return json.dumps(adf_object, indent=4)
+
+def content_hash(content):
+    """Return the SHA-256 hash of a text"""
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+def write_git_layout(adf_objects, repo_folder):
+    """Write ADF objects into the folders of an ADF git repository, skipping files whose content is unchanged
+
+    Returns one result per object with the status CREATED, UPDATED or UNCHANGED.
+    """
+    results = []
+    for adf_object in deduplicate_adf_objects(adf_objects):
+        folder = os.path.join(repo_folder, ADF_OBJECT_TYPES[get_adf_object_type(adf_object)][1])
+        path = os.path.join(folder, f"{adf_object['name']}.json")
+        content = serialize_adf_object(adf_object)
+
+        status = "CREATED"
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                if content_hash(f.read()) == content_hash(content):
+                    results.append({"name": adf_object["name"], "path": path, "status": "UNCHANGED"})
+                    continue
+            status = "UPDATED"
+
+        try:
+            os.makedirs(folder, exist_ok=True)
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(content)
+        except Exception as e:
+            raise Exception(f"Error writing {path}: {str(e)}")
+        results.append({"name": adf_object["name"], "path": path, "status": status})
+
+    return results
+
+def generate_arm_template(adf_objects):
+    """Generate one ARM template deploying all ADF objects to the factory given as parameter"""
+    adf_objects = deduplicate_adf_objects(adf_objects)
+    names = {adf_object["name"] for adf_object in adf_objects}
+
+    resources = []
+    for adf_object in adf_objects:
+        resource_type = ADF_OBJECT_TYPES[get_adf_object_type(adf_object)][0]
+        # Pipelines and triggers in the same template have to be deployed before the objects referencing them
+        depends_on = [
+            f"[concat(variables('factoryId'), '/pipelines/{reference}')]"
+            for reference in sorted(find_pipeline_references(adf_object["properties"]) & names)
+            if reference != adf_object["name"]
+        ]
+        resources.append({
+            "name": f"[concat(parameters('factoryName'), '/{adf_object['name']}')]",
+            "type": resource_type,
+            "apiVersion": ADF_API_VERSION,
+            "properties": adf_object["properties"],
+            "dependsOn": depends_on
+        })
+
+    return {
+        "$schema": "http://schema.management.azure.com/schemas/2015-01-01/deploymentTemplate.json#",
+        "contentVersion": "1.0.0.0",
+        "parameters": {
+            "factoryName": {
+                "type": "string",
+                "metadata": "Data Factory name"
+            }
+        },
+        "variables": {
+            "factoryId": "[concat('Microsoft.DataFactory/factories/', parameters('factoryName'))]"
+        },
+        "resources": resources
+    }
+
+def find_pipeline_references(value):
+    """Return the names of all pipelines referenced anywhere in an ADF object"""
+    references = set()
+    if isinstance(value, dict):
+        if value.get("type") == "PipelineReference" and isinstance(value.get("referenceName"), str):
+            references.add(value["referenceName"])
+        for item in value.values():
+            references |= find_pipeline_references(item)
+    elif isinstance(value, list):
+        for item in value:
+            references |= find_pipeline_references(item)
+    return references
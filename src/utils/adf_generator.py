@@ -1,6 +1,6 @@
 import json
 
-def generate_adf_pipeline_json(src_table_name, table_suffix, is_initial_load=True, is_invalid_hs=False, is_placeholder=False, source_system_initial=None, source_system_daily=None):
+def generate_adf_pipeline_json(src_table_name, table_suffix, is_initial_load=True, is_invalid_hs=False, is_placeholder=False, source_system_initial=None, source_system_daily=None, shared_daily=False, delete_type=None):
     """Generate ADF pipeline JSON for either initial or daily load"""
     if is_placeholder:
         return generate_st_placeholder_pipeline(src_table_name, table_suffix, source_system_initial)
@@ -8,8 +8,10 @@ def generate_adf_pipeline_json(src_table_name, table_suffix, is_initial_load=Tru
         return generate_invalid_hs_pipeline(src_table_name, table_suffix, source_system_initial)
     elif is_initial_load:
         return generate_initial_load_pipeline(src_table_name, table_suffix, source_system_initial)
+    elif shared_daily:
+        return generate_shared_daily_load_pipeline(source_system_initial, source_system_daily)
     else:
-        return generate_daily_load_pipeline(src_table_name, table_suffix, source_system_initial, source_system_daily)
+        return generate_daily_load_pipeline(src_table_name, table_suffix, source_system_initial, source_system_daily, delete_type)
 
 def generate_st_placeholder_pipeline(src_table_name, table_suffix, source_system_initial=None):
     """Generate ADF pipeline JSON that uses ST_Placeholder to only run the HS part"""
@@ -190,148 +192,251 @@ def generate_initial_load_pipeline(src_table_name, table_suffix, source_system_i
         }
     }
 
-def generate_daily_load_pipeline(src_table_name, table_suffix, source_system_initial=None, source_system_daily=None):
+def generate_daily_load_pipeline(src_table_name, table_suffix, source_system_initial=None, source_system_daily=None, delete_type=None):
     """Generate ADF pipeline JSON for daily load"""
     # Sanitize the table name to ensure no invalid characters
     sanitized_table_name = src_table_name.replace(" ", "_").replace("-", "_")
     pipeline_name = f"pl_StageAndHistoricStageDailyLoad_{sanitized_table_name}"
     
     # Determine correct job names based on source system
+    st_job_name, hs_job_name, hs_control_job = get_daily_load_job_names(source_system_initial, source_system_daily)
+    
+    return {
+        "name": pipeline_name,
+        "properties": {
+            "activities": build_daily_load_activities(st_job_name, hs_job_name, hs_control_job, bool(delete_type)),
+            "folder": {
+                "name": "Scheduling"
+            },
+            "annotations": []
+        }
+    }
+
+def get_daily_load_job_names(source_system_initial=None, source_system_daily=None):
+    """Return the ST, HS and HS control job names used by the daily load"""
     st_job_name = "ST_Profisee_Daily" if source_system_daily and "Profisee_dev" in source_system_daily else "ST_Full_Daily"
     hs_job_name = "HS_Profisee_Daily" if source_system_initial and "Profisee_dev" in source_system_initial else "HS_Full_Daily"
     hs_control_job = "HS_Profisee_Daily_Control" if source_system_initial and "Profisee_dev" in source_system_initial else "HS_Full_Daily_Control"
+    return st_job_name, hs_job_name, hs_control_job
+
+def build_daily_load_activities(st_job_name, hs_job_name, hs_control_job, run_deletes=False):
+    """Build the activities of the daily load pipeline from the table configuration
+
+    The job names are either fixed names or ADF expressions referring to pipeline parameters. The delete
+    activities are only active when run_deletes is set, and the BK preload stays inactive as before. The BK
+    preload does not depend on the deletes, so both branches start after the daily load.
+    """
+    daily_load = [{"activity": "Daily_Stage_and_HS", "dependencyConditions": ["Succeeded"]}]
+    
+    return [
+        build_execute_pipeline_activity("Daily_Stage_and_HS", "pl_framework_StageAndHSLoop", [], {
+            "pStopDate": {
+                "value": "@formatDateTime(addDays(utcNow(),1),'yyyy-MM-dd HH:mm:ss')",
+                "type": "Expression"
+            },
+            "pSTJob": st_job_name,
+            "pHSJob": hs_job_name,
+            "pJobControlSchema": "DWH",
+            "pJobControlTable": "JOB_CONTROL",
+            "pSTTablesControlSchema": "DWH",
+            "pSTTablesControlTable": "CONTROL_TABLE_STAGE",
+            "pHSTablesControlSchema": "DWH",
+            "pHSTablesControlTable": "CONTROL_TABLE_HS",
+            "pLoopJob": hs_control_job,
+            "pLogSchema": "DWH",
+            "pLogTableJobLevel": "JOB_LOG",
+            "pLogTableTableLevel": "JOB_TABLES_LOG",
+            "pIntialLoad": False
+        }),
+        build_execute_pipeline_activity("Stage_Deletes", "pl_framework_StageDeleteLoop", daily_load, {
+            "pJobName": st_job_name,
+            "pDataControlTable": "CONTROL_TABLE_STAGE",
+            "pDataControlSchema": "DWH"
+        }, active=run_deletes),
+        build_execute_pipeline_activity("Update_Delete_flags", "pl_framework_UpdateDeleteFlag", [
+            {"activity": "Stage_Deletes", "dependencyConditions": ["Succeeded"]}
+        ], {
+            "pJobName": hs_job_name,
+            "pDataControlTable": "CONTROL_TABLE_HS",
+            "pDataControlSchema": "DWH",
+            "pStageControlTable": "CONTROL_TABLE_STAGE",
+            "pStageControlSchema": "DWH",
+            "pStageJobName": st_job_name
+        }, active=run_deletes),
+        build_execute_pipeline_activity("BK_preload", "pl_BKPreload_Test", daily_load, active=False)
+    ]
+
+def build_execute_pipeline_activity(name, pipeline_name, depends_on, parameters=None, active=True):
+    """Build an ExecutePipeline activity that waits for the child pipeline
+
+    Inactive activities are marked as succeeded so the activities depending on them still run.
+    """
+    activity = {
+        "name": name,
+        "type": "ExecutePipeline"
+    }
+    if not active:
+        activity["state"] = "Inactive"
+        activity["onInactiveMarkAs"] = "Succeeded"
+    
+    # ExecutePipeline activities only support secureInput, timeouts and retries belong to the child pipeline activities
+    activity.update({
+        "dependsOn": depends_on,
+        "policy": {
+            "secureInput": False
+        },
+        "userProperties": [],
+        "typeProperties": {
+            "pipeline": {
+                "referenceName": pipeline_name,
+                "type": "PipelineReference"
+            },
+            "waitOnCompletion": True
+        }
+    })
+    if parameters is not None:
+        activity["typeProperties"]["parameters"] = parameters
+    return activity
+
+def generate_shared_daily_load_pipeline(source_system_initial=None, source_system_daily=None):
+    """Generate one parameterised daily load pipeline shared by all tables of the same jobs"""
+    st_job_name, hs_job_name, hs_control_job = get_daily_load_job_names(source_system_initial, source_system_daily)
+    pipeline_name = get_shared_daily_load_pipeline_name(source_system_initial, source_system_daily)
     
     return {
         "name": pipeline_name,
         "properties": {
-            "activities": [
-                {
-                    "name": "Daily_Stage_and_HS",
-                    "type": "ExecutePipeline",
-                    "dependsOn": [],
-                    "policy": {
-                        "secureInput": False
-                    },
-                    "userProperties": [],
-                    "typeProperties": {
-                        "pipeline": {
-                            "referenceName": "pl_framework_StageAndHSLoop",
-                            "type": "PipelineReference"
-                        },
-                        "waitOnCompletion": True,
-                        "parameters": {
-                            "pStopDate": {
-                                "value": "@formatDateTime(addDays(utcNow(),1),'yyyy-MM-dd HH:mm:ss')",
-                                "type": "Expression"
-                            },
-                            "pSTJob": st_job_name,
-                            "pHSJob": hs_job_name,
-                            "pJobControlSchema": "DWH",
-                            "pJobControlTable": "JOB_CONTROL",
-                            "pSTTablesControlSchema": "DWH",
-                            "pSTTablesControlTable": "CONTROL_TABLE_STAGE",
-                            "pHSTablesControlSchema": "DWH",
-                            "pHSTablesControlTable": "CONTROL_TABLE_HS",
-                            "pLoopJob": hs_control_job,
-                            "pLogSchema": "DWH",
-                            "pLogTableJobLevel": "JOB_LOG",
-                            "pLogTableTableLevel": "JOB_TABLES_LOG",
-                            "pIntialLoad": False
-                        }
-                    }
+            # The delete loops work on all tables of the jobs that have a delete type, so they always run for a shared pipeline
+            "activities": build_daily_load_activities(
+                {"value": "@pipeline().parameters.pSTJob", "type": "Expression"},
+                {"value": "@pipeline().parameters.pHSJob", "type": "Expression"},
+                {"value": "@pipeline().parameters.pLoopJob", "type": "Expression"},
+                run_deletes=True
+            ),
+            "parameters": {
+                "pSTJob": {
+                    "type": "string",
+                    "defaultValue": st_job_name
                 },
+                "pHSJob": {
+                    "type": "string",
+                    "defaultValue": hs_job_name
+                },
+                "pLoopJob": {
+                    "type": "string",
+                    "defaultValue": hs_control_job
+                }
+            },
+            "folder": {
+                "name": "Scheduling"
+            },
+            "annotations": [
+                "Shared daily load pipeline. The framework loop loads every table configured for the jobs in the parameters"
+            ]
+        }
+    }
+
+def get_shared_daily_load_pipeline_name(source_system_initial=None, source_system_daily=None):
+    """Return the name of the shared daily load pipeline for the jobs of a source system"""
+    st_job_name, hs_job_name, hs_control_job = get_daily_load_job_names(source_system_initial, source_system_daily)
+    return f"pl_StageAndHistoricStageDailyLoad_{st_job_name}_{hs_job_name}"
+
+def generate_daily_load_trigger(source_system_initial=None, source_system_daily=None, hour=2, minute=0, time_zone="W. Europe Standard Time"):
+    """Generate ADF schedule trigger JSON that runs the shared daily load pipeline once a day"""
+    st_job_name, hs_job_name, hs_control_job = get_daily_load_job_names(source_system_initial, source_system_daily)
+    pipeline_name = get_shared_daily_load_pipeline_name(source_system_initial, source_system_daily)
+    
+    return {
+        "name": f"tr_DailyLoad_{st_job_name}_{hs_job_name}",
+        "properties": {
+            "annotations": [],
+            "runtimeState": "Stopped",
+            "pipelines": [
                 {
-                    "name": "Stage_Deletes",
-                    "type": "ExecutePipeline",
-                    "state": "Inactive",
-                    "onInactiveMarkAs": "Succeeded",
-                    "dependsOn": [
-                        {
-                            "activity": "Daily_Stage_and_HS",
-                            "dependencyConditions": [
-                                "Succeeded"
-                            ]
-                        }
-                    ],
-                    "policy": {
-                        "secureInput": False
+                    "pipelineReference": {
+                        "referenceName": pipeline_name,
+                        "type": "PipelineReference"
                     },
-                    "userProperties": [],
-                    "typeProperties": {
-                        "pipeline": {
-                            "referenceName": "pl_framework_StageDeleteLoop",
-                            "type": "PipelineReference"
-                        },
-                        "waitOnCompletion": True,
-                        "parameters": {
-                            "pJobName": st_job_name,
-                            "pDataControlTable": "CONTROL_TABLE_STAGE",
-                            "pDataControlSchema": "DWH"
-                        }
+                    "parameters": {
+                        "pSTJob": st_job_name,
+                        "pHSJob": hs_job_name,
+                        "pLoopJob": hs_control_job
                     }
-                },
+                }
+            ],
+            "type": "ScheduleTrigger",
+            "typeProperties": {
+                "recurrence": {
+                    "frequency": "Day",
+                    "interval": 1,
+                    "startTime": "2024-01-01T00:00:00",
+                    "timeZone": time_zone,
+                    "schedule": {
+                        "minutes": [minute],
+                        "hours": [hour]
+                    }
+                }
+            }
+        }
+    }
+
+def generate_daily_load_parameter_file(src_table_name, source_system_initial=None, source_system_daily=None):
+    """Generate the per-table parameter file that records which shared daily pipeline loads a table"""
+    st_job_name, hs_job_name, hs_control_job = get_daily_load_job_names(source_system_initial, source_system_daily)
+    
+    return {
+        "table": src_table_name,
+        "pipeline": get_shared_daily_load_pipeline_name(source_system_initial, source_system_daily),
+        "parameters": {
+            "pSTJob": st_job_name,
+            "pHSJob": hs_job_name,
+            "pLoopJob": hs_control_job
+        }
+    }
+
+def generate_ct_retention_pipeline(src_table_name_ct, procedure_name, batch_size=50000, linked_service_name="ls_DWH"):
+    """Generate ADF pipeline JSON that runs the change table retention procedure"""
+    # Sanitize the table name to ensure no invalid characters
+    sanitized_table_name = src_table_name_ct.replace(" ", "_").replace("-", "_")
+    pipeline_name = f"pl_CTRetention_{sanitized_table_name}"
+    
+    return {
+        "name": pipeline_name,
+        "properties": {
+            "activities": [
                 {
-                    "name": "Update_Delete_flags",
-                    "type": "ExecutePipeline",
-                    "state": "Inactive",
-                    "onInactiveMarkAs": "Succeeded",
-                    "dependsOn": [
-                        {
-                            "activity": "Stage_Deletes",
-                            "dependencyConditions": [
-                                "Succeeded"
-                            ]
-                        }
-                    ],
+                    "name": "CT_Retention",
+                    "type": "SqlServerStoredProcedure",
+                    "dependsOn": [],
                     "policy": {
+                        "timeout": "0.12:00:00",
+                        "retry": 0,
+                        "retryIntervalInSeconds": 30,
+                        "secureOutput": False,
                         "secureInput": False
                     },
                     "userProperties": [],
                     "typeProperties": {
-                        "pipeline": {
-                            "referenceName": "pl_framework_UpdateDeleteFlag",
-                            "type": "PipelineReference"
-                        },
-                        "waitOnCompletion": True,
-                        "parameters": {
-                            "pJobName": hs_job_name,
-                            "pDataControlTable": "CONTROL_TABLE_HS",
-                            "pDataControlSchema": "DWH",
-                            "pStageControlTable": "CONTROL_TABLE_STAGE",
-                            "pStageControlSchema": "DWH",
-                            "pStageJobName": st_job_name
+                        "storedProcedureName": f"[DWH].[{procedure_name}]",
+                        "storedProcedureParameters": {
+                            "batch_size": {
+                                "value": batch_size,
+                                "type": "Int32"
+                            }
                         }
-                    }
-                },
-                {
-                    "name": "BK_preload",
-                    "type": "ExecutePipeline",
-                    "state": "Inactive",
-                    "onInactiveMarkAs": "Succeeded",
-                    "dependsOn": [
-                        {
-                            "activity": "Update_Delete_flags",
-                            "dependencyConditions": [
-                                "Succeeded"
-                            ]
-                        }
-                    ],
-                    "policy": {
-                        "secureInput": False
                     },
-                    "userProperties": [],
-                    "typeProperties": {
-                        "pipeline": {
-                            "referenceName": "pl_BKPreload_Test",
-                            "type": "PipelineReference"
-                        },
-                        "waitOnCompletion": True
+                    "linkedServiceName": {
+                        "referenceName": linked_service_name,
+                        "type": "LinkedServiceReference"
                     }
                 }
             ],
             "folder": {
                 "name": "Scheduling"
             },
-            "annotations": []
+            "annotations": [
+                "Removes change table rows already processed by the daily ST and HS loads",
+                "Schedule outside the daily load window"
+            ]
         }
-    } 
\ No newline at end of file
+    }
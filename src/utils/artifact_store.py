@@ -0,0 +1,154 @@
+import hashlib
+import json
+import os
+import tempfile
+from src.config.constants import ARTIFACT_STORE_DIR, ARTIFACT_STORE_MAX_MB
+
+# Modules whose code determines the generated artifacts, relative to src/
+GENERATOR_MODULES = ["utils/sql_generator.py", "utils/adf_generator.py", "components/main_content.py"]
+
+_generator_fingerprint = None
+
+def get_generator_fingerprint():
+    """Return a hash of the generator code, so artifacts of older generator versions are not reused"""
+    global _generator_fingerprint
+    if _generator_fingerprint is None:
+        digest = hashlib.sha256()
+        for module in GENERATOR_MODULES:
+            with open(os.path.join(os.path.dirname(os.path.dirname(__file__)), module), "rb") as f:
+                digest.update(f.read())
+        _generator_fingerprint = digest.hexdigest()
+    return _generator_fingerprint
+
+def get_params_hash(params, table_suffix, view):
+    """Return the canonical hash of a table configuration and the view generating its artifacts"""
+    canonical = json.dumps(
+        {"params": params, "table_suffix": table_suffix, "view": view, "generator": get_generator_fingerprint()},
+        sort_keys=True, separators=(",", ":"), default=str
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+def write_atomic(path, data):
+    """Write a file through a temporary file, so concurrent readers never see a partial file"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path))
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(temp_path, path)
+    except Exception:
+        os.remove(temp_path)
+        raise
+
+def remove_file(path):
+    """Remove a file that another process may already have removed"""
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+class ArtifactStore:
+    """Content-addressed store for generated scripts shared by sessions, batch runs and server restarts
+
+    Each artifact is stored once under the hash of its content in objects/. Entries in entries/ map a
+    configuration hash to the content hashes of its named artifacts. When the objects exceed max_bytes, the
+    least recently used entries are removed together with the objects no other entry refers to.
+    """
+
+    def __init__(self, root=ARTIFACT_STORE_DIR, max_bytes=ARTIFACT_STORE_MAX_MB * 1024 * 1024):
+        self.root = root
+        self.max_bytes = max_bytes
+
+    def object_path(self, content_hash):
+        """Return the path of a stored artifact"""
+        return os.path.join(self.root, "objects", content_hash[:2], content_hash)
+
+    def entry_path(self, params_hash):
+        """Return the path of the entry for a configuration hash"""
+        return os.path.join(self.root, "entries", f"{params_hash}.json")
+
+    def get(self, params_hash):
+        """Return the artifacts stored for a configuration hash, or None"""
+        try:
+            with open(self.entry_path(params_hash), "r", encoding="utf-8") as f:
+                entry = json.load(f)
+            artifacts = {}
+            for name, content_hash in entry.items():
+                with open(self.object_path(content_hash), "r", encoding="utf-8") as f:
+                    artifacts[name] = f.read()
+            # The entry modification time is its last use for eviction
+            os.utime(self.entry_path(params_hash))
+        except (OSError, ValueError):
+            # Missing or evicted artifacts are regenerated
+            return None
+        return artifacts
+
+    def put(self, params_hash, artifacts):
+        """Store named artifacts for a configuration hash and evict old entries when the store is too large"""
+        try:
+            entry = {}
+            for name, content in artifacts.items():
+                data = content.encode("utf-8")
+                content_hash = hashlib.sha256(data).hexdigest()
+                # Identical artifacts of different configurations are stored once
+                if not os.path.exists(self.object_path(content_hash)):
+                    write_atomic(self.object_path(content_hash), data)
+                entry[name] = content_hash
+            write_atomic(self.entry_path(params_hash), json.dumps(entry).encode("utf-8"))
+            self.evict()
+        except Exception as e:
+            raise Exception(f"Error storing artifacts: {str(e)}")
+
+    def evict(self):
+        """Remove the least recently used entries until the stored objects fit into max_bytes"""
+        objects = {}
+        for folder, _, files in os.walk(os.path.join(self.root, "objects")):
+            for file_name in files:
+                objects[file_name] = os.path.getsize(os.path.join(folder, file_name))
+        if sum(objects.values()) <= self.max_bytes:
+            return
+
+        entries = []
+        entries_folder = os.path.join(self.root, "entries")
+        for file_name in os.listdir(entries_folder):
+            path = os.path.join(entries_folder, file_name)
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    entries.append((os.path.getmtime(path), path, set(json.load(f).values())))
+            except (OSError, ValueError):
+                # Removed or being replaced by another process
+                continue
+        entries.sort()
+
+        referenced = {}
+        for _, _, content_hashes in entries:
+            for content_hash in content_hashes:
+                referenced[content_hash] = referenced.get(content_hash, 0) + 1
+
+        total_bytes = sum(objects.values())
+        for _, path, content_hashes in entries:
+            if total_bytes <= self.max_bytes:
+                break
+            remove_file(path)
+            for content_hash in content_hashes:
+                referenced[content_hash] -= 1
+                if referenced[content_hash] == 0 and content_hash in objects:
+                    remove_file(self.object_path(content_hash))
+                    total_bytes -= objects[content_hash]
+
+_default_store = None
+
+def get_artifact_store():
+    """Return the artifact store shared by all sessions of the server process"""
+    global _default_store
+    if _default_store is None:
+        _default_store = ArtifactStore()
+    return _default_store
+
+def get_or_generate(store, params_hash, generate):
+    """Return the stored artifacts for a configuration hash, generating and storing them on a miss"""
+    artifacts = store.get(params_hash)
+    if artifacts is None:
+        artifacts = generate()
+        store.put(params_hash, artifacts)
+    return artifacts
@@ -0,0 +1,130 @@
+import io
+import pandas as pd
+from src.config.constants import DEFAULT_VALUES, PARAMETER_KEYS
+
+# Spreadsheet column names mapped to the parameter names
+DEFINITION_COLUMN_ALIASES = {
+    "schema": "src_schema_name",
+    "source_schema": "src_schema_name",
+    "table": "src_table_name",
+    "table_name": "src_table_name",
+    "source_table": "src_table_name",
+    "bk": "business_key",
+    "business_keys": "business_key",
+    "scd": "scd_type",
+    "source_system": "source_system_initial",
+}
+
+REQUIRED_DEFINITION_COLUMNS = ["src_table_name", "business_key"]
+
+# Parameters converted from spreadsheet text
+BOOLEAN_PARAMETER_KEYS = [
+    "create_main_table", "create_helper_table", "use_partition_switch",
+    "use_source_column_for_valid_dates", "ct_retention_archive"
+]
+INTEGER_PARAMETER_KEYS = ["partitions", "load_priority", "hard_delete_batch_size", "ct_retention_margin_days"]
+
+def read_table_definitions(file_name, data):
+    """Read a CSV or Excel sheet of table definitions into a DataFrame with parameter column names"""
+    try:
+        if file_name.lower().endswith((".xlsx", ".xls")):
+            try:
+                definitions_df = pd.read_excel(io.BytesIO(data), dtype=str)
+            except ImportError:
+                raise Exception("Reading Excel files requires the openpyxl package. Install it with 'pip install openpyxl'.")
+        else:
+            definitions_df = pd.read_csv(io.BytesIO(data), dtype=str)
+
+        # Normalise the column names so sheets with slightly different headers can be used
+        definitions_df.columns = [str(column).strip().lower().replace(" ", "_") for column in definitions_df.columns]
+        definitions_df = definitions_df.rename(columns=DEFINITION_COLUMN_ALIASES)
+        definitions_df = definitions_df.loc[:, ~definitions_df.columns.duplicated()]
+
+        missing_columns = [column for column in REQUIRED_DEFINITION_COLUMNS if column not in definitions_df.columns]
+        if missing_columns:
+            raise ValueError(f"missing columns: {', '.join(missing_columns)}")
+
+        # Strip cells and treat empty cells as missing
+        for column in definitions_df.columns:
+            definitions_df[column] = definitions_df[column].str.strip().replace("", None)
+        return definitions_df.dropna(subset=["src_table_name"]).reset_index(drop=True)
+    except Exception as e:
+        raise Exception(f"Error reading table definitions: {str(e)}")
+
+def to_bool(column):
+    """Convert a column of spreadsheet values such as Y, yes, true or 1 to booleans"""
+    return column.fillna("").astype(str).str.strip().str.lower().isin(["y", "yes", "true", "1", "x"])
+
+def derive_table_parameters(definitions_df):
+    """Derive the dependent parameters of all table definitions with column operations
+
+    Returns a DataFrame with one column per parameter, in the same order as the definitions.
+    """
+    params_df = definitions_df.copy()
+    if "scd2_columns" not in params_df.columns:
+        params_df["scd2_columns"] = None
+    specify_columns = params_df["scd2_columns_option"] == "Specify Columns" if "scd2_columns_option" in params_df.columns else False
+
+    # Defaults for everything the sheet does not specify
+    for key, value in DEFAULT_VALUES.items():
+        if key not in params_df.columns:
+            params_df[key] = value
+        else:
+            params_df[key] = params_df[key].where(params_df[key].notna(), value)
+    for key in BOOLEAN_PARAMETER_KEYS:
+        if key in params_df.columns:
+            params_df[key] = to_bool(params_df[key])
+        else:
+            params_df[key] = DEFAULT_VALUES.get(key, False)
+    for key in INTEGER_PARAMETER_KEYS:
+        params_df[key] = pd.to_numeric(params_df[key], errors="coerce").fillna(DEFAULT_VALUES[key]).astype(int)
+
+    # Tables without SCD2 columns track all columns, unless the sheet explicitly asks for specified columns
+    has_scd2_columns = params_df["scd2_columns"].notna() & (params_df["scd2_columns"] != "__allColumns")
+    all_columns = ~has_scd2_columns & ~specify_columns
+    params_df["scd2_columns_option"] = params_df["scd2_columns_option"].mask(has_scd2_columns, "Specify Columns").mask(all_columns, "__allColumns")
+    params_df["scd2_columns"] = params_df["scd2_columns"].mask(all_columns, "__allColumns").fillna("")
+
+    src_table_name = params_df["src_table_name"]
+
+    # Profisee sources always use Profisee_dev and the ST_PRO_/HS_PRO_ table names
+    is_profisee = params_df["source_system_initial"].str.contains("Profisee", na=False)
+    params_df["source_system_initial"] = params_df["source_system_initial"].mask(is_profisee, "Profisee_dev")
+    params_df["source_system_daily"] = params_df["source_system_daily"].mask(
+        is_profisee & params_df["source_system_daily"].str.contains("Profisee", na=False), "Profisee_dev"
+    )
+    st_prefix = pd.Series("ST_", index=params_df.index).mask(is_profisee, "ST_PRO_")
+    hs_prefix = pd.Series("HS_", index=params_df.index).mask(is_profisee, "HS_PRO_")
+    for key, derived in [("tgt_table_name_st", st_prefix + src_table_name), ("tgt_table_name_hs", hs_prefix + src_table_name)]:
+        if key in params_df.columns:
+            params_df[key] = params_df[key].where(params_df[key].notna() & ~is_profisee, derived)
+        else:
+            params_df[key] = derived
+
+    # Replicate_CDC tables read their daily changes from the __ct table
+    params_df["src_table_name_ct"] = src_table_name.mask(params_df["source_system_daily"] == "Replicate_CDC", src_table_name + "__ct")
+
+    # Dimension and helper table names use the table name without its prefix, as the SQL generators do
+    base_table_name = src_table_name.str.split("_", n=1).str[-1].str.upper()
+    main_table_name = params_df["main_table_name"].where(params_df["main_table_name"].astype(bool), "DIM_" + base_table_name)
+    params_df["main_table_name"] = main_table_name.where(params_df["create_main_table"], "")
+    params_df["helper_table_name"] = ("HLP_BK_DIM_" + base_table_name).where(params_df["create_helper_table"], "")
+
+    return params_df
+
+def get_parameter_sets(params_df):
+    """Return the derived parameters as parameter sets ready for the generators or a manifest"""
+    columns = [key for key in PARAMETER_KEYS + ["src_table_name_ct"] if key in params_df.columns]
+    records_df = params_df[columns].astype(object).where(params_df[columns].notna(), None)
+    return records_df.to_dict("records")
+
+def get_invalid_definitions(params_df):
+    """Return the definitions that cannot be generated, with the reason"""
+    errors = [
+        (params_df["business_key"].isna(), "missing business_key"),
+        ((params_df["scd2_columns_option"] == "Specify Columns") & (params_df["scd2_columns"] == ""), "missing scd2_columns"),
+    ]
+    return pd.concat([
+        pd.DataFrame({"src_table_name": params_df.loc[mask, "src_table_name"], "error": error})
+        for mask, error in errors
+    ]).sort_index()
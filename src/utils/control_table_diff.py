@@ -0,0 +1,272 @@
+import pandas as pd
+from src.config.constants import DEFAULT_VALUES
+from src.utils.sql_generator import get_trunc_load_switch_table_names, get_trunc_load_switch_procedure_name
+
+# Columns identifying a row of each control table
+CONTROL_TABLE_KEYS = {
+    "CONTROL_TABLE_STAGE": ["job_name", "tgt_schema_name", "tgt_table_name"],
+    "CONTROL_TABLE_HS": ["src_schema_name", "src_table_name"],
+}
+
+# Columns written without quotes
+NUMERIC_CONTROL_COLUMNS = ["skip", "priority", "partitions", "use_source_column_for_valid_dates"]
+
+# Columns the generated scripts only set when the configuration has a value
+OPTIONAL_CONTROL_COLUMNS = ["source_column_for_sorting"]
+
+# Table names per IN list of a generated UPDATE
+UPDATE_BATCH_SIZE = 500
+
+def get_table_config(params):
+    """Return a table configuration with the defaults and derived names the generators use for missing parameters
+
+    Manifest lines only need src_table_name and business_key, so both control table rows are built from this.
+    """
+    config = {**DEFAULT_VALUES, **{key: value for key, value in params.items() if value is not None}}
+    src_table_name = config["src_table_name"]
+    config["tgt_table_name_st"] = config.get("tgt_table_name_st") or f"ST_{src_table_name}"
+    config["tgt_table_name_hs"] = config.get("tgt_table_name_hs") or f"HS_{src_table_name}"
+    if not config.get("src_table_name_ct"):
+        config["src_table_name_ct"] = f"{src_table_name}__ct" if config["source_system_daily"] == "Replicate_CDC" else src_table_name
+
+    # The sidebar clears the options that do not apply, so their defaults are never written
+    if config.get("delete_type") != "SOFT":
+        config["src_delete_column"] = None
+        config["src_delete_value"] = None
+    if config.get("scd_type") != "SCD2 from CT":
+        config["use_source_column_for_valid_dates"] = False
+        config["source_column_for_sorting"] = ""
+    if not config.get("use_source_column_for_valid_dates"):
+        config["source_column_for_valid_from_date"] = ""
+    return config
+
+def get_table_key(params):
+    """Return the source schema and table identifying a table configuration"""
+    return f"{params.get('src_schema_name')}.{params['src_table_name']}"
+
+def get_st_control_rows(params):
+    """Return the CONTROL_TABLE_STAGE rows the generated scripts write for a configuration from get_table_config"""
+    source_system_initial = params.get("source_system_initial")
+    source_system_daily = params.get("source_system_daily")
+    is_profisee = bool(source_system_initial and "Profisee_dev" in source_system_initial)
+    src_table_name_ct = params["src_table_name_ct"]
+
+    common = {
+        "src_schema_name": params.get("src_schema_name"),
+        "tgt_schema_name": params.get("tgt_schema_name_st"),
+        "tgt_table_name": f"ST_PRO_{params['src_table_name']}" if is_profisee else params.get("tgt_table_name_st"),
+        "business_key": params.get("business_key"),
+        "initial_load_valid_from_column": "__lowDate",
+        "incremental_filter_column": params.get("incremental_filter_st"),
+        "incremental_filter_column_timezone": params.get("incremental_filter_timezone"),
+        "skip": 0,
+        "priority": params.get("load_priority", 0),
+        "delete_type": params.get("delete_type"),
+        "src_delete_column": params.get("src_delete_column"),
+        "src_delete_value": params.get("src_delete_value"),
+    }
+    return [
+        {"job_name": "ST_Profisee_Initial" if is_profisee else "ST_Full_Initial", "source_system": source_system_initial,
+         "src_table_name": params["src_table_name"], **common},
+        {"job_name": "ST_Profisee_Daily" if source_system_daily and "Profisee_dev" in source_system_daily else "ST_Full_Daily",
+         "source_system": source_system_daily, "src_table_name": src_table_name_ct, **common},
+    ]
+
+def get_hs_control_row(params):
+    """Return the CONTROL_TABLE_HS row the generated scripts write for a configuration from get_table_config"""
+    source_system_initial = params.get("source_system_initial")
+    is_profisee = bool(source_system_initial and "Profisee_dev" in source_system_initial)
+    tgt_schema_name_hs = params.get("tgt_schema_name_hs")
+    if is_profisee:
+        src_table_name = f"ST_PRO_{params['src_table_name']}"
+        tgt_table_name_hs = f"HS_PRO_{params['src_table_name']}"
+    else:
+        src_table_name = f"ST_{params['src_table_name']}" if params.get("tgt_schema_name_st") == "ST" else params["src_table_name"]
+        tgt_table_name_hs = params.get("tgt_table_name_hs")
+
+    prescript = params.get("prescript") or ""
+    postscript = params.get("postscript") or ""
+    if params.get("use_partition_switch") and params.get("scd_type") == "Trunc Load":
+        shadow_table_name, old_table_name = get_trunc_load_switch_table_names(tgt_table_name_hs)
+        switch_procedure_name = get_trunc_load_switch_procedure_name(tgt_table_name_hs)
+        prescript = "; ".join(filter(None, [prescript, f"TRUNCATE TABLE {tgt_schema_name_hs}.{old_table_name}"]))
+        postscript = "; ".join(filter(None, [f"EXEC {tgt_schema_name_hs}.{switch_procedure_name}", postscript]))
+        tgt_table_name_hs = shadow_table_name
+
+    row = {
+        "job_name": "HS_Profisee_Daily" if is_profisee else "HS_Full_Daily",
+        "src_schema_name": params.get("tgt_schema_name_st"),
+        "src_table_name": src_table_name,
+        "tgt_schema_name": tgt_schema_name_hs,
+        "tgt_table_name": tgt_table_name_hs,
+        "business_key": params.get("business_key"),
+        "primary_key": params.get("primary_key"),
+        "incremental_filter_column": params.get("incremental_filter_hs"),
+        "incremental_filter_column_timezone": params.get("incremental_filter_timezone"),
+        "scd_type": params.get("scd_type"),
+        "scd2_columns": params.get("scd2_columns") or "__allColumns",
+        "skip": 0,
+        "priority": params.get("load_priority", 0),
+        "prescript": prescript,
+        "postscript": postscript,
+        "partitions": params.get("partitions"),
+        "use_source_column_for_valid_dates": 1 if params.get("use_source_column_for_valid_dates") else 0,
+        "source_column_for_valid_from_date": params.get("source_column_for_valid_from_date") or None,
+    }
+    # The generated script only sets the sorting column when one is given
+    if params.get("source_column_for_sorting"):
+        row["source_column_for_sorting"] = params["source_column_for_sorting"]
+    return row
+
+def normalize_values(column):
+    """Convert control table values to comparable text, so 1, 1.0 and True or '' and NULL are equal
+
+    Empty values are returned as a NUL character, so the columns can be compared with != directly.
+    """
+    text = column.astype(object).where(column.notna(), None).map(lambda value: None if value is None else str(value).strip())
+    text = text.replace({"True": "1", "true": "1", "False": "0", "false": "0"})
+    text = text.str.replace(r"^(-?\d+)\.0+$", r"\1", regex=True)
+    return text.astype(object).where(text.notna() & (text != ""), "\0")
+
+def compare_control_rows(control_table, desired_df, snapshot_df):
+    """Compare the desired rows of a control table with a snapshot
+
+    Returns one change per differing value and the tables that already have a row in the snapshot.
+    """
+    keys = CONTROL_TABLE_KEYS[control_table]
+    merged = desired_df.merge(
+        snapshot_df.drop_duplicates(subset=keys).assign(_exists=True),
+        on=keys, how="left", suffixes=("", "_snapshot")
+    )
+    exists = merged["_exists"].eq(True)
+
+    changes = []
+    for column in [column for column in desired_df.columns if column not in keys + ["table_key"]]:
+        new_values = normalize_values(merged[column])
+        old_column = merged[f"{column}_snapshot"] if f"{column}_snapshot" in merged.columns else pd.Series(None, index=merged.index, dtype=object)
+        old_values = normalize_values(old_column)
+        differs = new_values != old_values
+        if column in OPTIONAL_CONTROL_COLUMNS:
+            differs &= merged[column].notna()
+        mask = differs | ~exists
+        if mask.any():
+            changes.append(pd.DataFrame({
+                "table_key": merged.loc[mask, "table_key"],
+                "control_table": control_table,
+                "action": exists[mask].map({True: "UPDATE", False: "INSERT"}),
+                **{key: merged.loc[mask, key] for key in keys},
+                "column": column,
+                "old_value": old_values[mask].replace("\0", None),
+                "new_value": merged.loc[mask, column],
+            }))
+    return changes, set(merged.loc[exists, "table_key"])
+
+def diff_control_tables(param_sets, st_snapshot_df, hs_snapshot_df):
+    """Compare table configurations with a snapshot export of the control tables
+
+    Returns a summary with the status NEW, CHANGED or UNCHANGED and the changed columns per table, and
+    one change per control table value to insert or update. Tables whose control table rows are the same as
+    those of an earlier table in the batch, such as equal table names from two source schemas, get the status
+    CONFLICT and no changes.
+    """
+    configs = [get_table_config(params) for params in param_sets]
+    st_rows = []
+    hs_rows = []
+    for config in configs:
+        table_key = get_table_key(config)
+        st_rows.extend({"table_key": table_key, **row} for row in get_st_control_rows(config))
+        hs_rows.append({"table_key": table_key, **get_hs_control_row(config)})
+
+    st_rows_df = pd.DataFrame(st_rows)
+    hs_rows_df = pd.DataFrame(hs_rows)
+
+    # Tables writing the same control table row as an earlier table in the batch are left out
+    conflicts = set(st_rows_df.loc[st_rows_df.duplicated(subset=CONTROL_TABLE_KEYS["CONTROL_TABLE_STAGE"]), "table_key"])
+    conflicts |= set(hs_rows_df.loc[hs_rows_df.duplicated(subset=CONTROL_TABLE_KEYS["CONTROL_TABLE_HS"]), "table_key"])
+    st_rows_df = st_rows_df[~st_rows_df["table_key"].isin(conflicts)]
+    hs_rows_df = hs_rows_df[~hs_rows_df["table_key"].isin(conflicts)]
+
+    st_changes, st_existing = compare_control_rows("CONTROL_TABLE_STAGE", st_rows_df, st_snapshot_df)
+    hs_changes, hs_existing = compare_control_rows("CONTROL_TABLE_HS", hs_rows_df, hs_snapshot_df)
+    changes = st_changes + hs_changes
+    changes_df = pd.concat(changes, ignore_index=True) if changes else pd.DataFrame(
+        columns=["table_key", "control_table", "action", "column", "old_value", "new_value"]
+    )
+
+    summary_df = pd.DataFrame({
+        "src_schema_name": [config["src_schema_name"] for config in configs],
+        "src_table_name": [config["src_table_name"] for config in configs],
+        "table_key": [get_table_key(config) for config in configs],
+    })
+    changed_columns = changes_df[changes_df["action"] == "UPDATE"].groupby("table_key")["column"].agg(
+        lambda columns: ", ".join(sorted(set(columns)))
+    )
+    # A table is new when none of its rows exist, and changed when some rows are missing or differ
+    is_new = ~summary_df["table_key"].isin(st_existing | hs_existing)
+    is_changed = summary_df["table_key"].isin(changes_df["table_key"])
+    summary_df["status"] = "UNCHANGED"
+    summary_df.loc[is_changed, "status"] = "CHANGED"
+    summary_df.loc[is_new, "status"] = "NEW"
+    summary_df.loc[summary_df["table_key"].isin(conflicts), "status"] = "CONFLICT"
+    summary_df["changed_columns"] = summary_df["table_key"].map(changed_columns).fillna("")
+
+    return summary_df.drop(columns=["table_key"]), changes_df.rename(columns={"table_key": "table_name"})
+
+def to_sql_literal(column, value):
+    """Return a control table value as SQL literal"""
+    if value is None or (not isinstance(value, str) and pd.isna(value)):
+        return "NULL"
+    if column in NUMERIC_CONTROL_COLUMNS:
+        return str(int(float(value)))
+    escaped = str(value).replace("'", "''")
+    return f"'{escaped}'"
+
+def generate_control_table_diff_sql(changes_df, control_schema="DWH"):
+    """Generate the INSERT and UPDATE statements that apply only the found differences to the control tables
+
+    Rows receiving the same values are updated by one statement with an IN list of their table names.
+    """
+    if changes_df.empty:
+        return "-- The control tables already match the configurations\n"
+
+    statements = []
+    for control_table, keys in CONTROL_TABLE_KEYS.items():
+        table_changes = changes_df[changes_df["control_table"] == control_table]
+        # Without changes the key columns of this control table are missing from changes_df
+        if table_changes.empty:
+            continue
+
+        # New rows, with all columns the generated scripts set
+        for key_values, row_changes in table_changes[table_changes["action"] == "INSERT"].groupby(keys, sort=False, dropna=False):
+            columns = keys + row_changes["column"].tolist()
+            values = [to_sql_literal(key, value) for key, value in zip(keys, key_values)]
+            values += [to_sql_literal(column, value) for column, value in zip(row_changes["column"], row_changes["new_value"])]
+            statements.append(f"""INSERT INTO {control_schema}.{control_table} ({', '.join(columns)})
+VALUES ({', '.join(values)});""")
+
+        # Changed rows, grouped by the values they receive
+        updates = {}
+        for key_values, row_changes in table_changes[table_changes["action"] == "UPDATE"].groupby(keys, sort=False, dropna=False):
+            set_clause = ",\n    ".join(
+                f"{column} = {to_sql_literal(column, value)}"
+                for column, value in sorted(zip(row_changes["column"], row_changes["new_value"]))
+            )
+            updates.setdefault((key_values[:-1], set_clause), []).append(key_values[-1])
+
+        for (outer_key_values, set_clause), names in updates.items():
+            conditions = [f"{key} = {to_sql_literal(key, value)}" for key, value in zip(keys[:-1], outer_key_values)]
+            for start in range(0, len(names), UPDATE_BATCH_SIZE):
+                in_list = ", ".join(to_sql_literal(keys[-1], name) for name in names[start:start + UPDATE_BATCH_SIZE])
+                where_clause = " AND ".join(conditions + [f"{keys[-1]} IN ({in_list})"])
+                statements.append(f"""UPDATE {control_schema}.{control_table}
+SET {set_clause}
+WHERE {where_clause};""")
+
+    return f"""-- Apply only the differences between the configurations and the control tables
+SET XACT_ABORT ON;
+BEGIN TRANSACTION;
+
+{(chr(10) + chr(10)).join(statements)}
+
+COMMIT TRANSACTION;
+"""
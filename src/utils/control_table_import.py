@@ -0,0 +1,145 @@
+import io
+import pandas as pd
+from src.config.constants import DEFAULT_VALUES
+
+REQUIRED_ST_COLUMNS = ["job_name", "source_system", "src_schema_name", "src_table_name", "tgt_schema_name", "tgt_table_name", "business_key"]
+REQUIRED_HS_COLUMNS = ["job_name", "src_schema_name", "src_table_name", "tgt_schema_name", "tgt_table_name", "scd_type"]
+REQUIRED_JOB_COLUMNS = ["job_name"]
+
+# ST control table columns per table parameter, read from the initial load row
+ST_PARAMETER_COLUMNS = {
+    "source_system": "source_system_initial",
+    "src_schema_name": "src_schema_name",
+    "src_table_name": "src_table_name",
+    "tgt_schema_name": "tgt_schema_name_st",
+    "tgt_table_name": "tgt_table_name_st",
+    "business_key": "business_key",
+    "incremental_filter_column": "incremental_filter_st",
+    "incremental_filter_column_timezone": "incremental_filter_timezone",
+    "priority": "load_priority",
+    "delete_type": "delete_type",
+    "src_delete_column": "src_delete_column",
+    "src_delete_value": "src_delete_value",
+}
+
+# HS control table columns per table parameter
+HS_PARAMETER_COLUMNS = {
+    "tgt_schema_name": "tgt_schema_name_hs",
+    "tgt_table_name": "tgt_table_name_hs",
+    "primary_key": "primary_key",
+    "incremental_filter_column": "incremental_filter_hs",
+    "scd_type": "scd_type",
+    "scd2_columns": "scd2_columns",
+    "prescript": "prescript",
+    "postscript": "postscript",
+    "partitions": "partitions",
+    "use_source_column_for_valid_dates": "use_source_column_for_valid_dates",
+    "source_column_for_valid_from_date": "source_column_for_valid_from_date",
+    "source_column_for_sorting": "source_column_for_sorting",
+}
+
+def read_control_table_export(file_name, data, required_columns):
+    """Read a CSV export of a control table into a DataFrame with lower case column names"""
+    try:
+        control_df = pd.read_csv(io.BytesIO(data), dtype=str, keep_default_na=False, na_values=["", "NULL"])
+        control_df.columns = [str(column).strip().lower() for column in control_df.columns]
+
+        missing_columns = [column for column in required_columns if column not in control_df.columns]
+        if missing_columns:
+            raise ValueError(f"missing columns: {', '.join(missing_columns)}")
+
+        for column in control_df.columns:
+            control_df[column] = control_df[column].str.strip()
+        return control_df
+    except Exception as e:
+        raise Exception(f"Error reading {file_name}: {str(e)}")
+
+def reconstruct_table_parameters(st_df, hs_df, job_df=None):
+    """Join the ST and HS control table rows of every table into one row of table parameters
+
+    The initial and daily load rows of DWH.CONTROL_TABLE_STAGE are joined on their ST table, and the
+    DWH.CONTROL_TABLE_HS row reading that ST table is joined to them. Returns the parameters and a
+    DataFrame of the tables that could not be reconstructed completely, with the reason.
+    """
+    st_columns = [column for column in ST_PARAMETER_COLUMNS if column in st_df.columns]
+    initial_df = st_df[st_df["job_name"].str.endswith("_Initial", na=False)][["job_name"] + st_columns]
+    daily_columns = ["job_name", "source_system", "src_table_name", "tgt_schema_name", "tgt_table_name"]
+    if "incremental_filter_column" in st_df.columns:
+        daily_columns.append("incremental_filter_column")
+    daily_df = st_df[st_df["job_name"].str.endswith("_Daily", na=False)][daily_columns]
+
+    # One row per ST table with the initial load values and the daily source system and table
+    params_df = initial_df.rename(columns=ST_PARAMETER_COLUMNS).rename(columns={"job_name": "st_initial_job_name"}).merge(
+        daily_df.rename(columns={
+            "job_name": "st_daily_job_name",
+            "source_system": "source_system_daily",
+            "src_table_name": "src_table_name_ct",
+            "tgt_schema_name": "tgt_schema_name_st",
+            "tgt_table_name": "tgt_table_name_st",
+            "incremental_filter_column": "daily_incremental_filter_st",
+        }),
+        on=["tgt_schema_name_st", "tgt_table_name_st"], how="outer"
+    ).drop_duplicates(subset=["tgt_schema_name_st", "tgt_table_name_st"])
+
+    # Tables without an initial load row take their source table from the daily row
+    params_df["src_table_name"] = params_df["src_table_name"].fillna(params_df["src_table_name_ct"].str.replace(r"__ct$", "", regex=True))
+
+    hs_columns = [column for column in HS_PARAMETER_COLUMNS if column in hs_df.columns]
+    params_df = params_df.merge(
+        hs_df[["job_name", "src_schema_name", "src_table_name"] + hs_columns]
+        .rename(columns=HS_PARAMETER_COLUMNS)
+        .rename(columns={"job_name": "hs_job_name", "src_schema_name": "tgt_schema_name_st", "src_table_name": "tgt_table_name_st"})
+        .drop_duplicates(subset=["tgt_schema_name_st", "tgt_table_name_st"]),
+        on=["tgt_schema_name_st", "tgt_table_name_st"], how="left"
+    )
+
+    # Trunc Load tables with partition switch are loaded into the shadow table; the generator adds the switch scripts
+    is_switch = (params_df["scd_type"] == "Trunc Load") & params_df["tgt_table_name_hs"].str.endswith("_SHADOW", na=False)
+    params_df["use_partition_switch"] = is_switch
+    params_df.loc[is_switch, "tgt_table_name_hs"] = params_df.loc[is_switch, "tgt_table_name_hs"].str.replace(r"_SHADOW$", "", regex=True)
+    if "prescript" in params_df.columns:
+        params_df.loc[is_switch, "prescript"] = params_df.loc[is_switch, "prescript"].str.replace(r"(^|; )TRUNCATE TABLE \S+_OLD$", "", regex=True)
+    if "postscript" in params_df.columns:
+        params_df.loc[is_switch, "postscript"] = params_df.loc[is_switch, "postscript"].str.replace(r"^EXEC \S+\.usp_SwitchIn_\S+?(; |$)", "", regex=True)
+
+    # Control table values are text in the export
+    if "scd2_columns" in params_df.columns:
+        params_df["scd2_columns_option"] = params_df["scd2_columns"].where(params_df["scd2_columns"] == "__allColumns", "Specify Columns")
+    for key in ["load_priority", "partitions"]:
+        if key in params_df.columns:
+            params_df[key] = pd.to_numeric(params_df[key], errors="coerce").fillna(DEFAULT_VALUES[key]).astype(int)
+    if "use_source_column_for_valid_dates" in params_df.columns:
+        params_df["use_source_column_for_valid_dates"] = params_df["use_source_column_for_valid_dates"].str.lower().isin(["1", "true"])
+    # NULL source columns stay empty instead of taking the header__ defaults
+    for key in ["source_column_for_valid_from_date", "source_column_for_sorting"]:
+        if key in params_df.columns:
+            params_df[key] = params_df[key].fillna("")
+
+    # Parameters the control tables do not store keep their defaults
+    for key, value in DEFAULT_VALUES.items():
+        if key not in params_df.columns:
+            params_df[key] = value
+
+    issues = [
+        (params_df["st_initial_job_name"].isna(), "no initial load row in CONTROL_TABLE_STAGE"),
+        (params_df["st_daily_job_name"].isna(), "no daily load row in CONTROL_TABLE_STAGE"),
+        (params_df["hs_job_name"].isna(), "no row in CONTROL_TABLE_HS"),
+    ]
+    # A configuration has one ST filter, so a different filter on the daily row cannot be kept
+    if "daily_incremental_filter_st" in params_df.columns:
+        filters_differ = (
+            params_df["incremental_filter_st"].notna() & params_df["daily_incremental_filter_st"].notna()
+            & (params_df["incremental_filter_st"] != params_df["daily_incremental_filter_st"])
+        )
+        issues.append((filters_differ, "daily load row of CONTROL_TABLE_STAGE has a different incremental_filter_column"))
+    if job_df is not None:
+        job_names = job_df["job_name"].dropna().unique()
+        for column, control_table in [("st_initial_job_name", "CONTROL_TABLE_STAGE"), ("st_daily_job_name", "CONTROL_TABLE_STAGE"), ("hs_job_name", "CONTROL_TABLE_HS")]:
+            issues.append((params_df[column].notna() & ~params_df[column].isin(job_names), f"{control_table} job is not in JOB_CONTROL"))
+
+    issues_df = pd.concat([
+        pd.DataFrame({"src_table_name": params_df.loc[mask, "src_table_name"], "tgt_table_name_st": params_df.loc[mask, "tgt_table_name_st"], "issue": issue})
+        for mask, issue in issues
+    ], ignore_index=True)
+
+    return params_df.reset_index(drop=True), issues_df
@@ -0,0 +1,176 @@
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+# Default durations used for the critical path when a step has no estimate
+DEFAULT_SQL_STEP_SECONDS = 5
+DEFAULT_PIPELINE_STEP_SECONDS = 3600
+
+def build_dependencies(steps):
+    """Map each step name to the steps producing its inputs
+
+    Inputs that no step produces are treated as existing objects and add no dependency.
+    """
+    producers = {}
+    for step in steps:
+        for output in step["outputs"]:
+            producers.setdefault(output, []).append(step["name"])
+
+    return {
+        step["name"]: sorted({producer for item in step["inputs"] for producer in producers.get(item, []) if producer != step["name"]})
+        for step in steps
+    }
+
+def topological_order(steps, dependencies):
+    """Return the step names in an order where every step comes after its dependencies"""
+    order = []
+    state = {}
+
+    def visit(name):
+        if state.get(name) == "done":
+            return
+        if state.get(name) == "visiting":
+            raise ValueError(f"Deployment steps contain a cycle through '{name}'")
+        state[name] = "visiting"
+        for dependency in dependencies[name]:
+            visit(dependency)
+        state[name] = "done"
+        order.append(name)
+
+    for step in steps:
+        visit(step["name"])
+    return order
+
+def get_execution_waves(steps):
+    """Group the steps into waves that can run in parallel once the previous waves are done"""
+    dependencies = build_dependencies(steps)
+    level = {}
+    for name in topological_order(steps, dependencies):
+        level[name] = 1 + max((level[dependency] for dependency in dependencies[name]), default=-1)
+
+    waves = [[] for _ in range(max(level.values(), default=-1) + 1)]
+    for step in steps:
+        waves[level[step["name"]]].append(step["name"])
+    return waves
+
+def get_critical_path(steps):
+    """Return the longest chain of dependent steps and its estimated duration in seconds"""
+    dependencies = build_dependencies(steps)
+    durations = {step["name"]: get_step_seconds(step) for step in steps}
+
+    finish = {}
+    previous = {}
+    for name in topological_order(steps, dependencies):
+        slowest = max(dependencies[name], key=lambda dependency: finish[dependency], default=None)
+        previous[name] = slowest
+        finish[name] = durations[name] + (finish[slowest] if slowest else 0)
+
+    if not finish:
+        return [], 0
+
+    path = [max(finish, key=finish.get)]
+    while previous[path[-1]]:
+        path.append(previous[path[-1]])
+    return list(reversed(path)), finish[path[0]]
+
+def get_step_seconds(step):
+    """Return the estimated duration of a step"""
+    if step.get("estimated_seconds") is not None:
+        return step["estimated_seconds"]
+    return DEFAULT_SQL_STEP_SECONDS if step.get("script") is not None else DEFAULT_PIPELINE_STEP_SECONDS
+
+def run_dag(steps, run_step, completed=(), max_workers=4):
+    """Run the steps as soon as their dependencies are done, in parallel on a thread pool
+
+    run_step(step) returns a result dict with a "status" of SUCCESS, FAILED or MANUAL. Steps listed in
+    completed are treated as already done. Steps after a failed or manual step are not run, so a second
+    call with the manual steps marked completed continues where the first one stopped.
+    """
+    dependencies = build_dependencies(steps)
+    steps_by_name = {step["name"]: step for step in steps}
+    topological_order(steps, dependencies)
+
+    done = set(completed)
+    blocked = set()
+    results = {name: {"step": name, "status": "COMPLETED"} for name in done if name in steps_by_name}
+    running = {}
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while True:
+            for name, step in steps_by_name.items():
+                if name in done or name in blocked or name in running.values():
+                    continue
+                if any(dependency in blocked for dependency in dependencies[name]):
+                    blocked.add(name)
+                    results[name] = {"step": name, "status": "WAITING"}
+                elif all(dependency in done for dependency in dependencies[name]):
+                    running[executor.submit(run_step, step)] = name
+
+            if not running:
+                break
+
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                name = running.pop(future)
+                try:
+                    result = future.result()
+                except Exception as e:
+                    result = {"step": name, "status": "FAILED", "error": str(e)}
+                results[name] = result
+                (done if result["status"] == "SUCCESS" else blocked).add(name)
+
+    return [results[step["name"]] for step in steps if step["name"] in results]
+
+def build_deployment_steps(table_suffix, scripts, pipeline_names, hs_table):
+    """Model the deployment of one table as steps with the objects they read and write
+
+    scripts maps the SQL step keys to their scripts (None for steps that are not configured) and
+    pipeline_names maps invalid_hs, initial and placeholder to the ADF pipeline names.
+    """
+    temp_st = f"sandbox.temp_control_table_st_{table_suffix}"
+    temp_hs = f"sandbox.temp_control_table_hs_{table_suffix}"
+    temp_job = f"sandbox.temp_control_table_job_{table_suffix}"
+
+    steps = [
+        {"name": "1a. Copy ST control table", "script": scripts["backup_st"],
+         "inputs": ["DWH.CONTROL_TABLE_STAGE"], "outputs": [temp_st]},
+        {"name": "1b. Copy HS control table", "script": scripts["backup_hs"],
+         "inputs": ["DWH.CONTROL_TABLE_HS"], "outputs": [temp_hs]},
+        {"name": "1c. Copy job control table", "script": scripts["backup_job"],
+         "inputs": ["DWH.JOB_CONTROL"], "outputs": [temp_job]},
+        {"name": "2. Update ST control table", "script": scripts["st_control"],
+         "inputs": [temp_st], "outputs": [f"{temp_st} (configured)"]},
+        {"name": "3. Update HS control table", "script": scripts["hs_control"],
+         "inputs": [temp_hs], "outputs": [f"{temp_hs} (configured)"]},
+        {"name": "4. Update job control table", "script": scripts["job_control"],
+         "inputs": [temp_job], "outputs": [f"{temp_job} (configured)"]},
+        {"name": f"5. Run pipeline {pipeline_names['invalid_hs']}", "script": None,
+         "inputs": [f"{temp_st} (configured)", f"{temp_hs} (configured)", f"{temp_job} (configured)"],
+         "outputs": ["ST table (loaded)"]},
+        {"name": "6. Create HS table", "script": scripts["hs_table"],
+         "inputs": ["ST table (loaded)"], "outputs": [hs_table]},
+        {"name": "6.5 Re-update job control table", "script": scripts["job_control"],
+         "inputs": [hs_table, f"{temp_job} (configured)"], "outputs": [f"{temp_job} (reset)"]},
+        {"name": f"7. Run pipeline {pipeline_names['placeholder']} or {pipeline_names['initial']}", "script": None,
+         "inputs": [hs_table, f"{temp_job} (reset)"], "outputs": [f"{hs_table} (loaded)"]},
+    ]
+
+    # Optional scripts, each run once the objects it works on exist
+    if scripts.get("ct_index"):
+        steps.append({"name": "6.6 Create change table indexes", "script": scripts["ct_index"],
+                      "inputs": [hs_table], "outputs": ["change table indexes"]})
+    if scripts.get("hard_delete"):
+        # Every batch of the reconciliation commits on its own to keep the transaction log small
+        steps.append({"name": "9.3 Reconcile hard deletes", "script": scripts["hard_delete"], "autocommit": True,
+                      "inputs": [f"{hs_table} (loaded)"], "outputs": [f"{hs_table} (deletes reconciled)"]})
+    if scripts.get("ct_retention"):
+        steps.append({"name": "9.4 Create change table retention procedure", "script": scripts["ct_retention"],
+                      "inputs": [f"{hs_table} (loaded)"], "outputs": ["change table retention procedure"]})
+
+    # Helper and main tables do not depend on the control tables and can be created at any time
+    if scripts.get("helper_table"):
+        steps.append({"name": "11a. Create helper table", "script": scripts["helper_table"],
+                      "inputs": [], "outputs": ["helper table"]})
+    if scripts.get("main_table"):
+        steps.append({"name": "11b. Create main table", "script": scripts["main_table"],
+                      "inputs": [], "outputs": ["main table"]})
+
+    return steps
@@ -0,0 +1,37 @@
+import streamlit as st
+from src.config.constants import GENERATOR_CACHE_TTL_SECONDS, GENERATOR_CACHE_MAX_ENTRIES
+from src.utils import sql_generator, adf_generator
+
+def cache_generator(function):
+    """Cache a pure generator function for all sessions of the server process
+
+    st.cache_data returns a copy of the cached value, so callers may modify generated pipeline dicts.
+    """
+    return st.cache_data(ttl=GENERATOR_CACHE_TTL_SECONDS, max_entries=GENERATOR_CACHE_MAX_ENTRIES, show_spinner=False)(function)
+
+# SQL generators
+generate_control_table_backup_sql = cache_generator(sql_generator.generate_control_table_backup_sql)
+generate_st_control_table_backup_sql = cache_generator(sql_generator.generate_st_control_table_backup_sql)
+generate_hs_control_table_backup_sql = cache_generator(sql_generator.generate_hs_control_table_backup_sql)
+generate_job_control_table_backup_sql = cache_generator(sql_generator.generate_job_control_table_backup_sql)
+generate_st_control_table_sql = cache_generator(sql_generator.generate_st_control_table_sql)
+generate_hs_control_table_sql = cache_generator(sql_generator.generate_hs_control_table_sql)
+generate_job_control_sql = cache_generator(sql_generator.generate_job_control_sql)
+generate_hs_table_sql = cache_generator(sql_generator.generate_hs_table_sql)
+generate_hs_table_quick_creation_sql = cache_generator(sql_generator.generate_hs_table_quick_creation_sql)
+generate_helper_table_sql = cache_generator(sql_generator.generate_helper_table_sql)
+generate_main_table_sql = cache_generator(sql_generator.generate_main_table_sql)
+generate_trunc_load_switch_sql = cache_generator(sql_generator.generate_trunc_load_switch_sql)
+generate_hard_delete_batch_sql = cache_generator(sql_generator.generate_hard_delete_batch_sql)
+generate_ct_index_sql = cache_generator(sql_generator.generate_ct_index_sql)
+generate_ct_retention_sql = cache_generator(sql_generator.generate_ct_retention_sql)
+
+# ADF generators
+generate_adf_pipeline_json = cache_generator(adf_generator.generate_adf_pipeline_json)
+generate_ct_retention_pipeline = cache_generator(adf_generator.generate_ct_retention_pipeline)
+generate_daily_load_trigger = cache_generator(adf_generator.generate_daily_load_trigger)
+generate_daily_load_parameter_file = cache_generator(adf_generator.generate_daily_load_parameter_file)
+
+# Name lookups are cheaper than a cache lookup and are passed through
+get_ct_retention_procedure_name = sql_generator.get_ct_retention_procedure_name
+get_change_table_name = sql_generator.get_change_table_name
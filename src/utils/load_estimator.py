@@ -0,0 +1,74 @@
+from datetime import datetime, timedelta
+
+def get_comparable_runs(log_df, source_system=None, partitions=None):
+    """Return the logged runs with the same source system and partitions, if the export has those columns"""
+    comparable_df = log_df
+    if source_system and "source_system" in comparable_df.columns:
+        filtered_df = comparable_df[comparable_df["source_system"] == source_system]
+        if not filtered_df.empty:
+            comparable_df = filtered_df
+    if partitions and "partitions" in comparable_df.columns:
+        filtered_df = comparable_df[comparable_df["partitions"] == partitions]
+        if not filtered_df.empty:
+            comparable_df = filtered_df
+    return comparable_df
+
+def estimate_initial_load(log_df, row_count=None, size_mb=None, source_system=None, partitions=None):
+    """Estimate the initial load duration from the throughput of comparable logged runs
+
+    Returns the expected duration at median throughput and a pessimistic duration at the
+    10th percentile throughput, or None when the log has no usable throughput.
+    """
+    comparable_df = get_comparable_runs(log_df, source_system, partitions)
+
+    # Prefer rows per second, fall back to MB per second when the log has no row throughput
+    throughput = None
+    if row_count and "rows_per_second" in comparable_df.columns:
+        throughput = comparable_df["rows_per_second"].dropna()
+        throughput = throughput[throughput > 0]
+        volume = row_count
+        basis = "rows per second"
+    if (throughput is None or throughput.empty) and size_mb and "size_mb" in comparable_df.columns:
+        throughput = (comparable_df["size_mb"] / comparable_df["duration_seconds"]).dropna()
+        throughput = throughput[throughput > 0]
+        volume = size_mb
+        basis = "MB per second"
+    if throughput is None or throughput.empty:
+        return None
+
+    return {
+        "expected_seconds": float(volume / throughput.median()),
+        "pessimistic_seconds": float(volume / throughput.quantile(0.1)),
+        "sample_runs": len(throughput),
+        "basis": basis
+    }
+
+def overlaps_peak_hours(start, end, peak_start_hour, peak_end_hour):
+    """Check whether a time window overlaps the weekday peak hours"""
+    day = start.replace(hour=0, minute=0, second=0, microsecond=0)
+    while day < end:
+        if day.weekday() < 5:
+            peak_start = day + timedelta(hours=peak_start_hour)
+            peak_end = day + timedelta(hours=peak_end_hour)
+            if start < peak_end and end > peak_start:
+                return True
+        day += timedelta(days=1)
+    return False
+
+def recommend_load_window(duration_seconds, peak_start_hour=6, peak_end_hour=18, now=None):
+    """Recommend the earliest start time at which a load finishes outside weekday peak hours"""
+    now = (now or datetime.now()).replace(second=0, microsecond=0)
+    duration = timedelta(seconds=duration_seconds)
+    today = now.replace(hour=0, minute=0)
+
+    # Candidate starts: now, the end of each peak period and each midnight over the next two weeks
+    candidates = [now]
+    for day_offset in range(15):
+        day = today + timedelta(days=day_offset)
+        candidates.extend([day + timedelta(hours=peak_end_hour), day])
+
+    for start in sorted(candidate for candidate in candidates if candidate >= now):
+        if not overlaps_peak_hours(start, start + duration, peak_start_hour, peak_end_hour):
+            return start, start + duration
+
+    return None
@@ -0,0 +1,125 @@
+import csv
+import heapq
+import io
+from statistics import median
+from src.config.constants import DEFAULT_VALUES
+from src.utils.sql_generator import get_trunc_load_switch_table_names
+
+def read_table_stats(csv_string):
+    """Read table size and duration statistics from a CSV string"""
+    try:
+        reader = csv.DictReader(io.StringIO(csv_string))
+        fieldnames = [name.strip().lower() for name in (reader.fieldnames or [])]
+        if "table_name" not in fieldnames:
+            raise ValueError("the CSV must contain a table_name column")
+
+        table_stats = []
+        for row in reader:
+            row = {key.strip().lower(): (value or "").strip() for key, value in row.items() if key}
+            if not row.get("table_name"):
+                continue
+            table_stats.append({
+                "table_name": row["table_name"],
+                "schema_name": row.get("schema_name") or DEFAULT_VALUES["tgt_schema_name_hs"],
+                "st_table_name": row.get("st_table_name") or None,
+                "st_schema_name": row.get("st_schema_name") or DEFAULT_VALUES["tgt_schema_name_st"],
+                "size_mb": float(row["size_mb"]) if row.get("size_mb") else None,
+                "duration_seconds": float(row["duration_seconds"]) if row.get("duration_seconds") else None
+            })
+
+        return table_stats
+    except Exception as e:
+        raise Exception(f"Error reading table statistics: {str(e)}")
+
+def estimate_load_seconds(table_stats):
+    """Estimate the load duration of each table, falling back to size for tables without history"""
+    # Derive a seconds-per-MB rate from the tables that have both a size and a duration
+    rates = [
+        table["duration_seconds"] / table["size_mb"]
+        for table in table_stats
+        if table["duration_seconds"] and table["size_mb"]
+    ]
+    seconds_per_mb = median(rates) if rates else 1.0
+
+    estimates = {}
+    for table in table_stats:
+        if table["duration_seconds"] is not None:
+            estimates[table["table_name"]] = table["duration_seconds"]
+        elif table["size_mb"] is not None:
+            estimates[table["table_name"]] = table["size_mb"] * seconds_per_mb
+        else:
+            estimates[table["table_name"]] = 0.0
+
+    return estimates
+
+def plan_load_priorities(table_stats, job_names=None):
+    """Assign priorities longest-processing-time first and optionally balance tables across job names
+
+    The longest table gets the highest priority value, so it is picked up first by the framework loop
+    and short tables fill the gaps at the end of the batch window.
+    """
+    estimates = estimate_load_seconds(table_stats)
+    ordered_tables = sorted(table_stats, key=lambda table: estimates[table["table_name"]], reverse=True)
+
+    # Each job is a bin; the next longest table always goes to the job with the least work so far
+    job_heap = [(0.0, index, job_name) for index, job_name in enumerate(job_names or [])]
+    heapq.heapify(job_heap)
+
+    plan = []
+    for position, table in enumerate(ordered_tables):
+        estimated_seconds = estimates[table["table_name"]]
+        job_name = None
+        if job_heap:
+            job_load, index, job_name = heapq.heappop(job_heap)
+            heapq.heappush(job_heap, (job_load + estimated_seconds, index, job_name))
+
+        plan.append({
+            "table_name": table["table_name"],
+            "schema_name": table["schema_name"],
+            "st_table_name": table["st_table_name"],
+            "st_schema_name": table["st_schema_name"],
+            "estimated_seconds": round(estimated_seconds, 1),
+            "priority": len(ordered_tables) - position,
+            "job_name": job_name
+        })
+
+    return plan
+
+def get_job_makespans(plan):
+    """Return the total estimated seconds per job name in a plan"""
+    makespans = {}
+    for row in plan:
+        if row["job_name"]:
+            makespans[row["job_name"]] = makespans.get(row["job_name"], 0.0) + row["estimated_seconds"]
+    return makespans
+
+def generate_priority_update_sql(plan, control_schema="DWH"):
+    """Generate SQL that applies a load plan to the ST and HS control tables
+
+    The HS row of a Trunc Load table with partition switch points at its shadow table, so both names are
+    matched. Job names assigned by the plan get a DWH.JOB_CONTROL row when they do not have one yet.
+    """
+    statements = []
+    job_names = sorted({row["job_name"] for row in plan if row["job_name"]})
+    for job_name in job_names:
+        statements.append(f"""IF NOT EXISTS (SELECT 1 FROM {control_schema}.JOB_CONTROL WHERE job_name = '{job_name}')
+    INSERT INTO {control_schema}.JOB_CONTROL VALUES
+    ('{job_name}','1970-01-01 00:00:00','1970-01-01 00:00:00','SUCCESS','1970-01-01 00:00:00',0,NULL);""")
+
+    for row in plan:
+        shadow_table_name, _ = get_trunc_load_switch_table_names(row["table_name"])
+        job_name_clause = f",\n    job_name = '{row['job_name']}'" if row["job_name"] else ""
+        statements.append(f"""UPDATE {control_schema}.CONTROL_TABLE_HS
+SET priority = {row['priority']}{job_name_clause}
+WHERE tgt_schema_name = '{row['schema_name']}'
+  AND tgt_table_name IN ('{row['table_name']}', '{shadow_table_name}');""")
+
+        if row["st_table_name"]:
+            statements.append(f"""UPDATE {control_schema}.CONTROL_TABLE_STAGE
+SET priority = {row['priority']}
+WHERE tgt_schema_name = '{row['st_schema_name']}'
+  AND tgt_table_name = '{row['st_table_name']}';""")
+
+    return f"""-- Apply the load plan: longest tables get the highest priority
+{chr(10).join(statements)}
+"""
@@ -0,0 +1,96 @@
+import io
+import pandas as pd
+
+# Column names used in exports of DWH.JOB_LOG / DWH.JOB_TABLES_LOG, mapped to the names used here
+LOG_COLUMN_ALIASES = {
+    "tgt_table_name": "table_name",
+    "target_table_name": "table_name",
+    "start_date": "start_time",
+    "start_datetime": "start_time",
+    "starttime": "start_time",
+    "end_date": "end_time",
+    "end_datetime": "end_time",
+    "endtime": "end_time",
+    "rows_copied": "rows",
+    "rows_written": "rows",
+    "rows_inserted": "rows",
+    "row_count": "rows",
+    "rowcount": "rows",
+}
+
+REQUIRED_LOG_COLUMNS = ["table_name", "start_time", "end_time"]
+
+def read_log_export(file_name, data):
+    """Read a CSV or Parquet export of the job table log into a normalised DataFrame"""
+    try:
+        if file_name.lower().endswith(".parquet"):
+            log_df = pd.read_parquet(io.BytesIO(data))
+        else:
+            log_df = pd.read_csv(io.BytesIO(data))
+
+        # Normalise the column names so exports from different queries can be used
+        log_df.columns = [str(column).strip().lower() for column in log_df.columns]
+        log_df = log_df.rename(columns=LOG_COLUMN_ALIASES)
+        log_df = log_df.loc[:, ~log_df.columns.duplicated()]
+
+        missing_columns = [column for column in REQUIRED_LOG_COLUMNS if column not in log_df.columns]
+        if missing_columns:
+            raise ValueError(f"missing columns: {', '.join(missing_columns)}")
+
+        log_df["start_time"] = pd.to_datetime(log_df["start_time"], errors="coerce")
+        log_df["end_time"] = pd.to_datetime(log_df["end_time"], errors="coerce")
+        log_df = log_df.dropna(subset=["table_name", "start_time", "end_time"])
+
+        # Only successful runs say anything about throughput
+        if "status" in log_df.columns:
+            log_df = log_df[log_df["status"].astype(str).str.upper().str.startswith("SUCCE")]
+
+        log_df["duration_seconds"] = (log_df["end_time"] - log_df["start_time"]).dt.total_seconds()
+        log_df = log_df[log_df["duration_seconds"] > 0]
+
+        if "rows" in log_df.columns:
+            log_df["rows"] = pd.to_numeric(log_df["rows"], errors="coerce")
+            log_df["rows_per_second"] = log_df["rows"] / log_df["duration_seconds"]
+        else:
+            log_df["rows_per_second"] = float("nan")
+
+        return log_df.reset_index(drop=True)
+    except Exception as e:
+        raise Exception(f"Error reading log export: {str(e)}")
+
+def compute_table_metrics(log_df):
+    """Compute throughput, duration percentiles and duration trends per table"""
+    # Days since the first run of each table, used as the x axis of the trend line
+    first_run = log_df.groupby("table_name")["start_time"].transform("min")
+    trend_df = pd.DataFrame({
+        "table_name": log_df["table_name"],
+        "x": (log_df["start_time"] - first_run).dt.total_seconds() / 86400,
+        "y": log_df["duration_seconds"],
+    })
+    trend_df["xy"] = trend_df["x"] * trend_df["y"]
+    trend_df["xx"] = trend_df["x"] * trend_df["x"]
+
+    # Least-squares slope per table from grouped sums, without a Python loop per table
+    sums = trend_df.groupby("table_name")[["x", "y", "xy", "xx"]].sum()
+    runs = trend_df.groupby("table_name").size()
+    denominator = runs * sums["xx"] - sums["x"] ** 2
+    slope = (runs * sums["xy"] - sums["x"] * sums["y"]) / denominator.replace(0, float("nan"))
+
+    durations = log_df.groupby("table_name")["duration_seconds"]
+    metrics = pd.DataFrame({
+        "runs": runs,
+        "last_run": log_df.groupby("table_name")["start_time"].max(),
+        "median_rows_per_second": log_df.groupby("table_name")["rows_per_second"].median(),
+        "p50_duration_seconds": durations.quantile(0.5),
+        "p90_duration_seconds": durations.quantile(0.9),
+        "p95_duration_seconds": durations.quantile(0.95),
+        "mean_duration_seconds": durations.mean(),
+        "trend_seconds_per_day": slope,
+    })
+    metrics["trend_pct_per_30_days"] = 100 * 30 * metrics["trend_seconds_per_day"] / metrics["mean_duration_seconds"]
+
+    return metrics.sort_values("trend_pct_per_30_days", ascending=False).reset_index()
+
+def get_degrading_tables(metrics, threshold_pct=10, min_runs=5):
+    """Return the tables whose duration grows faster than the threshold per 30 days"""
+    return metrics[(metrics["runs"] >= min_runs) & (metrics["trend_pct_per_30_days"] > threshold_pct)]
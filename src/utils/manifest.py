@@ -0,0 +1,96 @@
+import json
+from src.config.constants import DEFAULT_VALUES, PARAMETER_KEYS, APP_VERSION
+
+# Keys every table configuration in a manifest needs
+MANIFEST_REQUIRED_KEYS = ["src_table_name", "business_key"]
+
+def get_major_version(version):
+    """Return the major version of a version string such as 1.0.0"""
+    return str(version).split(".")[0]
+
+def write_manifest(configs, file):
+    """Write table configurations to a text file as a JSON lines manifest, one configuration per line
+
+    configs can be any iterable, such as a generator reading from another manifest. Returns the number
+    of configurations written.
+    """
+    count = 0
+    for params in configs:
+        line = {key: params[key] for key in PARAMETER_KEYS if params.get(key) is not None}
+        line["app_version"] = APP_VERSION
+        file.write(json.dumps(line, separators=(",", ":")) + "\n")
+        count += 1
+    return count
+
+def iter_manifest(lines):
+    """Parse manifest lines one at a time and yield (line_number, params, error) for each configuration"""
+    for line_number, line in enumerate(lines, 1):
+        if isinstance(line, bytes):
+            line = line.decode("utf-8")
+        if not line.strip():
+            continue
+
+        try:
+            data = json.loads(line)
+        except ValueError as e:
+            yield line_number, None, f"invalid JSON: {str(e)}"
+            continue
+        if not isinstance(data, dict):
+            yield line_number, None, "a line must contain a JSON object"
+            continue
+
+        # Lines without a version are read as the current version
+        version = data.get("app_version", APP_VERSION)
+        if get_major_version(version) != get_major_version(APP_VERSION):
+            yield line_number, None, f"app_version {version} is not supported by app version {APP_VERSION}"
+            continue
+
+        missing_keys = [key for key in MANIFEST_REQUIRED_KEYS if not data.get(key)]
+        if missing_keys:
+            yield line_number, None, f"missing {', '.join(missing_keys)}"
+            continue
+
+        yield line_number, {key: data[key] for key in PARAMETER_KEYS if key in data}, None
+
+def read_manifest(lines):
+    """Yield the configurations of a manifest, raising an error at the first invalid line"""
+    for line_number, params, error in iter_manifest(lines):
+        if error:
+            raise Exception(f"Error in manifest line {line_number}: {error}")
+        yield params
+
+def validate_manifest(lines, max_errors=100):
+    """Validate a manifest and return the number of valid configurations and the first errors"""
+    valid_count = 0
+    errors = []
+    for line_number, params, error in iter_manifest(lines):
+        if error is None:
+            valid_count += 1
+        elif len(errors) < max_errors:
+            errors.append({"line": line_number, "error": error})
+    return valid_count, errors
+
+def filter_configs(configs, **criteria):
+    """Yield the configurations whose values equal all given criteria, e.g. source_system_daily="Replicate_CDC" """
+    for params in configs:
+        if all(params.get(key) == value for key, value in criteria.items()):
+            yield params
+
+def export_manifest_pipelines(configs, repo_folder):
+    """Write the ADF objects of every configuration into an ADF git repository, one configuration at a time
+
+    Returns the number of objects per write status. Shared objects written for an earlier configuration
+    are counted as unchanged. Configurations without a table suffix get one derived from their source table,
+    so exporting the same manifest again leaves the files unchanged.
+    """
+    from src.utils.adf_exporter import collect_table_adf_objects, write_git_layout
+    from src.utils.table_suffix import get_table_key_suffix
+
+    counts = {"CREATED": 0, "UPDATED": 0, "UNCHANGED": 0}
+    for params in configs:
+        table_key = f"{params.get('src_schema_name') or DEFAULT_VALUES['src_schema_name']}.{params['src_table_name']}"
+        table_suffix = params.get("table_suffix") or get_table_key_suffix(table_key, params.get("user_initials"))
+        adf_objects = collect_table_adf_objects(params, table_suffix)
+        for result in write_git_layout(adf_objects, repo_folder):
+            counts[result["status"]] += 1
+    return counts
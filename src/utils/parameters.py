@@ -1,37 +1,55 @@
+import hashlib
 import json
+import threading
+from collections import OrderedDict
 from datetime import datetime
+from types import MappingProxyType
 import streamlit as st
+from src.config.constants import DEFAULT_VALUES, PARAMETER_KEYS, APP_VERSION
+
+# Keys the deployer view needs, with the fallbacks used when a configuration does not contain them
+DEPLOYER_REQUIRED_DEFAULTS = {
+    "prescript": "",
+    "postscript": "",
+    "scd2_columns": "",
+    "delete_type": None,
+    "src_delete_column": "DELETED_FLAG",
+    "src_delete_value": "Y"
+}
+DEPLOYER_REQUIRED_KEYS = [
+    "source_system_initial", "source_system_daily", 
+    "src_schema_name", "src_table_name",
+    "tgt_schema_name_st", "tgt_table_name_st", 
+    "tgt_schema_name_hs", "tgt_table_name_hs",
+    "business_key", "primary_key", "incremental_filter_st", 
+    "incremental_filter_hs", "incremental_filter_timezone",
+    "scd_type", "scd2_columns", "delete_type",
+    "src_delete_column", "src_delete_value"
+]
+
+# Parsed deployer configurations by content hash
+DEPLOYER_CONFIG_CACHE_SIZE = 64
+_deployer_configs = OrderedDict()
+_deployer_configs_lock = threading.Lock()
+
+def get_export_params(params):
+    """Return the parameters to export together with the export timestamp and app version"""
+    # Extract specific parameters that we want to include
+    export_params = {}
+    for key in PARAMETER_KEYS:
+        if key in params and params[key] is not None:
+            export_params[key] = params[key]
+    
+    # Add timestamp and app version
+    export_params["export_timestamp"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    export_params["app_version"] = APP_VERSION
+    return export_params
 
 def export_parameters(params):
     """Export the parameters to a JSON string"""
     try:
-        # Extract specific parameters that we want to include
-        export_params = {}
-        for key in [
-            "user_initials", "table_suffix",
-            "source_system_initial", "source_system_daily", 
-            "src_schema_name", "src_table_name", 
-            "tgt_schema_name_st", "tgt_table_name_st", 
-            "tgt_schema_name_hs", "tgt_table_name_hs", 
-            "business_key", "primary_key", 
-            "incremental_filter_st", "incremental_filter_hs", "incremental_filter_timezone", 
-            "scd_type", "scd2_columns_option", "scd2_columns", 
-            "delete_type", "src_delete_column", "src_delete_value", 
-            "prescript", "postscript", "partitions", 
-            "use_source_column_for_valid_dates", "source_column_for_valid_from_date", 
-            "source_column_for_sorting", 
-            "create_main_table", "main_table_schema", "main_table_name", "main_table_columns", 
-            "create_helper_table", "helper_schema", "business_key_column"
-        ]:
-            if key in params and params[key] is not None:
-                export_params[key] = params[key]
-        
-        # Add timestamp and app version
-        export_params["export_timestamp"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        export_params["app_version"] = "1.0.0"
-        
         # Return the JSON string
-        return json.dumps(export_params, indent=4)
+        return json.dumps(get_export_params(params), indent=4)
     except Exception as e:
         raise Exception(f"Error exporting parameters: {str(e)}")
 
@@ -43,22 +61,7 @@ def import_parameters(json_string):
         
         # Extract specific parameters that we want to include
         import_params = {}
-        for key in [
-            "user_initials", "table_suffix",
-            "source_system_initial", "source_system_daily", 
-            "src_schema_name", "src_table_name", 
-            "tgt_schema_name_st", "tgt_table_name_st", 
-            "tgt_schema_name_hs", "tgt_table_name_hs", 
-            "business_key", "primary_key", 
-            "incremental_filter_st", "incremental_filter_hs", "incremental_filter_timezone", 
-            "scd_type", "scd2_columns_option", "scd2_columns", 
-            "delete_type", "src_delete_column", "src_delete_value", 
-            "prescript", "postscript", "partitions", 
-            "use_source_column_for_valid_dates", "source_column_for_valid_from_date", 
-            "source_column_for_sorting", 
-            "create_main_table", "main_table_schema", "main_table_name", "main_table_columns", 
-            "create_helper_table", "helper_schema", "business_key_column"
-        ]:
+        for key in PARAMETER_KEYS:
             if key in params:
                 import_params[key] = params[key]
         
@@ -70,23 +73,52 @@ def get_current_params():
     """Get the current parameters from session state"""
     # Extract specific parameters that we want to include
     current_params = {}
-    for key in [
-        "user_initials", "table_suffix",
-        "source_system_initial", "source_system_daily", 
-        "src_schema_name", "src_table_name", 
-        "tgt_schema_name_st", "tgt_table_name_st", 
-        "tgt_schema_name_hs", "tgt_table_name_hs", 
-        "business_key", "primary_key", 
-        "incremental_filter_st", "incremental_filter_hs", "incremental_filter_timezone", 
-        "scd_type", "scd2_columns_option", "scd2_columns", 
-        "delete_type", "src_delete_column", "src_delete_value", 
-        "prescript", "postscript", "partitions", 
-        "use_source_column_for_valid_dates", "source_column_for_valid_from_date", 
-        "source_column_for_sorting", 
-        "create_main_table", "main_table_schema", "main_table_name", "main_table_columns", 
-        "create_helper_table", "helper_schema", "business_key_column"
-    ]:
+    for key in PARAMETER_KEYS:
         if key in st.session_state:
             current_params[key] = st.session_state[key]
     
-    return current_params 
\ No newline at end of file
+    return current_params
+
+def normalize_deployer_config(params):
+    """Apply the deployer defaults, the CT table name and the Profisee naming in one pass
+
+    Returns a read-only mapping, so a cached configuration can be shared between reruns and sessions.
+    """
+    config = dict(params)
+    for key in DEPLOYER_REQUIRED_KEYS:
+        if key not in config:
+            config[key] = DEFAULT_VALUES.get(key, DEPLOYER_REQUIRED_DEFAULTS.get(key))
+
+    # Calculate the CT table name
+    if config["src_table_name"] and config["source_system_daily"] == "Replicate_CDC":
+        config["src_table_name_ct"] = f"{config['src_table_name']}__ct"
+    else:
+        config["src_table_name_ct"] = config["src_table_name"]
+
+    # Profisee sources always use Profisee_dev and the ST_PRO_/HS_PRO_ table names
+    if config["source_system_initial"] and "Profisee" in config["source_system_initial"]:
+        config["source_system_initial"] = "Profisee_dev"
+        if config["source_system_daily"] and "Profisee" in config["source_system_daily"]:
+            config["source_system_daily"] = "Profisee_dev"
+        config["tgt_table_name_st"] = f"ST_PRO_{config['src_table_name']}"
+        config["tgt_table_name_hs"] = f"HS_PRO_{config['src_table_name']}"
+
+    return MappingProxyType(config)
+
+def load_deployer_config(config_bytes):
+    """Parse and normalise an uploaded configuration file once per distinct content
+
+    Returns the content hash and the read-only configuration.
+    """
+    config_hash = hashlib.sha256(config_bytes).hexdigest()
+    with _deployer_configs_lock:
+        if config_hash in _deployer_configs:
+            _deployer_configs.move_to_end(config_hash)
+            return config_hash, _deployer_configs[config_hash]
+
+    config = normalize_deployer_config(import_parameters(config_bytes.decode()))
+    with _deployer_configs_lock:
+        _deployer_configs[config_hash] = config
+        if len(_deployer_configs) > DEPLOYER_CONFIG_CACHE_SIZE:
+            _deployer_configs.popitem(last=False)
+    return config_hash, config
\ No newline at end of file
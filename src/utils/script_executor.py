@@ -0,0 +1,117 @@
+import queue
+import re
+import time
+from contextlib import contextmanager
+
+# A GO separator on its own line, optionally with a repeat count
+GO_SEPARATOR_PATTERN = re.compile(r"^\s*GO(?:\s+(\d+))?\s*;?\s*$", re.IGNORECASE | re.MULTILINE)
+
+def split_sql_batches(script):
+    """Split a SQL script into the batches separated by GO lines"""
+    batches = []
+    position = 0
+    for match in GO_SEPARATOR_PATTERN.finditer(script):
+        batches.extend([script[position:match.start()]] * int(match.group(1) or 1))
+        position = match.end()
+    batches.append(script[position:])
+
+    # Drop batches that contain nothing but whitespace and line comments
+    return [
+        batch.strip() for batch in batches
+        if any(line.strip() and not line.strip().startswith("--") for line in batch.splitlines())
+    ]
+
+def connect_odbc(connection_string):
+    """Return a function that opens pyodbc connections for the given connection string"""
+    try:
+        import pyodbc
+    except ImportError:
+        raise Exception("Direct execution requires the pyodbc package. Install it with 'pip install pyodbc'.")
+
+    return lambda: pyodbc.connect(connection_string, autocommit=False)
+
+class ConnectionPool:
+    """A fixed-size pool of DB-API connections shared by the execution threads"""
+
+    def __init__(self, connect, size=4):
+        self.connect = connect
+        self.size = size
+        self.idle = queue.Queue()
+        # None stands for a free slot without an open connection
+        for _ in range(size):
+            self.idle.put(None)
+
+    @contextmanager
+    def connection(self):
+        """Borrow a connection, opening a new one for a free slot
+
+        A connection whose use raised an error is rolled back and closed instead of returned to the pool.
+        """
+        conn = self.idle.get()
+        if conn is None:
+            try:
+                conn = self.connect()
+            except Exception:
+                self.idle.put(None)
+                raise
+        try:
+            yield conn
+        except Exception:
+            self.discard(conn)
+            raise
+        self.idle.put(conn)
+
+    def discard(self, conn):
+        """Roll back and close a connection in an unknown state and free its slot"""
+        for action in (conn.rollback, conn.close):
+            try:
+                action()
+            except Exception:
+                pass
+        self.idle.put(None)
+
+    def close(self):
+        """Close all idle connections"""
+        connections = []
+        while not self.idle.empty():
+            connections.append(self.idle.get_nowait())
+        for conn in connections:
+            if conn is not None:
+                conn.close()
+            self.idle.put(None)
+
+def execute_step(pool, name, script, autocommit=False):
+    """Execute all batches of a script in one transaction and return the timed result
+
+    With autocommit the statements commit on their own, for scripts that manage their own transactions.
+    A failed step leaves its transaction to the pool, which rolls it back and closes the connection.
+    """
+    batches = split_sql_batches(script)
+    started = time.perf_counter()
+    try:
+        with pool.connection() as conn:
+            if autocommit:
+                conn.autocommit = True
+            cursor = conn.cursor()
+            try:
+                for batch in batches:
+                    cursor.execute(batch)
+                    # Consume all result sets so the driver can run the next batch
+                    while hasattr(cursor, "nextset") and cursor.nextset():
+                        pass
+            finally:
+                cursor.close()
+            conn.commit()
+            if autocommit:
+                conn.autocommit = False
+        status, error = "SUCCESS", None
+    except Exception as e:
+        status, error = "FAILED", str(e)
+
+    return {
+        "step": name,
+        "status": status,
+        "batches": len(batches),
+        "seconds": round(time.perf_counter() - started, 3),
+        "error": error
+    }
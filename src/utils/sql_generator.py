@@ -1,13 +1,16 @@
 def generate_control_table_backup_sql(table_suffix, source_system_initial=None, source_system_daily=None):
     """Generate SQL for backing up control tables"""
+    return "\n".join([
+        generate_st_control_table_backup_sql(table_suffix, source_system_initial, source_system_daily),
+        generate_hs_control_table_backup_sql(table_suffix),
+        generate_job_control_table_backup_sql(table_suffix, source_system_initial, source_system_daily)
+    ])
+
+def generate_st_control_table_backup_sql(table_suffix, source_system_initial=None, source_system_daily=None):
+    """Generate SQL for backing up the ST control table"""
     # Determine the correct job names based on source system
     st_initial_job = "ST_Profisee_Initial" if source_system_initial and "Profisee_dev" in source_system_initial else "ST_Full_Initial"
     st_daily_job = "ST_Profisee_Daily" if source_system_daily and "Profisee_dev" in source_system_daily else "ST_Full_Daily"
-    hs_daily_job = "HS_Profisee_Daily" if source_system_initial and "Profisee_dev" in source_system_initial else "HS_Full_Daily"
-    hs_control_job = "HS_Profisee_Daily_Control" if source_system_initial and "Profisee_dev" in source_system_initial else "HS_Full_Daily_Control"
-    
-    # Create a list of all job names that need to be included in the backup
-    job_list = f"'{st_daily_job}','{st_initial_job}','{hs_daily_job}','{hs_control_job}','ST_Placeholder'"
     
     return f"""-- Make a copy of DWH.CONTROL_TABLE_STAGE
 WITH cte AS ( 	
@@ -17,13 +20,28 @@ WITH cte AS (
 ) 	
 SELECT *	
 INTO sandbox.temp_control_table_st_{table_suffix} FROM cte;
+"""
 
--- Make a copy of DWH.CONTROL_TABLE_HS
+def generate_hs_control_table_backup_sql(table_suffix):
+    """Generate SQL for backing up the HS control table"""
+    return f"""-- Make a copy of DWH.CONTROL_TABLE_HS
 SELECT TOP 1 * 
 INTO sandbox.temp_control_table_hs_{table_suffix} 
 FROM DWH.CONTROL_TABLE_HS;
+"""
 
--- Make a copy of DWH.JOB_CONTROL
+def generate_job_control_table_backup_sql(table_suffix, source_system_initial=None, source_system_daily=None):
+    """Generate SQL for backing up the job control table"""
+    # Determine the correct job names based on source system
+    st_initial_job = "ST_Profisee_Initial" if source_system_initial and "Profisee_dev" in source_system_initial else "ST_Full_Initial"
+    st_daily_job = "ST_Profisee_Daily" if source_system_daily and "Profisee_dev" in source_system_daily else "ST_Full_Daily"
+    hs_daily_job = "HS_Profisee_Daily" if source_system_initial and "Profisee_dev" in source_system_initial else "HS_Full_Daily"
+    hs_control_job = "HS_Profisee_Daily_Control" if source_system_initial and "Profisee_dev" in source_system_initial else "HS_Full_Daily_Control"
+    
+    # Create a list of all job names that need to be included in the backup
+    job_list = f"'{st_daily_job}','{st_initial_job}','{hs_daily_job}','{hs_control_job}','ST_Placeholder'"
+    
+    return f"""-- Make a copy of DWH.JOB_CONTROL
 SELECT * 
 INTO sandbox.temp_control_table_job_{table_suffix} 
 FROM DWH.JOB_CONTROL 
@@ -34,7 +52,7 @@ def generate_st_control_table_sql(table_suffix, source_system_initial, source_sy
                                 src_schema_name, src_table_name, src_table_name_ct,
                                 tgt_schema_name_st, tgt_table_name_st, business_key,
                                 incremental_filter_st, incremental_filter_timezone,
-                                delete_type, src_delete_column, src_delete_value):
+                                delete_type, src_delete_column, src_delete_value, priority=0):
     """Generate SQL for ST control table updates"""
     delete_type_sql = "NULL" if delete_type is None else f"'{delete_type}'"
     src_delete_column_sql = "NULL" if src_delete_column is None else f"'{src_delete_column}'"
@@ -72,7 +90,7 @@ SET
     incremental_filter_column = '{incremental_filter_st}',
     incremental_filter_column_timezone = '{incremental_filter_timezone}',
     skip = 0,
-    priority = 0,
+    priority = {priority},
     delete_type = {delete_type_sql},
     src_delete_column = {src_delete_column_sql},
     src_delete_value = {src_delete_value_sql}
@@ -92,7 +110,7 @@ SET
     incremental_filter_column = '{incremental_filter_st}',
     incremental_filter_column_timezone = '{incremental_filter_timezone}',
     skip = 0,
-    priority = 0,
+    priority = {priority},
     delete_type = {delete_type_sql},
     src_delete_column = {src_delete_column_sql},
     src_delete_value = {src_delete_value_sql}
@@ -106,21 +124,8 @@ def generate_hs_control_table_sql(table_suffix, source_system_initial, source_sy
                                 incremental_filter_timezone="UTC", scd_type="SCD2", scd2_columns="__allColumns",
                                 prescript="", postscript="", partitions=1, 
                                 use_source_column_for_valid_dates=False, source_column_for_valid_from_date=None,
-                                source_column_for_sorting=None):
+                                source_column_for_sorting=None, use_partition_switch=False, priority=0):
     """Generate SQL for HS control table updates"""
-    # Use empty string for prescript/postscript if they're None
-    prescript_sql = "''" if not prescript else f"'{prescript}'"
-    postscript_sql = "''" if not postscript else f"'{postscript}'"
-    
-    # Handle use_source_column values
-    use_source_column_value = 1 if use_source_column_for_valid_dates else 0
-    source_column_sql = f"'{source_column_for_valid_from_date}'" if source_column_for_valid_from_date else "NULL"
-    
-    # Handle sorting column if provided
-    sorting_column_clause = ""
-    if source_column_for_sorting:
-        sorting_column_clause = f"\n    source_column_for_sorting = '{source_column_for_sorting}',"
-    
     # Special job name for Profisee source
     hs_job_name = "HS_Profisee_Daily" if source_system_initial and "Profisee_dev" in source_system_initial else "HS_Full_Daily"
     
@@ -135,6 +140,28 @@ def generate_hs_control_table_sql(table_suffix, source_system_initial, source_sy
         actual_src_table_name = f"ST_{src_table_name}" if tgt_schema_name_st == "ST" else src_table_name
         actual_tgt_table_name_hs = tgt_table_name_hs
     
+    # For Trunc Load with partition switch, the framework loads the shadow table and
+    # the postscript swaps it into the live table once the load has finished
+    if use_partition_switch and scd_type == "Trunc Load":
+        shadow_table_name, old_table_name = get_trunc_load_switch_table_names(actual_tgt_table_name_hs)
+        switch_procedure_name = get_trunc_load_switch_procedure_name(actual_tgt_table_name_hs)
+        prescript = "; ".join(filter(None, [prescript, f"TRUNCATE TABLE {tgt_schema_name_hs}.{old_table_name}"]))
+        postscript = "; ".join(filter(None, [f"EXEC {tgt_schema_name_hs}.{switch_procedure_name}", postscript]))
+        actual_tgt_table_name_hs = shadow_table_name
+    
+    # Use empty string for prescript/postscript if they're None
+    prescript_sql = "''" if not prescript else f"'{prescript}'"
+    postscript_sql = "''" if not postscript else f"'{postscript}'"
+    
+    # Handle use_source_column values
+    use_source_column_value = 1 if use_source_column_for_valid_dates else 0
+    source_column_sql = f"'{source_column_for_valid_from_date}'" if source_column_for_valid_from_date else "NULL"
+    
+    # Handle sorting column if provided
+    sorting_column_clause = ""
+    if source_column_for_sorting:
+        sorting_column_clause = f"\n    source_column_for_sorting = '{source_column_for_sorting}',"
+    
     return f"""-- Update temporary control table for historic stage to reflect daily load values
 UPDATE sandbox.temp_control_table_hs_{table_suffix}
 SET job_name = '{hs_job_name}',
@@ -149,7 +176,7 @@ SET job_name = '{hs_job_name}',
     scd_type = '{scd_type}',
     scd2_columns = '{scd2_columns}',
     skip = 0,
-    priority = 0,
+    priority = {priority},
     prescript = {prescript_sql},
     postscript = {postscript_sql},
     partitions = {partitions},
@@ -360,4 +387,231 @@ END
 -- After running this script, you can either:
 -- 1. Run the Stage job again with correct parameters to do the full initial load, or
 -- 2. Use ST_Placeholder as the job name to only run the HS part
-""" 
\ No newline at end of file
+""" 
+
+def get_trunc_load_switch_table_names(tgt_table_name_hs):
+    """Return the shadow and old table names used by the Trunc Load partition switch"""
+    return f"{tgt_table_name_hs}_SHADOW", f"{tgt_table_name_hs}_OLD"
+
+def get_trunc_load_switch_procedure_name(tgt_table_name_hs):
+    """Return the name of the procedure that switches the shadow table into the HS table"""
+    return f"usp_SwitchIn_{tgt_table_name_hs}"
+
+def generate_trunc_load_switch_sql(tgt_schema_name_hs, tgt_table_name_hs, primary_key="TC_ROW_ID", source_system=None, src_table_name=None):
+    """Generate SQL for the shadow tables and switch procedure used by Trunc Load with partition switch"""
+    # Profisee tables always use the HS_PRO_[source_table_name] pattern
+    if source_system and "Profisee_dev" in source_system and src_table_name:
+        tgt_table_name_hs = f"HS_PRO_{src_table_name}"
+    
+    shadow_table_name, old_table_name = get_trunc_load_switch_table_names(tgt_table_name_hs)
+    switch_procedure_name = get_trunc_load_switch_procedure_name(tgt_table_name_hs)
+    
+    return f"""-- Trunc Load with partition switch
+-- The framework truncates and loads {tgt_schema_name_hs}.{shadow_table_name} while readers keep using {tgt_schema_name_hs}.{tgt_table_name_hs}.
+-- The HS control table postscript then swaps the loaded data in as a metadata-only operation.
+-- Run this after the HS table has been created. Any later change to the HS table structure must be applied to both tables below.
+
+-- Create the shadow table the load writes into, with the same structure and clustered key as the HS table
+IF OBJECT_ID('{tgt_schema_name_hs}.{shadow_table_name}') IS NULL
+BEGIN
+    SELECT * INTO {tgt_schema_name_hs}.{shadow_table_name} FROM {tgt_schema_name_hs}.{tgt_table_name_hs} WHERE 1 = 0;
+    ALTER TABLE {tgt_schema_name_hs}.{shadow_table_name} ADD PRIMARY KEY CLUSTERED ({primary_key});
+END
+GO
+
+-- Create the empty table the previous data is switched out to
+IF OBJECT_ID('{tgt_schema_name_hs}.{old_table_name}') IS NULL
+BEGIN
+    SELECT * INTO {tgt_schema_name_hs}.{old_table_name} FROM {tgt_schema_name_hs}.{tgt_table_name_hs} WHERE 1 = 0;
+    ALTER TABLE {tgt_schema_name_hs}.{old_table_name} ADD PRIMARY KEY CLUSTERED ({primary_key});
+END
+GO
+
+-- Swap the loaded shadow table into the HS table, called from the HS control table postscript
+CREATE OR ALTER PROCEDURE {tgt_schema_name_hs}.{switch_procedure_name}
+AS
+BEGIN
+    SET NOCOUNT ON;
+    SET XACT_ABORT ON;
+
+    BEGIN TRANSACTION;
+        TRUNCATE TABLE {tgt_schema_name_hs}.{old_table_name};
+        ALTER TABLE {tgt_schema_name_hs}.{tgt_table_name_hs} SWITCH TO {tgt_schema_name_hs}.{old_table_name};
+        ALTER TABLE {tgt_schema_name_hs}.{shadow_table_name} SWITCH TO {tgt_schema_name_hs}.{tgt_table_name_hs};
+    COMMIT TRANSACTION;
+
+    -- Release the previous data outside of the swap transaction
+    TRUNCATE TABLE {tgt_schema_name_hs}.{old_table_name};
+END
+GO
+"""
+
+
+def split_business_key(business_key):
+    """Split a comma-separated business key into its column names"""
+    return [column.strip() for column in (business_key or "").split(",") if column.strip()]
+
+def generate_hard_delete_batch_sql(src_schema_name, src_table_name, tgt_schema_name_hs, tgt_table_name_hs,
+                                   business_key, batch_size=50000, hard_delete_action="Flag", source_system=None):
+    """Generate SQL for batched HARD delete reconciliation of the HS table"""
+    # Profisee tables always use the HS_PRO_[source_table_name] pattern
+    if source_system and "Profisee_dev" in source_system and src_table_name:
+        tgt_table_name_hs = f"HS_PRO_{src_table_name}"
+    
+    business_key_columns = split_business_key(business_key)
+    if not business_key_columns:
+        return """-- Error: Business key is missing.
+-- Please provide the business key to generate the batched hard delete script."""
+    
+    index_name = f"IX_{tgt_table_name_hs}_BK"
+    index_columns = ", ".join(business_key_columns)
+    join_condition = "\n          AND ".join(f"src.{column} = tgt.{column}" for column in business_key_columns)
+    
+    if hard_delete_action == "Delete":
+        # Deleting removes the full history of a business key, so the index covers all rows
+        index_sql = f"CREATE NONCLUSTERED INDEX {index_name} ON {tgt_schema_name_hs}.{tgt_table_name_hs} ({index_columns});"
+        batch_sql = f"""    DELETE TOP (@batch_size) tgt
+    FROM {tgt_schema_name_hs}.{tgt_table_name_hs} AS tgt
+    WHERE NOT EXISTS (
+        SELECT 1 FROM {src_schema_name}.{src_table_name} AS src
+        WHERE {join_condition}
+    );"""
+        description = "Deletes all HS rows"
+    else:
+        # Flagging only touches the current rows, so a filtered index keeps the index small
+        index_sql = f"CREATE NONCLUSTERED INDEX {index_name} ON {tgt_schema_name_hs}.{tgt_table_name_hs} ({index_columns}) INCLUDE (TC_DELETED_FLAG) WHERE TC_CURRENT_FLAG = 'Y';"
+        batch_sql = f"""    UPDATE TOP (@batch_size) tgt
+    SET TC_DELETED_FLAG = 'Y',
+        TC_DELETED_DATETIME = SYSUTCDATETIME()
+    FROM {tgt_schema_name_hs}.{tgt_table_name_hs} AS tgt
+    WHERE tgt.TC_CURRENT_FLAG = 'Y'
+      AND ISNULL(tgt.TC_DELETED_FLAG, 'N') <> 'Y'
+      AND NOT EXISTS (
+        SELECT 1 FROM {src_schema_name}.{src_table_name} AS src
+        WHERE {join_condition}
+    );"""
+        description = "Flags the current HS rows"
+    
+    return f"""-- Batched HARD delete reconciliation for {tgt_schema_name_hs}.{tgt_table_name_hs}
+-- {description} whose business key no longer exists in {src_schema_name}.{src_table_name},
+-- {batch_size} rows at a time. Each batch commits on its own, so the transaction log can be reused between batches.
+
+-- Supporting index on the business key
+IF NOT EXISTS (SELECT 1 FROM sys.indexes WHERE name = '{index_name}' AND object_id = OBJECT_ID('{tgt_schema_name_hs}.{tgt_table_name_hs}'))
+    {index_sql}
+GO
+
+DECLARE @batch_size INT = {batch_size};
+DECLARE @rows_affected INT = 1;
+
+WHILE @rows_affected > 0
+BEGIN
+{batch_sql}
+    SET @rows_affected = @@ROWCOUNT;
+END
+GO
+"""
+
+
+def generate_ct_index_sql(src_schema_name, src_table_name_ct, business_key,
+                          source_column_for_sorting="header__change_seq", watermark_column="header__timestamp"):
+    """Generate SQL for the supporting indexes on a Replicate __ct table used by SCD2 from CT"""
+    business_key_columns = split_business_key(business_key)
+    if not business_key_columns:
+        return """-- Error: Business key is missing.
+-- Please provide the business key to generate the change table indexes."""
+    
+    sort_columns = business_key_columns + ([source_column_for_sorting] if source_column_for_sorting else [])
+    sort_index_name = f"IX_{src_table_name_ct}_BK_SORT"
+    watermark_index_name = f"IX_{src_table_name_ct}_WATERMARK"
+    
+    return f"""-- Supporting indexes for {src_schema_name}.{src_table_name_ct}
+-- Lets the daily SCD2 from CT load seek on the incremental filter and read changes in business key and change order, instead of sorting the whole change table
+
+-- Ordered index on the business key and change sequence
+IF NOT EXISTS (SELECT 1 FROM sys.indexes WHERE name = '{sort_index_name}' AND object_id = OBJECT_ID('{src_schema_name}.{src_table_name_ct}'))
+    CREATE NONCLUSTERED INDEX {sort_index_name} ON {src_schema_name}.{src_table_name_ct} ({", ".join(sort_columns)});
+GO
+
+-- Watermark index for the incremental filter
+IF NOT EXISTS (SELECT 1 FROM sys.indexes WHERE name = '{watermark_index_name}' AND object_id = OBJECT_ID('{src_schema_name}.{src_table_name_ct}'))
+    CREATE NONCLUSTERED INDEX {watermark_index_name} ON {src_schema_name}.{src_table_name_ct} ({watermark_column});
+GO
+"""
+
+
+def get_change_table_name(src_table_name_ct):
+    """Return the Replicate change table of a CDC table, also for the AllTransactions sources reading it by its base name"""
+    return src_table_name_ct if src_table_name_ct.endswith("__ct") else f"{src_table_name_ct}__ct"
+
+def get_ct_retention_procedure_name(src_table_name_ct):
+    """Return the name of the procedure that applies retention to a change table"""
+    return f"usp_CTRetention_{src_table_name_ct}"
+
+def generate_ct_retention_sql(src_schema_name, src_table_name_ct, tgt_table_name_st, tgt_table_name_hs, source_system_initial=None,
+                              source_system_daily=None, batch_size=50000, retention_margin_days=7, archive=False,
+                              watermark_column="header__timestamp"):
+    """Generate SQL for the change table retention procedure"""
+    # The watermark is the older of the last successful daily ST and HS loads of this table
+    st_daily_job = "ST_Profisee_Daily" if source_system_daily and "Profisee_dev" in source_system_daily else "ST_Full_Daily"
+    hs_daily_job = "HS_Profisee_Daily" if source_system_initial and "Profisee_dev" in source_system_initial else "HS_Full_Daily"
+    
+    procedure_name = get_ct_retention_procedure_name(src_table_name_ct)
+    archive_table_name = f"{src_table_name_ct}_archive"
+    
+    archive_table_sql = ""
+    output_clause = ""
+    if archive:
+        archive_table_sql = f"""-- Create the archive table the removed change rows are moved to
+IF OBJECT_ID('{src_schema_name}.{archive_table_name}') IS NULL
+    SELECT * INTO {src_schema_name}.{archive_table_name} FROM {src_schema_name}.{src_table_name_ct} WHERE 1 = 0;
+GO
+
+"""
+        output_clause = f"\n        OUTPUT DELETED.* INTO {src_schema_name}.{archive_table_name}"
+    
+    return f"""-- Change table retention for {src_schema_name}.{src_table_name_ct}
+-- Removes change rows older than the last successful daily ST and HS load of this table in DWH.JOB_TABLES_LOG
+-- (minus a safety margin),
+-- {batch_size} rows at a time, so the daily incremental filter keeps reading a small change table.
+-- Schedule the procedure with the CT retention pipeline, outside the daily load window.
+
+{archive_table_sql}CREATE OR ALTER PROCEDURE DWH.{procedure_name}
+    @batch_size INT = {batch_size},
+    @retention_margin_days INT = {retention_margin_days}
+AS
+BEGIN
+    SET NOCOUNT ON;
+
+    DECLARE @watermark DATETIME2(0);
+    DECLARE @rows_affected INT = 1;
+
+    -- Only remove rows that the daily ST and HS loads of this table have both already processed
+    SELECT @watermark = DATEADD(DAY, -@retention_margin_days, MIN(last_load_start))
+    FROM (
+        SELECT MAX(start_time) AS last_load_start
+        FROM DWH.JOB_TABLES_LOG
+        WHERE job_name = '{st_daily_job}' AND tgt_table_name = '{tgt_table_name_st}' AND status LIKE 'SUCCE%'
+        UNION ALL
+        SELECT MAX(start_time)
+        FROM DWH.JOB_TABLES_LOG
+        WHERE job_name = '{hs_daily_job}' AND tgt_table_name = '{tgt_table_name_hs}' AND status LIKE 'SUCCE%'
+    ) AS daily_loads
+    HAVING COUNT(last_load_start) = 2;
+
+    IF @watermark IS NULL
+    BEGIN
+        RAISERROR('No successful daily load found for {src_table_name_ct}, skipping retention.', 10, 1);
+        RETURN;
+    END
+
+    WHILE @rows_affected > 0
+    BEGIN
+        DELETE TOP (@batch_size)
+        FROM {src_schema_name}.{src_table_name_ct}{output_clause}
+        WHERE {watermark_column} < @watermark;
+        SET @rows_affected = @@ROWCOUNT;
+    END
+END
+GO
+"""
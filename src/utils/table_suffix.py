@@ -0,0 +1,50 @@
+import hashlib
+import itertools
+import os
+import re
+import secrets
+import threading
+from datetime import datetime
+
+# SQL Server identifier limit and the longest table name the suffix is appended to
+SQL_IDENTIFIER_MAX_LENGTH = 128
+LONGEST_SUFFIXED_TABLE_PREFIX = "CONTROL_TABLE_STAGE_backup_"
+
+_suffix_counter = itertools.count()
+_suffix_lock = threading.Lock()
+
+def to_base36(number, width):
+    """Return the last width base 36 digits of a non-negative number"""
+    digits = ""
+    for _ in range(width):
+        number, remainder = divmod(number, 36)
+        digits = "0123456789abcdefghijklmnopqrstuvwxyz"[remainder] + digits
+    return digits
+
+def allocate_table_suffix(user_initials="", timestamp=None):
+    """Return a table suffix that no other session, thread or process allocates
+
+    The suffix is the initials and timestamp followed by the process ID, a per-process counter and a random
+    part, so parallel generations in the same second never share sandbox table names.
+    """
+    with _suffix_lock:
+        count = next(_suffix_counter)
+    timestamp = timestamp or datetime.now().strftime("%Y%m%d_%H%M%S")
+    unique_part = f"{to_base36(os.getpid(), 4)}{to_base36(count, 3)}{secrets.token_hex(3)}"
+    return add_user_initials(f"{timestamp}_{unique_part}", user_initials)
+
+def get_table_key_suffix(table_key, user_initials=""):
+    """Return the same table suffix on every call for a table, such as "TIA.CUSTOMER", for generated exports"""
+    return add_user_initials(hashlib.sha256(table_key.encode("utf-8")).hexdigest()[:16], user_initials)
+
+def add_user_initials(table_suffix, user_initials):
+    """Prefix a table suffix with the user initials
+
+    Initials are reduced to letters, digits and underscores and shortened so every suffixed table name fits
+    SQL Server's identifier limit.
+    """
+    initials = re.sub(r"[^a-z0-9_]", "", (user_initials or "").lower())
+    max_initials_length = SQL_IDENTIFIER_MAX_LENGTH - len(LONGEST_SUFFIXED_TABLE_PREFIX) - len(table_suffix) - 1
+    if initials:
+        table_suffix = f"{initials[:max_initials_length]}_{table_suffix}"
+    return table_suffix
@@ -0,0 +1,63 @@
+import asyncio
+import json
+import pytest
+from src.utils.adf_client import AdfClient, deploy_pipelines
+
+class FakeTransport:
+    """Answer ADF requests from a list of (status, headers) responses per path, then with 200"""
+
+    def __init__(self, responses=None, delay=0):
+        self.responses = {path: list(statuses) for path, statuses in (responses or {}).items()}
+        self.delay = delay
+        self.requests = []
+        self.active = 0
+        self.max_active = 0
+
+    async def __call__(self, method, url, headers, body):
+        path = url.split("/factories/factory/")[1].split("?")[0]
+        self.requests.append((method, path))
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        await asyncio.sleep(self.delay)
+        self.active -= 1
+
+        if self.responses.get(path):
+            status, response_headers = self.responses[path].pop(0)
+            return status, response_headers, b"error"
+        if path.endswith("/createRun"):
+            return 200, {}, json.dumps({"runId": "run-1"}).encode()
+        return 200, {}, body or b""
+
+def make_client(transport, **options):
+    return AdfClient("subscription", "group", "factory", "token", transport=transport, backoff_seconds=0, **options)
+
+def make_pipelines(count):
+    return [{"name": f"pl_{index}", "properties": {"activities": []}} for index in range(count)]
+
+def test_throttled_and_transient_requests_are_retried():
+    transport = FakeTransport({
+        "pipelines/pl_0": [(429, {"Retry-After": "0"}), (503, {})],
+    })
+    results = deploy_pipelines(make_client(transport), make_pipelines(2))
+    assert [result["status"] for result in results] == ["SUCCESS", "SUCCESS"]
+    assert transport.requests.count(("PUT", "pipelines/pl_0")) == 3
+
+def test_retries_stop_after_max_retries():
+    transport = FakeTransport({"pipelines/pl_0": [(500, {})] * 3})
+    results = deploy_pipelines(make_client(transport, max_retries=2), make_pipelines(1))
+    assert results[0]["status"] == "FAILED"
+    assert "HTTP 500" in results[0]["error"]
+    assert len(transport.requests) == 3
+
+def test_create_run_is_only_retried_when_throttled():
+    transport = FakeTransport({"pipelines/pl_0/createRun": [(429, {}), (504, {})]})
+    client = make_client(transport)
+    with pytest.raises(Exception, match="HTTP 504"):
+        asyncio.run(client.create_run("pl_0"))
+    assert transport.requests == [("POST", "pipelines/pl_0/createRun")] * 2
+
+def test_concurrency_is_bounded():
+    transport = FakeTransport(delay=0.01)
+    results = deploy_pipelines(make_client(transport, max_concurrency=3), make_pipelines(20))
+    assert all(result["status"] == "SUCCESS" for result in results)
+    assert transport.max_active == 3
@@ -0,0 +1,57 @@
+import io
+from src.utils.bulk_onboarding import get_parameter_sets
+from src.utils.control_table_diff import diff_control_tables, generate_control_table_diff_sql
+from src.utils.control_table_import import (
+    REQUIRED_HS_COLUMNS, REQUIRED_ST_COLUMNS, read_control_table_export, reconstruct_table_parameters
+)
+from src.utils.manifest import read_manifest, write_manifest
+
+ST_EXPORT = b"""job_name,source_system,src_schema_name,src_table_name,tgt_schema_name,tgt_table_name,business_key,initial_load_valid_from_column,incremental_filter_column,incremental_filter_column_timezone,skip,priority,delete_type,src_delete_column,src_delete_value
+ST_Full_Initial,Replicate_Full,TIA,CUST,ST,ST_CUST,ID,__lowDate,__fullLoad,UTC,0,5,NULL,NULL,NULL
+ST_Full_Daily,Replicate_CDC,TIA,CUST__ct,ST,ST_CUST,ID,__lowDate,__fullLoad,UTC,0,5,NULL,NULL,NULL
+ST_Full_Initial,Replicate_Full,TIA,ORDERS,ST,ST_ORDERS,ORDER_ID,__lowDate,__fullLoad,UTC,0,0,SOFT,IS_DELETED,1
+ST_Full_Daily,Replicate_CDC,TIA,ORDERS__ct,ST,ST_ORDERS,ORDER_ID,__lowDate,__fullLoad,UTC,0,0,SOFT,IS_DELETED,1
+"""
+
+HS_EXPORT = b"""job_name,src_schema_name,src_table_name,tgt_schema_name,tgt_table_name,business_key,primary_key,incremental_filter_column,incremental_filter_column_timezone,scd_type,scd2_columns,skip,priority,prescript,postscript,partitions,use_source_column_for_valid_dates,source_column_for_valid_from_date,source_column_for_sorting
+HS_Full_Daily,ST,ST_CUST,HS,HS_CUST,ID,TC_ROW_ID,__fullLoad,UTC,SCD2,__allColumns,0,5,,,1,0,NULL,NULL
+HS_Full_Daily,ST,ST_ORDERS,HS,HS_ORDERS,ORDER_ID,TC_ROW_ID,__fullLoad,UTC,SCD2 from CT,__allColumns,0,0,,,1,0,NULL,NULL
+"""
+
+def read_snapshot(st_export=ST_EXPORT, hs_export=HS_EXPORT):
+    st_df = read_control_table_export("st.csv", st_export, REQUIRED_ST_COLUMNS)
+    hs_df = read_control_table_export("hs.csv", hs_export, REQUIRED_HS_COLUMNS)
+    return st_df, hs_df
+
+def import_configs(st_df, hs_df):
+    params_df, issues_df = reconstruct_table_parameters(st_df, hs_df)
+    assert issues_df.empty
+    manifest = io.StringIO()
+    write_manifest(get_parameter_sets(params_df), manifest)
+    return list(read_manifest(manifest.getvalue().splitlines()))
+
+def test_imported_snapshot_is_unchanged():
+    st_df, hs_df = read_snapshot()
+    summary_df, changes_df = diff_control_tables(import_configs(st_df, hs_df), st_df, hs_df)
+    assert summary_df["status"].tolist() == ["UNCHANGED", "UNCHANGED"]
+    assert changes_df.empty
+
+def test_hs_only_changes():
+    st_df, hs_df = read_snapshot()
+    configs = import_configs(st_df, hs_df)
+    hs_df.loc[hs_df["tgt_table_name"] == "HS_CUST", "partitions"] = "4"
+    _, changes_df = diff_control_tables(configs, st_df, hs_df)
+    assert set(changes_df["control_table"]) == {"CONTROL_TABLE_HS"}
+    sql = generate_control_table_diff_sql(changes_df)
+    assert "UPDATE DWH.CONTROL_TABLE_HS\nSET partitions = 1\nWHERE src_schema_name = 'ST' AND src_table_name IN ('ST_CUST');" in sql
+    assert "CONTROL_TABLE_STAGE" not in sql
+
+def test_st_only_changes():
+    st_df, hs_df = read_snapshot()
+    configs = import_configs(st_df, hs_df)
+    st_df.loc[st_df["tgt_table_name"] == "ST_ORDERS", "src_delete_value"] = "Y"
+    _, changes_df = diff_control_tables(configs, st_df, hs_df)
+    assert set(changes_df["control_table"]) == {"CONTROL_TABLE_STAGE"}
+    sql = generate_control_table_diff_sql(changes_df)
+    assert "SET src_delete_value = '1'" in sql
+    assert "CONTROL_TABLE_HS" not in sql
@@ -0,0 +1,73 @@
+import sqlite3
+from src.utils.deployment_dag import run_dag
+from src.utils.script_executor import ConnectionPool, execute_step, split_sql_batches
+
+def make_pool(tmp_path, size=2):
+    database = str(tmp_path / "deployment.db")
+    return ConnectionPool(lambda: sqlite3.connect(database, check_same_thread=False), size=size)
+
+def count_rows(pool, table):
+    with pool.connection() as conn:
+        return conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+def test_split_sql_batches():
+    script = "-- header\nCREATE TABLE a (x INT)\nGO\n\nINSERT INTO a VALUES (1)\nGO 2\n-- only a comment\nGO"
+    assert split_sql_batches(script) == ["-- header\nCREATE TABLE a (x INT)", "INSERT INTO a VALUES (1)", "INSERT INTO a VALUES (1)"]
+
+def test_steps_run_in_dependency_order(tmp_path):
+    pool = make_pool(tmp_path)
+    steps = [
+        {"name": "copy", "script": "INSERT INTO control_copy SELECT * FROM control", "inputs": ["control", "control_copy"], "outputs": ["copy done"]},
+        {"name": "control", "script": "CREATE TABLE control (x INT)\nGO\nINSERT INTO control VALUES (1)", "inputs": [], "outputs": ["control"]},
+        {"name": "control_copy", "script": "CREATE TABLE control_copy (x INT)", "inputs": [], "outputs": ["control_copy"]},
+        {"name": "pipeline", "script": None, "inputs": ["copy done"], "outputs": []},
+    ]
+
+    def run_step(step):
+        if step["script"] is None:
+            return {"step": step["name"], "status": "MANUAL"}
+        return execute_step(pool, step["name"], step["script"])
+
+    results = {result["step"]: result["status"] for result in run_dag(steps, run_step, max_workers=2)}
+    assert results == {"copy": "SUCCESS", "control": "SUCCESS", "control_copy": "SUCCESS", "pipeline": "MANUAL"}
+    assert count_rows(pool, "control_copy") == 1
+    pool.close()
+
+def test_failed_step_is_rolled_back_and_its_connection_closed(tmp_path):
+    pool = make_pool(tmp_path, size=1)
+    assert execute_step(pool, "create", "CREATE TABLE control (x INT)")["status"] == "SUCCESS"
+    with pool.connection() as conn:
+        used_connection = conn
+
+    result = execute_step(pool, "insert", "INSERT INTO control VALUES (1)\nGO\nINSERT INTO missing VALUES (1)")
+    assert result["status"] == "FAILED"
+    assert "missing" in result["error"]
+    assert count_rows(pool, "control") == 0
+    with pool.connection() as conn:
+        assert conn is not used_connection
+    pool.close()
+
+def test_autocommit_is_restored_after_the_step():
+    class Connection:
+        autocommit = False
+        executed_with = []
+
+        def cursor(self):
+            connection = self
+
+            class Cursor:
+                def execute(self, batch):
+                    connection.executed_with.append(connection.autocommit)
+
+                def close(self):
+                    pass
+            return Cursor()
+
+        def commit(self):
+            pass
+
+    pool = ConnectionPool(Connection, size=1)
+    assert execute_step(pool, "deletes", "DELETE 1\nGO\nDELETE 2", autocommit=True)["status"] == "SUCCESS"
+    with pool.connection() as conn:
+        assert conn.executed_with == [True, True]
+        assert conn.autocommit is False